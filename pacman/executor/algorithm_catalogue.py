@@ -0,0 +1,233 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" A cache of the algorithms described by XML files and found by scanning\
+    packages, so that the files are parsed and the packages imported only\
+    when they change.
+"""
+
+from collections import OrderedDict
+import logging
+import os
+import pickle
+import pkgutil
+import sys
+from threading import RLock
+from six import string_types
+from pacman import __version__
+try:
+    from importlib.machinery import all_suffixes
+    _MODULE_SUFFIXES = tuple(all_suffixes())
+except ImportError:
+    # Python 2.7 hack
+    import imp
+    _MODULE_SUFFIXES = tuple(suffix for suffix, _, _ in imp.get_suffixes())
+try:
+    from importlib.util import find_spec
+except ImportError:
+    # Python 2.7 hack
+    find_spec = None
+from .algorithm_decorators import scan_packages
+from .algorithm_metadata_xml_reader import AlgorithmMetadataXmlReader
+
+logger = logging.getLogger(__name__)
+
+#: The version of the format of the cache files
+CATALOGUE_VERSION = 1
+
+#: The largest number of catalogues kept in a cache file
+MAX_CATALOGUES = 16
+
+# OrderedDict of key -> algorithms, of the catalogues read in this process
+_catalogues = OrderedDict()
+
+# A lock of the catalogues
+_catalogue_lock = RLock()
+
+
+def _stat(path):
+    stat = os.stat(path)
+    return (os.path.abspath(path), stat.st_mtime, stat.st_size)
+
+
+def _find_package_paths(name):
+    """ Find the directories of a package given by dotted name, without\
+        importing any more of it than its ancestors
+
+    :return: The directories, or None if the package can't be found or is\
+        a module
+    :rtype: list(str) or None
+    """
+    if find_spec is not None:
+        try:
+            spec = find_spec(name)
+        except (ImportError, ValueError):
+            return None
+        return None if spec is None else spec.submodule_search_locations
+
+    try:
+        loader = pkgutil.find_loader(name)
+    except ImportError:
+        return None
+    if loader is None:
+        return None
+    filename = getattr(loader, "filename", None)
+    if filename is None:
+        filename = loader.get_filename()
+    if os.path.isdir(filename):
+        return [filename]
+    if os.path.basename(filename).startswith("__init__."):
+        return [os.path.dirname(filename)]
+    return None
+
+
+def _replace_file(source, target):
+    """ Move a file over another, replacing it if it exists
+    """
+    if hasattr(os, "replace"):
+        os.replace(source, target)
+    else:
+        # Python 2.7 hack; rename won't replace a file on Windows
+        if os.name == "nt" and os.path.exists(target):
+            os.remove(target)
+        os.rename(source, target)
+
+
+def _package_key(package):
+    """ Get the name, version and module files of a package, without\
+        importing any more of it than its ancestors
+    """
+    if isinstance(package, string_types):
+        name = package
+        paths = _find_package_paths(package)
+    else:
+        name = package.__name__
+        paths = getattr(package, "__path__", None)
+        if paths is None:
+            paths = [os.path.dirname(package.__file__)]
+    top_level = sys.modules.get(name.split(".")[0])
+    version = getattr(top_level, "__version__", None)
+    if paths is None:
+        return (name, version, None)
+
+    files = list()
+    for path in paths:
+        for directory, directories, filenames in os.walk(path):
+            directories.sort()
+            files.extend(
+                _stat(os.path.join(directory, filename))
+                for filename in sorted(filenames)
+                if filename.endswith(_MODULE_SUFFIXES))
+    return (name, version, tuple(files))
+
+
+def _catalogue_key(xml_paths, packages):
+    """ Get a key that changes when the XML files, the package modules or\
+        the versions of the packages or Python change
+    """
+    return (
+        CATALOGUE_VERSION, __version__, sys.version,
+        tuple(_stat(xml_path) for xml_path in xml_paths),
+        tuple(_package_key(package) for package in packages))
+
+
+def _read_cache_file(cache_file):
+    """ Read the catalogues in a cache file, or none if the file can't be\
+        read or isn't of this version
+
+    :rtype: ~collections.OrderedDict
+    """
+    # pylint: disable=broad-except
+    try:
+        with open(cache_file, "rb") as f:
+            version, catalogues = pickle.load(f)
+        if version == CATALOGUE_VERSION and isinstance(
+                catalogues, OrderedDict):
+            return catalogues
+    except (IOError, OSError):
+        pass
+    except Exception as ex:
+        logger.warning(
+            "Ignoring unreadable algorithm catalogue %s : %s",
+            cache_file, str(ex))
+    return OrderedDict()
+
+
+def _write_cache_file(cache_file, key, algorithms):
+    """ Add a catalogue to a cache file, dropping the oldest beyond\
+        :py:data:`MAX_CATALOGUES`
+    """
+    catalogues = _read_cache_file(cache_file)
+    catalogues.pop(key, None)
+    catalogues[key] = algorithms
+    while len(catalogues) > MAX_CATALOGUES:
+        catalogues.popitem(last=False)
+
+    # Write to another file and move it into place, so that readers never
+    # see part of a file
+    temp_file = "{}.{}.tmp".format(cache_file, os.getpid())
+    try:
+        with open(temp_file, "wb") as f:
+            pickle.dump((CATALOGUE_VERSION, catalogues), f,
+                        pickle.HIGHEST_PROTOCOL)
+        _replace_file(temp_file, cache_file)
+    except (IOError, OSError) as ex:
+        logger.warning(
+            "Failed to write algorithm catalogue %s : %s",
+            cache_file, str(ex))
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+
+
+def get_algorithm_catalogue(xml_paths, packages, cache_file=None):
+    """ Get the algorithms described by some XML files and found by\
+        scanning some packages, as read by\
+        :py:class:`AlgorithmMetadataXmlReader` and :py:func:`scan_packages`.
+
+    The algorithms are read again only if the XML files, the modules of the\
+    packages, or the version of PACMAN, the packages or Python have changed\
+    since they were last read in this process or, if a cache file is\
+    given, since they were written to the cache file.  The modules of the\
+    packages are therefore only imported when an algorithm in them is run.
+
+    :param xml_paths: paths to the XML files describing algorithms
+    :type xml_paths: list(str)
+    :param packages:\
+        The packages to scan (using dotted notation), or the actual package\
+        modules
+    :param cache_file:\
+        The file to keep the algorithms in between processes, or None to\
+        keep them only in this process
+    :type cache_file: str or None
+    :return: A dict of algorithm name -> algorithm data, which can be\
+        changed by the caller
+    :rtype: dict(str, ~pacman.executor.algorithm_classes.AbstractAlgorithm)
+    """
+    key = _catalogue_key(xml_paths, packages)
+    with _catalogue_lock:
+        algorithms = _catalogues.get(key)
+        if algorithms is None and cache_file is not None:
+            algorithms = _read_cache_file(cache_file).get(key)
+        if algorithms is None:
+            algorithms = AlgorithmMetadataXmlReader(
+                xml_paths).decode_algorithm_data_objects()
+            algorithms.update(scan_packages(packages))
+            if cache_file is not None:
+                _write_cache_file(cache_file, key, algorithms)
+        _catalogues.pop(key, None)
+        _catalogues[key] = algorithms
+        while len(_catalogues) > MAX_CATALOGUES:
+            _catalogues.popitem(last=False)
+        return dict(algorithms)
@@ -14,6 +14,8 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 from collections import defaultdict
+from itertools import count
+from weakref import WeakValueDictionary
 try:
     from inspect import getfullargspec
 except ImportError:
@@ -22,8 +24,21 @@ except ImportError:
 from functools import wraps
 from six import iteritems, itervalues
 # pylint: disable=deprecated-method
-_instances = list()
+# dict of class -> type name -> the method of the class to inject it with
 _methods = defaultdict(dict)
+# dict of class -> type name -> method, over the whole class hierarchy
+_class_injectors = dict()
+# dict of type name -> number -> object accepting the type, where objects are
+# numbered in the order they were created
+_injectees = defaultdict(WeakValueDictionary)
+# As _injectees, but for objects that can't be weakly referenced
+_strong_injectees = defaultdict(dict)
+# dict of id -> object, of objects in _injectees
+_registered = WeakValueDictionary()
+# dict of id -> object, of objects in _strong_injectees
+_strong_registered = dict()
+# The numbers of the objects
+_injectee_numbers = count()
 _injectables = None
 
 
@@ -35,20 +50,60 @@ class InjectionException(Exception):
 def supports_injection(injectable_class):
     """ Indicate that the class has methods on which objects can be injected.
     """
+    # pylint: disable=protected-access
     orig_init = injectable_class.__init__
+    for method in itervalues(injectable_class.__dict__):
+        if hasattr(method, "_type_to_inject"):
+            _methods[injectable_class][method._type_to_inject] = method
+    _class_injectors.clear()
 
     def new_init(self, *args, **kwargs):
-        # pylint: disable=protected-access
         orig_init(self, *args, **kwargs)
-        for method in itervalues(injectable_class.__dict__):
-            if hasattr(method, "_type_to_inject"):
-                _methods[injectable_class][method._type_to_inject] = method
-        _instances.append(self)
+        _register(self)
 
     injectable_class.__init__ = new_init
     return injectable_class
 
 
+def _injectors(cls):
+    """ Get the methods of a class that inject each type, looking through\
+        the whole class hierarchy only the first time
+
+    :rtype: dict(str, callable)
+    """
+    injectors = _class_injectors.get(cls)
+    if injectors is None:
+        injectors = dict()
+        for mro_cls in cls.__mro__:
+            injectors.update(_methods.get(mro_cls, {}))
+        _class_injectors[cls] = injectors
+    return injectors
+
+
+def _register(obj):
+    """ Remember an object under each type it can be injected with, unless\
+        it has been already (as when a subclass also supports injection).\
+        The object is forgotten when nothing else refers to it.
+    """
+    injectors = _injectors(obj.__class__)
+    if not injectors:
+        return
+    try:
+        if _registered.get(id(obj)) is obj:
+            return
+        _registered[id(obj)] = obj
+        injectees = _injectees
+    except TypeError:
+        # The object has __slots__ without __weakref__
+        if _strong_registered.get(id(obj)) is obj:
+            return
+        _strong_registered[id(obj)] = obj
+        injectees = _strong_injectees
+    number = next(_injectee_numbers)
+    for object_type in injectors:
+        injectees[object_type][number] = obj
+
+
 def inject(type_to_inject):
     """ Marks a method as something to be called to inject an object of the\
         given type.  The type is just a name for the type, and should match up\
@@ -83,10 +138,7 @@ def requires_injection(types_required):
 
         @wraps(wrapped_method)
         def wrapper(obj, *args, **kwargs):
-            methods = dict()
-            for cls in obj.__class__.__mro__:
-                cls_methods = _methods.get(cls, {})
-                methods.update(cls_methods)
+            methods = _injectors(obj.__class__)
             for object_type in types_required:
                 method = methods.get(object_type, None)
                 if method is None:
@@ -232,14 +284,19 @@ def do_injection(objects_to_inject, objects_to_inject_into=None):
         return
     injectees = objects_to_inject_into
     if objects_to_inject_into is None:
-        injectees = _instances
+        # Only visit the objects that accept one of the types, in the order
+        # they were created
+        numbered = dict()
+        for object_type in objects_to_inject:
+            for injectees_of_type in (
+                    _injectees.get(object_type), _strong_injectees.get(
+                        object_type)):
+                if injectees_of_type:
+                    numbered.update(injectees_of_type.items())
+        injectees = [numbered[number] for number in sorted(numbered)]
     for obj in injectees:
-        methods = dict()
-        for cls in obj.__class__.__mro__:
-            cls_methods = _methods.get(cls, {})
-            methods.update(cls_methods)
-        if methods is not None:
-            for object_type, object_to_inject in iteritems(objects_to_inject):
-                method = methods.get(object_type, None)
-                if method is not None:
-                    method(obj, object_to_inject)
+        methods = _injectors(obj.__class__)
+        for object_type, object_to_inject in iteritems(objects_to_inject):
+            method = methods.get(object_type, None)
+            if method is not None:
+                method(obj, object_to_inject)
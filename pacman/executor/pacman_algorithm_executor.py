@@ -21,9 +21,8 @@ from spinn_utilities.timer import Timer
 from pacman.exceptions import PacmanConfigurationException
 from pacman import operations
 from .injection_decorator import injection_context, do_injection
-from .algorithm_decorators import (
-    scan_packages, get_algorithms, Token)
-from .algorithm_metadata_xml_reader import AlgorithmMetadataXmlReader
+from .algorithm_decorators import get_algorithms, Token
+from .algorithm_catalogue import get_algorithm_catalogue
 from pacman.operations import algorithm_reports
 from pacman.utilities import file_format_converters
 from pacman.executor.token_states import TokenStates
@@ -85,7 +84,8 @@ class PACMANAlgorithmExecutor(object):
             do_timings=True, print_timings=False, do_immediate_injection=True,
             do_post_run_injection=False, inject_inputs=True,
             do_direct_injection=True, use_unscanned_annotated_algorithms=True,
-            provenance_path=None, provenance_name=None):
+            provenance_path=None, provenance_name=None,
+            algorithm_catalogue_file=None):
         """
         :param algorithms: A list of algorithms that must all be run
         :param optional_algorithms:\
@@ -129,6 +129,10 @@ class PACMANAlgorithmExecutor(object):
         :param provenance_path:\
             Path to file to append full provenance data to
             If None no provenance is written
+        :param algorithm_catalogue_file:\
+            Path to a file in which to keep the algorithms read from the XML\
+            files and packages between runs, so that they are only read\
+            again when they change; if None they are only kept in memory
         """
 
         # algorithm timing information
@@ -164,14 +168,15 @@ class PACMANAlgorithmExecutor(object):
         self._set_up_pacman_algorithm_listings(
             algorithms, optional_algorithms, xml_paths,
             packages, inputs, required_outputs,
-            use_unscanned_annotated_algorithms, tokens, required_output_tokens)
+            use_unscanned_annotated_algorithms, tokens, required_output_tokens,
+            algorithm_catalogue_file)
 
         self._provenance_path = provenance_path
 
     def _set_up_pacman_algorithm_listings(
             self, algorithms, optional_algorithms, xml_paths, packages, inputs,
             required_outputs, use_unscanned_algorithms, tokens,
-            required_output_tokens):
+            required_output_tokens, algorithm_catalogue_file=None):
         """ Translates the algorithm string and uses the config XML to create\
             algorithm objects
 
@@ -192,6 +197,9 @@ class PACMANAlgorithmExecutor(object):
         :param required_output_tokens:\
             A list of tokens that should be generated by the end of the run\
             as a list of strings
+        :param algorithm_catalogue_file:\
+            Path to a file in which to keep the algorithms between runs, or\
+            None
         """
 
         # deduce if the algorithms are internal or external
@@ -213,19 +221,17 @@ class PACMANAlgorithmExecutor(object):
         copy_of_xml_paths.append(operations.algorithms_metdata_file)
         copy_of_xml_paths.append(algorithm_reports.reports_metadata_file)
 
-        # decode the algorithms specs
-        xml_decoder = AlgorithmMetadataXmlReader(copy_of_xml_paths)
-        algorithm_data_objects = xml_decoder.decode_algorithm_data_objects()
+        # decode the algorithms specs and scan for annotated algorithms,
+        # unless they are unchanged since they were last read
         converter_xml_path = \
             file_format_converters.converter_algorithms_metadata_file
-        converter_decoder = AlgorithmMetadataXmlReader([converter_xml_path])
-        converters = converter_decoder.decode_algorithm_data_objects()
-
-        # Scan for annotated algorithms
+        converters = get_algorithm_catalogue(
+            [converter_xml_path], [file_format_converters],
+            algorithm_catalogue_file)
         copy_of_packages.append(operations)
         copy_of_packages.append(algorithm_reports)
-        converters.update(scan_packages([file_format_converters]))
-        algorithm_data_objects.update(scan_packages(copy_of_packages))
+        algorithm_data_objects = get_algorithm_catalogue(
+            copy_of_xml_paths, copy_of_packages, algorithm_catalogue_file)
         if use_unscanned_algorithms:
             algorithm_data_objects.update(get_algorithms())
 
@@ -70,6 +70,18 @@ class AbstractOutgoingEdgePartition(object):
             edges already in the partition
         """
 
+    def add_edges(self, edges):
+        """ Add a collection of edges to the outgoing edge partition.
+
+        :param edges: the edges to add
+        :type edges: iterable(:py:class:`pacman.model.graphs.AbstractEdge`)
+        :raises pacman.exceptions.PacmanInvalidParameterException:\
+            If the starting vertex of any edge does not match that of the\
+            edges already in the partition
+        """
+        for edge in edges:
+            self.add_edge(edge)
+
     @abstractproperty
     def identifier(self):
         """ The identifier of this outgoing edge partition.
@@ -98,6 +98,18 @@ class GraphMapper(object):
             machine_edge)
         self._application_edge_by_machine_edge[machine_edge] = application_edge
 
+    def add_edge_mappings(self, machine_edges, application_edge):
+        """ Add a mapping between several machine edges and the application\
+            edge they were all made from
+
+        :param machine_edges: Edges from a Machine Graph
+        :param application_edge: An edge from an Application Graph
+        """
+        self._machine_edges_by_application_edge[application_edge].update(
+            machine_edges)
+        self._application_edge_by_machine_edge.update(
+            dict.fromkeys(machine_edges, application_edge))
+
     def get_machine_vertices(self, application_vertex):
         """ Get all machine vertices mapped to a given application vertex
 
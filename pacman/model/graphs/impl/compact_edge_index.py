@@ -0,0 +1,128 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from array import array
+import numpy
+
+
+class CompactEdgeIndex(object):
+    """ An index of the edges of a graph by the vertices at their ends,\
+        which keeps the vertices of each edge as integers in arrays rather\
+        than keeping a collection of edges for each vertex.  The edges at\
+        a vertex are found from these arrays when asked for.
+    """
+
+    __slots__ = [
+        # The index of each vertex at the end of an edge
+        "_vertex_index",
+        # The index of each partition name used by an edge
+        "_name_index",
+        # The edges, in the order they were added
+        "_edges",
+        # The index of the pre-vertex of each edge
+        "_pre_vertices",
+        # The index of the post-vertex of each edge
+        "_post_vertices",
+        # The index of the partition name of each edge
+        "_names",
+        # The edges sorted by pre-vertex, or None if not yet sorted
+        "_by_pre_vertex",
+        # The edges sorted by post-vertex, or None if not yet sorted
+        "_by_post_vertex"
+    ]
+
+    def __init__(self):
+        self._vertex_index = dict()
+        self._name_index = dict()
+        self._edges = list()
+        self._pre_vertices = array("i")
+        self._post_vertices = array("i")
+        self._names = array("i")
+        self._by_pre_vertex = None
+        self._by_post_vertex = None
+
+    @staticmethod
+    def _get_index(indices, key):
+        index = indices.get(key)
+        if index is None:
+            index = len(indices)
+            indices[key] = index
+        return index
+
+    def add_edges(self, edges, partition_name):
+        """ Add edges to the index.
+
+        :param edges: The edges to add, none of which are already indexed
+        :param partition_name: The name of the partition of the edges
+        """
+        name = self._get_index(self._name_index, partition_name)
+        for edge in edges:
+            self._edges.append(edge)
+            self._pre_vertices.append(
+                self._get_index(self._vertex_index, edge.pre_vertex))
+            self._post_vertices.append(
+                self._get_index(self._vertex_index, edge.post_vertex))
+            self._names.append(name)
+        self._by_pre_vertex = None
+        self._by_post_vertex = None
+
+    def _sort(self, vertices):
+        """ Sort the edges by the given vertex indices, keeping edges at the\
+            same vertex in the order they were added
+
+        :return: The order of the edges, and the offset into that order of\
+            the edges of each vertex
+        """
+        vertices = numpy.array(vertices, dtype="int32")
+        order = numpy.argsort(vertices, kind="mergesort").astype("uint32")
+        offsets = numpy.zeros(len(self._vertex_index) + 1, dtype="uint32")
+        offsets[1:] = numpy.cumsum(
+            numpy.bincount(vertices, minlength=len(self._vertex_index)))
+        return order, offsets
+
+    def _positions(self, by_vertex, vertex):
+        index = self._vertex_index.get(vertex)
+        if index is None:
+            return []
+        order, offsets = by_vertex
+        return order[offsets[index]:offsets[index + 1]].tolist()
+
+    def edges_starting_at_vertex(self, vertex):
+        """ Get the edges that start at a vertex, in the order added
+
+        :param vertex: The vertex at the start of the edges
+        :rtype: list(:py:class:`pacman.model.graphs.AbstractEdge`)
+        """
+        if self._by_pre_vertex is None:
+            self._by_pre_vertex = self._sort(self._pre_vertices)
+        return [self._edges[i]
+                for i in self._positions(self._by_pre_vertex, vertex)]
+
+    def edges_ending_at_vertex(self, vertex, partition_name=None):
+        """ Get the edges that end at a vertex, in the order added
+
+        :param vertex: The vertex at the end of the edges
+        :param partition_name:\
+            The name of the partition the edges must be in, or None for\
+            edges in any partition
+        :rtype: list(:py:class:`pacman.model.graphs.AbstractEdge`)
+        """
+        if self._by_post_vertex is None:
+            self._by_post_vertex = self._sort(self._post_vertices)
+        positions = self._positions(self._by_post_vertex, vertex)
+        if partition_name is not None:
+            name = self._name_index.get(partition_name)
+            positions = [i for i in positions if self._names[i] == name]
+        return [self._edges[i] for i in positions]
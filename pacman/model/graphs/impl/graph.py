@@ -14,6 +14,8 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 from collections import OrderedDict
+from itertools import groupby
+from operator import attrgetter
 from spinn_utilities.overrides import overrides
 from spinn_utilities.ordered_default_dict import DefaultOrderedDict
 from spinn_utilities.ordered_set import OrderedSet
@@ -21,6 +23,7 @@ from pacman.exceptions import (
     PacmanAlreadyExistsException, PacmanInvalidParameterException)
 from pacman.model.graphs import AbstractGraph
 from pacman.model.graphs.common import ConstrainedObject
+from .compact_edge_index import CompactEdgeIndex
 from .outgoing_edge_partition import OutgoingEdgePartition
 
 
@@ -57,10 +60,13 @@ class Graph(ConstrainedObject, AbstractGraph):
         "_vertex_by_label",
         # count of vertex which had a None or already used label
         "_none_labelled_vertex_count",
+        # The index of edges by vertex in compact mode, or None when the
+        # edges are indexed by the ordered collections above
+        "_compact_edges",
     ]
 
     def __init__(self, allowed_vertex_types, allowed_edge_types,
-                 allowed_partition_types, label):
+                 allowed_partition_types, label, compact=False):
         """
         :param allowed_vertex_types:\
             A single or tuple of types of vertex to be allowed in the graph
@@ -69,6 +75,13 @@ class Graph(ConstrainedObject, AbstractGraph):
         :param allowed_partition_types:\
             A single or tuple of types of partitions to be allowed in the graph
         :param label: The label on the graph, or None
+        :param compact:\
+            If True, the edges at each vertex are kept as arrays of vertex\
+            indices and are only collected when asked for.  This uses much\
+            less memory for each edge, but asking for the edges at a vertex\
+            after adding more edges is slower, so it suits large graphs that\
+            are built and then queried.
+        :type compact: bool
         """
         super(Graph, self).__init__(None)
         self._allowed_vertex_types = allowed_vertex_types
@@ -86,6 +99,7 @@ class Graph(ConstrainedObject, AbstractGraph):
             DefaultOrderedDict(OrderedSet)
         self._outgoing_edge_partition_by_edge = OrderedDict()
         self._label = label
+        self._compact_edges = CompactEdgeIndex() if compact else None
 
     @property
     @overrides(AbstractGraph.label)
@@ -116,7 +130,62 @@ class Graph(ConstrainedObject, AbstractGraph):
 
     @overrides(AbstractGraph.add_edge)
     def add_edge(self, edge, outgoing_edge_partition_name):
-        # verify that the edge is one suitable for this graph
+        if self._compact_edges is not None:
+            self.add_edges([edge], outgoing_edge_partition_name)
+            return
+        self._check_edge(edge)
+
+        # Add the edge to the partition
+        partition = self._get_partition(
+            edge.pre_vertex, outgoing_edge_partition_name)
+        partition.add_edge(edge)
+        self._add_edge_to_indices(
+            edge, outgoing_edge_partition_name, partition)
+
+    @overrides(AbstractGraph.add_edges)
+    def add_edges(self, edges, outgoing_edge_partition_name):
+        # Edges are handled in runs which start at the same vertex, so that
+        # the pre-vertex and partition are only dealt with once per run
+        known = self._vertex_by_label
+        allowed = self._allowed_edge_types
+        incoming = self._incoming_edges
+        incoming_by_name = self._incoming_edges_by_partition_name
+        for pre_vertex, run in groupby(edges, attrgetter("pre_vertex")):
+            run = list(run)
+            if pre_vertex.label not in known:
+                self._check_edge(run[0])
+            for edge in run:
+                if (not isinstance(edge, allowed) or
+                        edge.post_vertex.label not in known):
+                    self._check_edge(edge)
+
+            # Add the edges to the partition
+            partition = self._get_partition(
+                pre_vertex, outgoing_edge_partition_name)
+            if self._compact_edges is not None:
+                # The partition ignores edges that it already has, so the
+                # index must too
+                run = [edge for edge in OrderedDict.fromkeys(run)
+                       if edge not in partition.edges]
+                partition.add_edges(run)
+                self._compact_edges.add_edges(
+                    run, outgoing_edge_partition_name)
+                continue
+            partition.add_edges(run)
+
+            # Add the edges to the indices
+            self._outgoing_edges[pre_vertex].update(run)
+            for edge in run:
+                post_vertex = edge.post_vertex
+                incoming_by_name[
+                    post_vertex, outgoing_edge_partition_name].append(edge)
+                incoming[post_vertex].add(edge)
+            self._outgoing_edge_partition_by_edge.update(
+                (edge, partition) for edge in run)
+
+    def _check_edge(self, edge):
+        """ Verify that the edge is one suitable for this graph
+        """
         if not isinstance(edge, self._allowed_edge_types):
             raise PacmanInvalidParameterException(
                 "edge", edge.__class__,
@@ -130,22 +199,25 @@ class Graph(ConstrainedObject, AbstractGraph):
             raise PacmanInvalidParameterException(
                 "edge", edge.post_vertex, "post-vertex must be known in graph")
 
-        # Add the edge to the partition
-        partition = None
-        if ((edge.pre_vertex, outgoing_edge_partition_name) not in
-                self._outgoing_edge_partitions_by_name):
+    def _get_partition(self, pre_vertex, outgoing_edge_partition_name):
+        """ Get the partition of edges from the vertex with the given name,\
+            creating it if it doesn't exist yet
+        """
+        partition = self._outgoing_edge_partitions_by_name.get(
+            (pre_vertex, outgoing_edge_partition_name))
+        if partition is None:
             partition = OutgoingEdgePartition(
                 outgoing_edge_partition_name, self._allowed_edge_types)
-            self._outgoing_edge_partitions_by_pre_vertex[
-                edge.pre_vertex].add(partition)
+            self._outgoing_edge_partitions_by_pre_vertex[pre_vertex].add(
+                partition)
             self._outgoing_edge_partitions_by_name[
-                edge.pre_vertex, outgoing_edge_partition_name] = partition
-        else:
-            partition = self._outgoing_edge_partitions_by_name[
-                edge.pre_vertex, outgoing_edge_partition_name]
-        partition.add_edge(edge)
+                pre_vertex, outgoing_edge_partition_name] = partition
+        return partition
 
-        # Add the edge to the indices
+    def _add_edge_to_indices(
+            self, edge, outgoing_edge_partition_name, partition):
+        """ Add an edge which has been added to a partition to the indices
+        """
         self._outgoing_edges[edge.pre_vertex].add(edge)
         self._incoming_edges_by_partition_name[
             (edge.post_vertex, outgoing_edge_partition_name)].append(edge)
@@ -211,14 +283,24 @@ class Graph(ConstrainedObject, AbstractGraph):
 
     @overrides(AbstractGraph.get_outgoing_partition_for_edge)
     def get_outgoing_partition_for_edge(self, edge):
+        if self._compact_edges is not None:
+            for partition in self._outgoing_edge_partitions_by_pre_vertex[
+                    edge.pre_vertex]:
+                if edge in partition.edges:
+                    return partition
+            raise KeyError(edge)
         return self._outgoing_edge_partition_by_edge[edge]
 
     @overrides(AbstractGraph.get_edges_starting_at_vertex)
     def get_edges_starting_at_vertex(self, vertex):
+        if self._compact_edges is not None:
+            return self._compact_edges.edges_starting_at_vertex(vertex)
         return self._outgoing_edges[vertex]
 
     @overrides(AbstractGraph.get_edges_ending_at_vertex)
     def get_edges_ending_at_vertex(self, vertex):
+        if self._compact_edges is not None:
+            return self._compact_edges.edges_ending_at_vertex(vertex)
         if vertex not in self._incoming_edges:
             return []
         return self._incoming_edges[vertex]
@@ -226,6 +308,9 @@ class Graph(ConstrainedObject, AbstractGraph):
     @overrides(AbstractGraph.get_edges_ending_at_vertex_with_partition_name)
     def get_edges_ending_at_vertex_with_partition_name(
             self, vertex, partition_name):
+        if self._compact_edges is not None:
+            return self._compact_edges.edges_ending_at_vertex(
+                vertex, partition_name)
         key = (vertex, partition_name)
         if key not in self._incoming_edges_by_partition_name:
             return []
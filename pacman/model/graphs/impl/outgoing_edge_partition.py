@@ -98,6 +98,22 @@ class OutgoingEdgePartition(ConstrainedObject, AbstractOutgoingEdgePartition):
 
         self._edges.add(edge)
 
+    @overrides(AbstractOutgoingEdgePartition.add_edges)
+    def add_edges(self, edges):
+        edges = list(edges)
+        if not edges:
+            return
+
+        # The first edge fixes the pre vertex and traffic type if needed;
+        # any other edge that doesn't agree is reported by add_edge
+        self.add_edge(edges[0])
+        for edge in edges:
+            if (not isinstance(edge, self._allowed_edge_types) or
+                    edge.pre_vertex != self._pre_vertex or
+                    edge.traffic_type != self._traffic_type):
+                self.add_edge(edge)
+        self._edges.update(edges)
+
     @property
     @overrides(AbstractOutgoingEdgePartition.identifier)
     def identifier(self):
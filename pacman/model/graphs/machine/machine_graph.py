@@ -25,6 +25,16 @@ class MachineGraph(Graph):
 
     __slots__ = []
 
-    def __init__(self, label):
+    def __init__(self, label, compact=False):
+        """
+        :param label: The label on the graph, or None
+        :param compact:\
+            If True, keep the edges at each vertex in a compact form which\
+            uses much less memory, at the cost of collecting the edges at a\
+            vertex when asked for them; see\
+            :py:class:`pacman.model.graphs.impl.Graph`
+        :type compact: bool
+        """
         super(MachineGraph, self).__init__(
-            MachineVertex, MachineEdge, AbstractOutgoingEdgePartition, label)
+            MachineVertex, MachineEdge, AbstractOutgoingEdgePartition, label,
+            compact)
@@ -14,8 +14,12 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import numpy
+from six.moves import xrange
 from pacman.exceptions import PacmanConfigurationException
 
+# The bits of a key
+_32_BITS = 0xFFFFFFFF
+
 
 class BaseKeyAndMask(object):
     """ A Key and Mask to be used for routing.
@@ -97,15 +101,48 @@ class BaseKeyAndMask(object):
         :return: The number of keys
         :rtype: int
         """
-        # converts mask into array of bit representation
-        unwrapped_mask = numpy.unpackbits(
-            numpy.asarray([self._mask], dtype=">u4").view(dtype="uint8"))
+        # Each bit of the (32-bit) mask that is zero doubles the keys
+        return 2 ** (32 - bin(self._mask & _32_BITS).count("1"))
 
-        # how many zeros are in the bit representation array
-        zeros = numpy.where(unwrapped_mask == 0)[0]
+    def _zero_bit_runs(self):
+        """ Get the runs of zero bits in the mask, lowest first
 
-        # number of keys available from this mask size
-        return 2 ** len(zeros)
+        :return: The position of the lowest bit and the length of each run
+        :rtype: list(tuple(int, int))
+        """
+        runs = list()
+        position = 0
+        zeros = ~self._mask & _32_BITS
+        while zeros:
+            # Skip the ones below the run
+            skip = (zeros & -zeros).bit_length() - 1
+            zeros >>= skip
+            position += skip
+
+            # Count the trailing ones of zeros, i.e. the zeros of the mask
+            length = ((zeros ^ (zeros + 1)) >> 1).bit_length()
+            runs.append((position, length))
+            zeros >>= length
+            position += length
+        return runs
+
+    def _keys_of_values(self, values):
+        """ Get the keys of an array of values, where the bits of each\
+            value, lowest first, are placed into the zero bits of the mask,\
+            lowest first.
+
+        :param values: The values
+        :type values: ~numpy.ndarray(numpy.uint64)
+        :rtype: ~numpy.ndarray(numpy.uint64)
+        """
+        keys = numpy.full(len(values), self._base_key, dtype=numpy.uint64)
+        value_bit = 0
+        for position, length in self._zero_bit_runs():
+            keys |= (
+                (values >> numpy.uint64(value_bit)) &
+                numpy.uint64((1 << length) - 1)) << numpy.uint64(position)
+            value_bit += length
+        return keys
 
     def get_keys(self, key_array=None, offset=0, n_keys=None):
         """ Get the ordered list of keys that the combination allows
@@ -124,21 +161,15 @@ class BaseKeyAndMask(object):
             the array
         :rtype: tuple(array-like of int, int)
         """
-        # Get the position of the zeros in the mask - assume 32-bits
-        unwrapped_mask = numpy.unpackbits(
-            numpy.asarray([self._mask], dtype=">u4").view(dtype="uint8"))
-        zeros = numpy.where(unwrapped_mask == 0)[0]
-
         # If there are no zeros, there is only one key in the range, so
         # return that
-        if len(zeros) == 0:
+        max_n_keys = self.n_keys
+        if max_n_keys == 1:
             if key_array is None:
                 key_array = numpy.zeros(1, dtype=">u4")
             key_array[offset] = self._base_key
             return key_array, 1
 
-        # We now know how many values there are - 2^len(zeros)
-        max_n_keys = 2 ** len(zeros)
         if key_array is not None and len(key_array) < max_n_keys:
             max_n_keys = len(key_array)
         if n_keys is None or n_keys > max_n_keys:
@@ -146,19 +177,26 @@ class BaseKeyAndMask(object):
         if key_array is None:
             key_array = numpy.zeros(n_keys, dtype=">u4")
 
-        # Create a list of 2^len(zeros) keys
-        unwrapped_key = numpy.unpackbits(
-            numpy.asarray([self._base_key], dtype=">u4").view(dtype="uint8"))
-
-        # for each key, create its key with the idea of a neuron ID being
-        # continuous and live at an offset position from the bottom of
-        # the key
-        for value in range(n_keys):
-            key = numpy.copy(unwrapped_key)
-            unwrapped_value = numpy.unpackbits(
-                numpy.asarray([value], dtype=">u4")
-                     .view(dtype="uint8"))[-len(zeros):]
-            key[zeros] = unwrapped_value
-            key_array[value + offset] = \
-                numpy.packbits(key).view(dtype=">u4")[0].item()
+        # Compute all the keys at once, with a neuron ID being continuous
+        # and spread over the zero bits of the mask
+        keys = self._keys_of_values(numpy.arange(n_keys, dtype=numpy.uint64))
+        if not isinstance(key_array, numpy.ndarray):
+            keys = keys.tolist()
+        key_array[offset:offset + n_keys] = keys
         return key_array, n_keys
+
+    def get_key_chunks(self, chunk_size=65536):
+        """ Get the ordered keys that the combination allows a chunk at a\
+            time, so that the keys of a mask with many zero bits need not all\
+            be held in memory at once
+
+        :param chunk_size: The most keys in each chunk
+        :type chunk_size: int
+        :return: Arrays of the keys, in order
+        :rtype: iterable(~numpy.ndarray(numpy.uint32))
+        """
+        n_keys = self.n_keys
+        for start in xrange(0, n_keys, chunk_size):
+            yield self._keys_of_values(numpy.arange(
+                start, min(start + chunk_size, n_keys),
+                dtype=numpy.uint64)).astype(numpy.uint32)
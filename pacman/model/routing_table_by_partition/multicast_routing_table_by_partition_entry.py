@@ -13,6 +13,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from spinn_machine import Router
 from pacman.exceptions import PacmanInvalidParameterException
 
 
@@ -31,7 +32,11 @@ class MulticastRoutingTableByPartitionEntry(object):
         "_incoming_link",
 
         # the direction this entry came from
-        "_incoming_processor"
+        "_incoming_processor",
+
+        # the route of this entry as the bits used by the router, or None if
+        # not yet worked out
+        "_spinnaker_route"
     ]
 
     def __init__(self, out_going_links, outgoing_processors,
@@ -87,6 +92,7 @@ class MulticastRoutingTableByPartitionEntry(object):
             None if incoming_processor is None else int(incoming_processor))
         self._incoming_link = (
             None if incoming_link is None else int(incoming_link))
+        self._spinnaker_route = None
 
     @property
     def processor_ids(self):
@@ -104,6 +110,23 @@ class MulticastRoutingTableByPartitionEntry(object):
         """
         return self._out_going_links
 
+    @property
+    def spinnaker_route(self):
+        """ The route of the entry as the bits used by the router, with a\
+            bit set for each link followed by a bit set for each processor,\
+            as :py:attr:`spinn_machine.MulticastRoutingEntry.spinnaker_route`
+
+        :rtype: int
+        """
+        if self._spinnaker_route is None:
+            route = 0
+            for processor_id in self._out_going_processors:
+                route |= 1 << (Router.MAX_LINKS_PER_ROUTER + processor_id)
+            for link_id in self._out_going_links:
+                route |= 1 << link_id
+            self._spinnaker_route = route
+        return self._spinnaker_route
+
     @property
     def incoming_link(self):
         """ The source link for this path entry
@@ -13,13 +13,21 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from collections import OrderedDict
+from array import array
+from six.moves import zip
+from spinn_machine import MulticastRoutingEntry
 from pacman.exceptions import (
-    PacmanAlreadyExistsException, PacmanRoutingException)
+    PacmanAlreadyExistsException, PacmanInvalidParameterException,
+    PacmanRoutingException)
 
 
 class MulticastRoutingTable(object):
     """ Represents a routing table for a chip.
+
+    The entries are held as columns of keys, masks, routes and defaultable\
+    flags rather than as one object per entry; the entries are made into\
+    :py:class:`spinn_machine.MulticastRoutingEntry` objects only when asked\
+    for.
     """
 
     __slots__ = [
@@ -29,12 +37,30 @@ class MulticastRoutingTable(object):
         # The y-coordinate of the chip for which this is the routing tables
         "_y",
 
-        # An iterable of routing entries to add to the table
-        "_multicast_routing_entries",
+        # The routing keys of the entries, in the order they were added
+        # array(int)
+        "_keys",
+
+        # The masks of the entries
+        # array(int)
+        "_masks",
+
+        # The spinnaker routes of the entries
+        # array(int)
+        "_spinnaker_routes",
+
+        # 1 for each entry which is defaultable, 0 for the others
+        # array(int)
+        "_defaultables",
 
-        # dict of multicast routing entries.
-        # (key, mask) -> multicast_routing_entry
-        "_multicast_routing_entries_by_routing_entry_key",
+        # The key and mask of each entry, as key << 32 | mask
+        # set(int)
+        "_key_masks",
+
+        # The index of each entry by key << 32 | mask, or None if no entry
+        # has been looked up yet
+        # dict(int, int)
+        "_indices",
 
         # counter of how many entries in their multicast routing table are
         # defaultable
@@ -59,8 +85,12 @@ class MulticastRoutingTable(object):
         self._x = x
         self._y = y
         self._number_of_defaulted_routing_entries = 0
-        self._multicast_routing_entries = list()
-        self._multicast_routing_entries_by_routing_entry_key = OrderedDict()
+        self._keys = array("I")
+        self._masks = array("I")
+        self._spinnaker_routes = array("I")
+        self._defaultables = array("B")
+        self._key_masks = set()
+        self._indices = None
 
         if multicast_routing_entries is not None:
             for multicast_routing_entry in multicast_routing_entries:
@@ -76,22 +106,109 @@ class MulticastRoutingTable(object):
         :raise pacman.exceptions.PacmanAlreadyExistsException: If a routing\
             entry with the same key-mask combination already exists
         """
-        routing_entry_key = multicast_routing_entry.routing_entry_key
-        mask = multicast_routing_entry.mask
+        self.add_entry(
+            multicast_routing_entry.routing_entry_key,
+            multicast_routing_entry.mask,
+            multicast_routing_entry.spinnaker_route,
+            multicast_routing_entry.defaultable)
+
+    def add_entry(self, routing_entry_key, mask, spinnaker_route,
+                  defaultable=False):
+        """ Adds a routing entry to this table without making an object of it
 
-        tuple_key = (routing_entry_key, mask)
-        if tuple_key in self._multicast_routing_entries_by_routing_entry_key:
+        :param routing_entry_key: The routing key of the entry
+        :type routing_entry_key: int
+        :param mask: The mask of the entry
+        :type mask: int
+        :param spinnaker_route: \
+            The route of the entry, with a bit set for each link followed by\
+            a bit set for each processor, as\
+            :py:attr:`spinn_machine.MulticastRoutingEntry.spinnaker_route`
+        :type spinnaker_route: int
+        :param defaultable: Whether the entry is defaultable
+        :type defaultable: bool
+        :rtype: None
+        :raise pacman.exceptions.PacmanInvalidParameterException: If the key\
+            is changed when masked with the mask
+        :raise pacman.exceptions.PacmanAlreadyExistsException: If a routing\
+            entry with the same key-mask combination already exists
+        """
+        if (routing_entry_key & mask) != routing_entry_key:
+            raise PacmanInvalidParameterException(
+                "routing_entry_key and mask",
+                "{} and {}".format(routing_entry_key, mask),
+                "The key combo is changed when masked with the mask. This"
+                " is determined to be an error in the tool chain. Please "
+                "correct this and try again.")
+
+        key_mask = (routing_entry_key << 32) | mask
+        if key_mask in self._key_masks:
             raise PacmanAlreadyExistsException(
-                "Multicast_routing_entry", str(multicast_routing_entry))
+                "Multicast_routing_entry", str(MulticastRoutingEntry(
+                    routing_entry_key, mask, defaultable=defaultable,
+                    spinnaker_route=spinnaker_route)))
 
-        self._multicast_routing_entries_by_routing_entry_key[tuple_key] =\
-            multicast_routing_entry
-        self._multicast_routing_entries.append(multicast_routing_entry)
+        if self._indices is not None:
+            self._indices[key_mask] = len(self._keys)
+        self._key_masks.add(key_mask)
+        self._keys.append(routing_entry_key)
+        self._masks.append(mask)
+        self._spinnaker_routes.append(spinnaker_route)
+        self._defaultables.append(1 if defaultable else 0)
 
         # update default routed counter if required
-        if multicast_routing_entry.defaultable:
+        if defaultable:
             self._number_of_defaulted_routing_entries += 1
 
+    def add_entries(self, routing_entry_keys, masks, spinnaker_routes,
+                    defaultables):
+        """ Adds many routing entries to this table in one go, as if each\
+            were added in turn with :py:meth:`add_entry`
+
+        :param routing_entry_keys: The routing keys of the entries
+        :type routing_entry_keys: list(int)
+        :param masks: The masks of the entries
+        :type masks: list(int)
+        :param spinnaker_routes: The routes of the entries, as in\
+            :py:meth:`add_entry`
+        :type spinnaker_routes: list(int)
+        :param defaultables: Whether each entry is defaultable
+        :type defaultables: list(bool)
+        :rtype: None
+        :raise pacman.exceptions.PacmanInvalidParameterException: If any key\
+            is changed when masked with its mask
+        :raise pacman.exceptions.PacmanAlreadyExistsException: If a routing\
+            entry with the same key-mask combination already exists, or two\
+            of the entries have the same key-mask combination
+        """
+        key_masks = [(key << 32) | mask
+                     for key, mask in zip(routing_entry_keys, masks)]
+        new_key_masks = set(key_masks)
+        if (len(new_key_masks) != len(key_masks) or
+                not self._key_masks.isdisjoint(new_key_masks) or
+                any((key & mask) != key
+                    for key, mask in zip(routing_entry_keys, masks))):
+            # Add them in turn so that the problem entry is reported
+            for entry in zip(
+                    routing_entry_keys, masks, spinnaker_routes,
+                    defaultables):
+                self.add_entry(*entry)
+            return
+
+        if self._indices is not None:
+            self._indices.update(
+                (key_mask, index) for index, key_mask in enumerate(
+                    key_masks, len(self._keys)))
+        self._key_masks.update(new_key_masks)
+        self._keys.extend(routing_entry_keys)
+        self._masks.extend(masks)
+        self._spinnaker_routes.extend(spinnaker_routes)
+        n_defaultable = len(self._defaultables)
+        self._defaultables.extend(
+            1 if defaultable else 0 for defaultable in defaultables)
+        self._number_of_defaulted_routing_entries += sum(
+            self._defaultables[n_defaultable:])
+
     @property
     def x(self):
         """ The x-coordinate of the chip of this table
@@ -114,18 +231,55 @@ class MulticastRoutingTable(object):
     def multicast_routing_entries(self):
         """ The multicast routing entries in the table
 
-        :return: an iterable of multicast routing entries
+        :return: \
+            a sequence of multicast routing entries, made as they are used
         :rtype: iterable(:py:class:`spinn_machine.MulticastRoutingEntry`)
         :raise None: does not raise any known exceptions
         """
-        return self._multicast_routing_entries
+        return _MulticastRoutingEntries(self)
+
+    @property
+    def keys(self):
+        """ The routing keys of the entries in the table, in order.  This\
+            must not be modified.
+
+        :rtype: array(int)
+        """
+        return self._keys
+
+    @property
+    def masks(self):
+        """ The masks of the entries in the table, in order.  This must not\
+            be modified.
+
+        :rtype: array(int)
+        """
+        return self._masks
+
+    @property
+    def spinnaker_routes(self):
+        """ The spinnaker routes of the entries in the table, in order.  This\
+            must not be modified.
+
+        :rtype: array(int)
+        """
+        return self._spinnaker_routes
+
+    @property
+    def defaultables(self):
+        """ 1 for each entry in the table that is defaultable and 0 for each\
+            that is not, in order.  This must not be modified.
+
+        :rtype: array(int)
+        """
+        return self._defaultables
 
     @property
     def number_of_entries(self):
         """ The number of multi-cast routing entries there are in the\
             multicast routing table
         """
-        return len(self._multicast_routing_entries)
+        return len(self._keys)
 
     @property
     def number_of_defaultable_entries(self):
@@ -157,28 +311,113 @@ class MulticastRoutingTable(object):
                 " This is determined to be an error in the tool chain. Please "
                 "correct this and try again.".format(routing_entry_key, mask))
 
-        tuple_key = (routing_entry_key, mask)
-        if tuple_key in self._multicast_routing_entries_by_routing_entry_key:
-            return self._multicast_routing_entries_by_routing_entry_key[
-                tuple_key]
-        return None
+        # Only index the entries once they are looked up
+        if self._indices is None:
+            self._indices = {
+                (key << 32) | mask: i
+                for i, (key, mask) in enumerate(zip(self._keys, self._masks))}
+
+        index = self._indices.get((routing_entry_key << 32) | mask)
+        if index is None:
+            return None
+        return self._entry(index)
+
+    def _entry(self, index):
+        return MulticastRoutingEntry(
+            self._keys[index], self._masks[index],
+            defaultable=bool(self._defaultables[index]),
+            spinnaker_route=self._spinnaker_routes[index])
 
     def __eq__(self, other):
         if not isinstance(other, MulticastRoutingTable):
             return False
         if self._x != other.x and self._y != other.y:
             return False
-        return self._multicast_routing_entries == \
-            other.multicast_routing_entries
+        return (self._keys == other.keys and self._masks == other.masks and
+                self._spinnaker_routes == other.spinnaker_routes and
+                self._defaultables == other.defaultables)
 
     def __ne__(self, other):
         return not self.__eq__(other)
 
     def __repr__(self):
         entry_string = ""
-        for entry in self._multicast_routing_entries:
+        for entry in self.multicast_routing_entries:
             entry_string += "{}\n".format(entry)
         return "{}:{}\n\n{}".format(self._x, self._y, entry_string)
 
     def __hash__(self):
         return id(self)
+
+    def __getstate__(self):
+        # Only the columns are sent; the rest is remade from them
+        return (self._x, self._y, self._keys, self._masks,
+                self._spinnaker_routes, self._defaultables)
+
+    def __setstate__(self, state):
+        (self._x, self._y, self._keys, self._masks, self._spinnaker_routes,
+         self._defaultables) = state
+        self._key_masks = set(
+            (key << 32) | mask for key, mask in zip(self._keys, self._masks))
+        self._indices = None
+        self._number_of_defaulted_routing_entries = sum(self._defaultables)
+
+
+class _MulticastRoutingEntries(object):
+    """ A read-only sequence of the entries of a routing table, which makes\
+        each entry as it is used.
+    """
+
+    __slots__ = [
+        # The table whose entries these are
+        "_table"
+    ]
+
+    def __init__(self, table):
+        """
+        :param table: The table whose entries these are
+        :type table: MulticastRoutingTable
+        """
+        self._table = table
+
+    def __len__(self):
+        return self._table.number_of_entries
+
+    def __getitem__(self, index):
+        # pylint: disable=protected-access
+        if isinstance(index, slice):
+            return [self._table._entry(i)
+                    for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("routing table entry index out of range")
+        return self._table._entry(index)
+
+    def __iter__(self):
+        table = self._table
+        for key, mask, spinnaker_route, defaultable in zip(
+                table.keys, table.masks, table.spinnaker_routes,
+                table.defaultables):
+            yield MulticastRoutingEntry(
+                key, mask, defaultable=bool(defaultable),
+                spinnaker_route=spinnaker_route)
+
+    def __eq__(self, other):
+        if isinstance(other, _MulticastRoutingEntries):
+            # pylint: disable=protected-access
+            return (self._table.keys == other._table.keys and
+                    self._table.masks == other._table.masks and
+                    self._table.spinnaker_routes ==
+                    other._table.spinnaker_routes and
+                    self._table.defaultables == other._table.defaultables)
+        try:
+            return list(self) == list(other)
+        except TypeError:
+            return False
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        return repr(list(self))
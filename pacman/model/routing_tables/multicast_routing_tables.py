@@ -13,12 +13,16 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import codecs
 import json
 import gzip
 from collections import OrderedDict
+import numpy
+from six.moves import zip
+from spinn_utilities.ordered_set import OrderedSet
 from pacman.exceptions import PacmanAlreadyExistsException
+from pacman.utilities.file_format_schemas import validate_items
 from .multicast_routing_table import MulticastRoutingTable
-from spinn_machine import MulticastRoutingEntry
 
 
 class MulticastRoutingTables(object):
@@ -26,7 +30,7 @@ class MulticastRoutingTables(object):
     """
 
     __slots__ = [
-        # set that holds routing tables
+        # set that holds routing tables, in the order they were added
         "_routing_tables",
         # dict of (x,y) -> routing table
         "_routing_tables_by_chip"
@@ -40,7 +44,7 @@ class MulticastRoutingTables(object):
         :raise pacman.exceptions.PacmanAlreadyExistsException: \
             If any two routing tables are for the same chip
         """
-        self._routing_tables = set()
+        self._routing_tables = OrderedSet()
         self._routing_tables_by_chip = dict()
 
         if routing_tables is not None:
@@ -74,7 +78,7 @@ class MulticastRoutingTables(object):
 
     @property
     def routing_tables(self):
-        """ The routing tables stored within
+        """ The routing tables stored within, in the order they were added
 
         :return: an iterable of routing tables
         :rtype: \
@@ -106,41 +110,342 @@ class MulticastRoutingTables(object):
         return iter(self._routing_tables)
 
 
+#: The number of bytes read from a JSON file at a time
+_JSON_READ_SIZE = 1 << 20
+
+
+def _open_json(file_path, mode):
+    """ Open a JSON file in binary mode, through gzip if its name ends .gz
+    """
+    if file_path.endswith(".gz"):
+        return gzip.open(file_path, mode)
+    return open(file_path, mode)
+
+
+def _table_to_json(routing_table):
+    json_routing_table = OrderedDict()
+    json_routing_table["x"] = routing_table.x
+    json_routing_table["y"] = routing_table.y
+    entries = []
+    for key, mask, defaultable, spinnaker_route in zip(
+            routing_table.keys, routing_table.masks,
+            routing_table.defaultables, routing_table.spinnaker_routes):
+        json_entry = OrderedDict()
+        json_entry["key"] = key
+        json_entry["mask"] = mask
+        json_entry["defaultable"] = bool(defaultable)
+        json_entry["spinnaker_route"] = spinnaker_route
+        entries.append(json_entry)
+    json_routing_table["entries"] = entries
+    return json_routing_table
+
+
+def _table_from_json(j_table):
+    table = MulticastRoutingTable(j_table["x"], j_table["y"])
+    j_entries = j_table["entries"]
+    table.add_entries(
+        [j_entry["key"] for j_entry in j_entries],
+        [j_entry["mask"] for j_entry in j_entries],
+        [j_entry["spinnaker_route"] for j_entry in j_entries],
+        [j_entry["defaultable"] for j_entry in j_entries])
+    return table
+
+
 def to_json(router_table):
-    json_list = []
-    for routing_table in router_table:
-        json_routing_table = OrderedDict()
-        json_routing_table["x"] = routing_table.x
-        json_routing_table["y"] = routing_table.y
-        entries = []
-        for entry in routing_table.multicast_routing_entries:
-            json_entry = OrderedDict()
-            json_entry["key"] = entry.routing_entry_key
-            json_entry["mask"] = entry.mask
-            json_entry["defaultable"] = entry.defaultable
-            json_entry["spinnaker_route"] = entry.spinnaker_route
-            entries.append(json_entry)
-        json_routing_table["entries"] = entries
-        json_list.append(json_routing_table)
-    return json_list
+    return [_table_to_json(routing_table) for routing_table in router_table]
 
 
 def from_json(j_router):
     if isinstance(j_router, str):
-        if j_router.endswith(".gz"):
-            with gzip.open(j_router) as j_file:
-                j_router = json.load(j_file)
-        else:
-            with open(j_router) as j_file:
-                j_router = json.load(j_file)
-
-    tables = MulticastRoutingTables()
-    for j_table in j_router:
-        table = MulticastRoutingTable(j_table["x"], j_table["y"])
-        tables.add_routing_table(table)
-        for j_entry in j_table["entries"]:
-            table.add_multicast_routing_entry(MulticastRoutingEntry(
-                j_entry["key"], j_entry["mask"],
-                defaultable=j_entry["defaultable"],
-                spinnaker_route=j_entry["spinnaker_route"]))
-    return tables
+        return MulticastRoutingTables(read_json(j_router, validate=False))
+
+    return MulticastRoutingTables(
+        _table_from_json(j_table) for j_table in j_router)
+
+
+def write_json(router_table, file_path, validate=True):
+    """ Write routing tables to a JSON file in the format of\
+        :py:func:`to_json`, one table at a time, so that only one table is\
+        held as JSON at once.
+
+    :param router_table: The routing tables to write
+    :type router_table: \
+        iterable(:py:class:`pacman.model.routing_tables.MulticastRoutingTable`)
+    :param file_path: \
+        The file to write; it is compressed with gzip if its name ends .gz
+    :type file_path: str
+    :param validate: \
+        True to check each table against the router.json schema before it\
+        is written
+    :type validate: bool
+    :raises ValidationError: If a table isn't valid
+    """
+    validate_table = validate_items("router.json") if validate else None
+    with _open_json(file_path, "wb") as j_file:
+        j_file.write(b"[")
+        separator = b""
+        for routing_table in router_table:
+            json_routing_table = _table_to_json(routing_table)
+            if validate_table is not None:
+                validate_table(json_routing_table)
+            j_file.write(separator)
+            j_file.write(json.dumps(json_routing_table).encode("ascii"))
+            separator = b", "
+        j_file.write(b"]")
+
+
+def read_json(file_path, validate=True):
+    """ Read routing tables from a JSON file in the format of\
+        :py:func:`to_json`, one table at a time, so that only one table is\
+        held as JSON at once.
+
+    :param file_path: \
+        The file to read; it is decompressed with gzip if its name ends .gz
+    :type file_path: str
+    :param validate: \
+        True to check each table against the router.json schema as it is read
+    :type validate: bool
+    :return: The routing tables, in the order they are in the file
+    :rtype: \
+        iterable(:py:class:`pacman.model.routing_tables.MulticastRoutingTable`)
+    :raises ValueError: If the file isn't a JSON array
+    :raises ValidationError: If a table isn't valid
+    """
+    validate_table = validate_items("router.json") if validate else None
+    with _open_json(file_path, "rb") as j_file:
+        for j_table in _JsonArrayReader(j_file):
+            if validate_table is not None:
+                validate_table(j_table)
+            yield _table_from_json(j_table)
+
+
+#: The magic number at the start of a binary routing tables file
+_BINARY_MAGIC = 0x54524D53
+#: The version of the binary routing tables format
+_BINARY_VERSION = 1
+#: Entry flag set if the entry is defaultable
+_FLAG_DEFAULTABLE = 1
+
+# The header of a binary file: the magic number, the version, the number of
+# tables and a reserved word
+_HEADER_DTYPE = numpy.dtype([
+    ("magic", "<u4"), ("version", "<u4"), ("n_tables", "<u4"),
+    ("reserved", "<u4")])
+
+# The index following the header: a record per table giving its chip, the
+# position of its first entry counted from the first entry in the file, and
+# its number of entries
+_INDEX_DTYPE = numpy.dtype([
+    ("x", "<u4"), ("y", "<u4"), ("first_entry", "<u4"),
+    ("n_entries", "<u4")])
+
+# The entries of every table in turn, following the index
+_ENTRY_DTYPE = numpy.dtype([
+    ("key", "<u4"), ("mask", "<u4"), ("spinnaker_route", "<u4"),
+    ("flags", "<u4")])
+
+
+def write_binary(router_table, file_path):
+    """ Write routing tables to a binary file of fixed size entries, from\
+        which each table can be read alone with :py:func:`read_binary_table`
+
+    The file is little endian and is made of a 16 byte header, a 16 byte\
+    record per table giving its chip and where its entries are, and then\
+    the 16 byte entries of every table (key, mask, route and flags).
+
+    :param router_table: The routing tables to write
+    :type router_table: \
+        iterable(:py:class:`pacman.model.routing_tables.MulticastRoutingTable`)
+    :param file_path: The file to write
+    :type file_path: str
+    """
+    routing_tables = list(router_table)
+    header = numpy.zeros(1, dtype=_HEADER_DTYPE)
+    header["magic"] = _BINARY_MAGIC
+    header["version"] = _BINARY_VERSION
+    header["n_tables"] = len(routing_tables)
+    index = numpy.zeros(len(routing_tables), dtype=_INDEX_DTYPE)
+    index["x"] = [routing_table.x for routing_table in routing_tables]
+    index["y"] = [routing_table.y for routing_table in routing_tables]
+    n_entries = [routing_table.number_of_entries
+                 for routing_table in routing_tables]
+    index["n_entries"] = n_entries
+    index["first_entry"] = numpy.cumsum([0] + n_entries[:-1])
+
+    with open(file_path, "wb") as b_file:
+        b_file.write(header.tobytes())
+        b_file.write(index.tobytes())
+        for routing_table in routing_tables:
+            entries = numpy.zeros(
+                routing_table.number_of_entries, dtype=_ENTRY_DTYPE)
+            entries["key"] = routing_table.keys
+            entries["mask"] = routing_table.masks
+            entries["spinnaker_route"] = routing_table.spinnaker_routes
+            entries["flags"] = routing_table.defaultables
+            b_file.write(entries.tobytes())
+
+
+def _map_binary(file_path):
+    """ Map a binary routing tables file into memory
+
+    :return: the index of the tables and the entries of all the tables
+    :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+    :raises ValueError: If the file isn't a binary routing tables file
+    """
+    data = numpy.memmap(file_path, dtype=numpy.uint8, mode="r")
+    if len(data) < _HEADER_DTYPE.itemsize:
+        raise ValueError("{} is too short to hold routing tables".format(
+            file_path))
+    header = data[:_HEADER_DTYPE.itemsize].view(_HEADER_DTYPE)[0]
+    if (header["magic"] != _BINARY_MAGIC or
+            header["version"] != _BINARY_VERSION):
+        raise ValueError("{} does not hold version {} routing tables".format(
+            file_path, _BINARY_VERSION))
+    entries_start = (
+        _HEADER_DTYPE.itemsize + int(header["n_tables"]) *
+        _INDEX_DTYPE.itemsize)
+    if len(data) < entries_start:
+        raise ValueError("{} is truncated".format(file_path))
+    index = data[_HEADER_DTYPE.itemsize:entries_start].view(_INDEX_DTYPE)
+    if len(data) != (entries_start +
+                     int(index["n_entries"].sum()) * _ENTRY_DTYPE.itemsize):
+        raise ValueError("{} is truncated".format(file_path))
+    entries = data[entries_start:].view(_ENTRY_DTYPE)
+    return index, entries
+
+
+def _table_from_binary(table_index, entries):
+    table = MulticastRoutingTable(
+        int(table_index["x"]), int(table_index["y"]))
+    first = int(table_index["first_entry"])
+    table_entries = entries[first:first + int(table_index["n_entries"])]
+    table.add_entries(
+        table_entries["key"].tolist(), table_entries["mask"].tolist(),
+        table_entries["spinnaker_route"].tolist(),
+        (table_entries["flags"] & _FLAG_DEFAULTABLE).astype(bool).tolist())
+    return table
+
+
+def read_binary(file_path):
+    """ Read routing tables from a file written by :py:func:`write_binary`
+
+    :param file_path: The file to read
+    :type file_path: str
+    :return: The routing tables, in the order they are in the file
+    :rtype: \
+        iterable(:py:class:`pacman.model.routing_tables.MulticastRoutingTable`)
+    :raises ValueError: If the file isn't a binary routing tables file
+    """
+    index, entries = _map_binary(file_path)
+    for table_index in index:
+        yield _table_from_binary(table_index, entries)
+
+
+def read_binary_table(file_path, x, y):
+    """ Read the routing table of one chip from a file written by\
+        :py:func:`write_binary`, without reading the other tables
+
+    :param file_path: The file to read
+    :type file_path: str
+    :param x: The x-coordinate of the chip
+    :type x: int
+    :param y: The y-coordinate of the chip
+    :type y: int
+    :return: The routing table, or None if the file has no table for the chip
+    :rtype:\
+        :py:class:`pacman.model.routing_tables.MulticastRoutingTable`\
+        or None
+    :raises ValueError: If the file isn't a binary routing tables file
+    """
+    index, entries = _map_binary(file_path)
+    found = numpy.flatnonzero((index["x"] == x) & (index["y"] == y))
+    if not len(found):
+        return None
+    return _table_from_binary(index[found[0]], entries)
+
+
+class _JsonArrayReader(object):
+    """ Reads the items of a JSON array from a file one at a time, holding\
+        no more of the file than the item being read.
+    """
+
+    __slots__ = [
+        # The binary file being read
+        "_file",
+        # Decodes the bytes read as UTF-8, even if split across reads
+        "_text_decoder",
+        # Decodes the JSON of one item
+        "_decoder",
+        # The text read but not yet consumed, from _pos onwards
+        "_text",
+        # The position in _text of the next character to consume
+        "_pos",
+        # True once the whole file has been read
+        "_eof"
+    ]
+
+    def __init__(self, j_file):
+        self._file = j_file
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._text = u""
+        self._pos = 0
+        self._eof = False
+
+    def _read(self):
+        """ Read more of the file, at least as much as is already held so\
+            that an item spanning many reads is decoded only a few times
+
+        :return: False if there is nothing more to read
+        :rtype: bool
+        """
+        if self._eof:
+            return False
+        text = self._text[self._pos:]
+        data = self._file.read(max(_JSON_READ_SIZE, len(text)))
+        self._eof = not data
+        self._text = text + self._text_decoder.decode(data, final=self._eof)
+        self._pos = 0
+        return not self._eof
+
+    def _next_char(self):
+        """ Skip whitespace and get the next character without consuming it
+        """
+        while True:
+            while (self._pos < len(self._text) and
+                    self._text[self._pos].isspace()):
+                self._pos += 1
+            if self._pos < len(self._text):
+                return self._text[self._pos]
+            if not self._read():
+                raise ValueError("Unexpected end of JSON array")
+
+    def _next_item(self):
+        self._next_char()
+        while True:
+            try:
+                item, end = self._decoder.raw_decode(self._text, self._pos)
+                # An item that ends the text might continue in the file
+                if end < len(self._text) or self._eof:
+                    self._pos = end
+                    return item
+            except ValueError:
+                if self._eof:
+                    raise
+            self._read()
+
+    def __iter__(self):
+        if self._next_char() != "[":
+            raise ValueError("JSON is not an array")
+        self._pos += 1
+        if self._next_char() == "]":
+            return
+        while True:
+            yield self._next_item()
+            char = self._next_char()
+            self._pos += 1
+            if char == "]":
+                return
+            if char != ",":
+                raise ValueError(
+                    "Expected , or ] in JSON array but found {}".format(char))
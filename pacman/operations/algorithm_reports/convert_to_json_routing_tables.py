@@ -13,11 +13,9 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-import json
 import os
 from spinn_utilities.progress_bar import ProgressBar
-from pacman.utilities import file_format_schemas
-from pacman.model.routing_tables.multicast_routing_tables import to_json
+from pacman.model.routing_tables.multicast_routing_tables import write_json
 
 _ROUTING_FILENAME = "routing_tables.json"
 
@@ -35,8 +33,10 @@ class ConvertToJsonRoutingTables(object):
        :param report_folder: the folder to which the reports are being written
        :type report_folder: str
         """
-        # Steps are tojson, validate and writefile
-        progress = ProgressBar(3, "Converting to JSON RouterTables")
+        # Each table is converted, validated and written in turn
+        progress = ProgressBar(
+            len(router_tables.routing_tables),
+            "Converting to JSON RouterTables")
 
         file_path = os.path.join(report_folder, _ROUTING_FILENAME)
         return ConvertToJsonRoutingTables.do_convert(
@@ -52,23 +52,7 @@ class ConvertToJsonRoutingTables(object):
         :type file_path: str
         """
 
-        json_obj = to_json(router_table)
-
-        if progress:
-            progress.update()
-
-        # validate the schema
-        file_format_schemas.validate(json_obj, "router.json")
-
-        # update and complete progress bar
         if progress:
-            progress.update()
-
-        # dump to json file
-        with open(file_path, "w") as f:
-            json.dump(json_obj, f)
-
-        if progress:
-            progress.end()
-
+            router_table = progress.over(router_table)
+        write_json(router_table, file_path)
         return file_path
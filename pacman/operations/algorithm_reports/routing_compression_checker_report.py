@@ -16,7 +16,9 @@
 from collections import OrderedDict
 import logging
 import os
+import numpy
 from spinn_utilities.log import FormatAdapter
+from spinn_machine import Router
 from spinn_utilities.progress_bar import ProgressBar
 from pacman.exceptions import PacmanRoutingException
 from pacman.operations.algorithm_reports import reports
@@ -24,6 +26,8 @@ from pacman.operations.algorithm_reports import reports
 logger = FormatAdapter(logging.getLogger(__name__))
 WILDCARD = "*"
 LINE_FORMAT = "0x{:08X} 0x{:08X} 0x{:08X} {: <7s} {}\n"
+# The bits of a spinnaker route which are links; the rest are processors
+_LINK_BITS = (1 << Router.MAX_LINKS_PER_ROUTER) - 1
 
 
 def codify(route, length=32):
@@ -94,44 +98,170 @@ def calc_remainders(o_code, c_code):
     return remainders
 
 
+def decode(code):
+    """ Converts a code as made by :py:func:`codify` back to a key and mask
+
+    :param code: The code to convert
+    :type code: str
+    :return: The key and the mask covered by the code
+    :rtype: tuple(int, int)
+    """
+    key = int(code.replace(WILDCARD, "0"), 2)
+    mask = int("".join(
+        "0" if char == WILDCARD else "1" for char in code), 2)
+    return key, mask
+
+
+def intersect(o_key, o_mask, c_key, c_mask):
+    """ The integer version of :py:func:`covers`; determines if any key\
+        matches both key-mask pairs
+    """
+    return (o_key & c_mask) == (c_key & o_mask)
+
+
+def iter_remainders(o_key, o_mask, c_key, c_mask):
+    """ The integer version of :py:func:`calc_remainders`; yields the key\
+        and mask of each remainder, in the same order.
+
+    Each remainder is the original key-mask pair with one more bit fixed;\
+    a bit which is wild in the original but fixed in the compressed entry,\
+    which is set to the opposite of the value in the compressed entry.
+    """
+    bits = c_mask & ~o_mask
+    while bits:
+        bit = bits & -bits
+        yield o_key | (bit & ~c_key), o_mask | bit
+        bits ^= bit
+
+
+class _CompressedIndex(object):
+    """ The compressed entries held as columns of keys, masks and routes,\
+        so that the first entry at or after a given place which matches a\
+        key-mask pair can be found without going through the entries one\
+        at a time.
+    """
+
+    __slots__ = [
+        # The entries, in the order they are to be considered
+        "_entries",
+
+        # The keys of the entries
+        "_keys",
+
+        # The masks of the entries
+        "_masks",
+
+        # The spinnaker routes of the entries
+        "_routes"]
+
+    def __init__(self, entries):
+        """
+        :param entries: The compressed entries in order
+        :type entries: \
+            list(:py:class:`spinn_machine.MulticastRoutingEntry`)
+        """
+        self._entries = entries
+        self._keys = numpy.array(
+            [entry.routing_entry_key for entry in entries], dtype="uint32")
+        self._masks = numpy.array(
+            [entry.mask for entry in entries], dtype="uint32")
+        self._routes = [entry.spinnaker_route for entry in entries]
+
+    def first_intersecting(self, key, mask, start):
+        """ Get the index of the first entry at or after start which\
+            intersects with the given key and mask
+
+        :param key: The key to check
+        :param mask: The mask to check
+        :param start: The first index to consider
+        :return: The index of the entry, or None if no entry intersects
+        :rtype: int or None
+        """
+        hits = numpy.flatnonzero(
+            (self._keys[start:] & numpy.uint32(mask)) ==
+            (self._masks[start:] & numpy.uint32(key)))
+        if not len(hits):
+            return None
+        return start + int(hits[0])
+
+    def key_and_mask(self, index):
+        return int(self._keys[index]), int(self._masks[index])
+
+    def entry(self, index):
+        return self._entries[index]
+
+    def route(self, index):
+        return self._routes[index]
+
+
+def _compare_route(o_route, o_spinnaker_route, compressed, key, mask, start,
+                   f):
+    """ Checks that the part of the original route covered by the key and\
+        mask is routed the same way by the compressed entries from start.
+    """
+    i = compressed.first_intersecting(key, mask, start)
+    if i is None:
+        if not o_route.defaultable:
+            raise PacmanRoutingException(
+                "No route found {}".format(o_route))
+        return
+    c_route = compressed.entry(i)
+    if f is not None:
+        f.write("\t\t{}\n".format(reports.format_route(c_route)))
+    c_spinnaker_route = compressed.route(i)
+    if o_spinnaker_route != c_spinnaker_route:
+        if (o_spinnaker_route & ~_LINK_BITS) != (
+                c_spinnaker_route & ~_LINK_BITS):
+            raise PacmanRoutingException(
+                "Compressed route {} covers original route {} but has "
+                "a different processor_ids.".format(c_route, o_route))
+        raise PacmanRoutingException(
+            "Compressed route {} covers original route {} but has "
+            "a different link_ids.".format(c_route, o_route))
+    if not o_route.defaultable and c_route.defaultable:
+        if o_route == c_route:
+            raise PacmanRoutingException(
+                "Compressed route {} while original route {} but has "
+                "a different defaultable value.".format(c_route, o_route))
+        _compare_route(o_route, o_spinnaker_route, compressed, key, mask,
+                       i + 1, f)
+    else:
+        c_key, c_mask = compressed.key_and_mask(i)
+        for r_key, r_mask in iter_remainders(key, mask, c_key, c_mask):
+            _compare_route(o_route, o_spinnaker_route, compressed, r_key,
+                           r_mask, i + 1, f)
+
+
+def _check_table(original, compressed, f=None):
+    index = _CompressedIndex(list(compressed.multicast_routing_entries))
+    for o_route in original.multicast_routing_entries:
+        if f is not None:
+            f.write("\t{}\n".format(reports.format_route(o_route)))
+        _compare_route(o_route, o_route.spinnaker_route, index,
+                       o_route.routing_entry_key, o_route.mask, 0, f)
+
+
 def compare_route(o_route, compressed_dict, o_code=None, start=0, f=None):
+    """ Checks that the original route, or the part of it given by the\
+        code, is routed the same way by the compressed entries from start
+
+    :param o_route: The original route
+    :type o_route: :py:class:`spinn_machine.MulticastRoutingEntry`
+    :param compressed_dict: The compressed entries as made by\
+        :py:func:`codify_table`
+    :param o_code: The code of the part of the route to check, or None to\
+        check the whole route
+    :param start: The index of the first compressed entry to consider
+    :param f: Where to write the report of the entries used, if anywhere
+    :raises: PacmanRoutingException if there is any error
+    """
     if o_code is None:
-        o_code = codify(o_route)
-    keys = list(compressed_dict.keys())
-    for i in range(start, len(keys)):
-        c_code = keys[i]
-        if covers(o_code, c_code):
-            c_route = compressed_dict[c_code]
-            if f is not None:
-                f.write("\t\t{}\n".format(reports.format_route(c_route)))
-            if o_route.processor_ids != c_route.processor_ids:
-                if set(o_route.processor_ids) != set(c_route.processor_ids):
-                    raise PacmanRoutingException(
-                        "Compressed route {} covers original route {} but has "
-                        "a different processor_ids.".format(c_route, o_route))
-            if o_route.link_ids != c_route.link_ids:
-                if set(o_route.link_ids) != set(c_route.link_ids):
-                    raise PacmanRoutingException(
-                        "Compressed route {} covers original route {} but has "
-                        "a different link_ids.".format(c_route, o_route))
-            if not o_route.defaultable and c_route.defaultable:
-                if o_route == c_route:
-                    raise PacmanRoutingException(
-                        "Compressed route {} while original route {} but has "
-                        "a different defaultable value.".format(
-                            c_route, o_route))
-                else:
-                    compare_route(o_route, compressed_dict, o_code=o_code,
-                                  start=i + 1, f=f)
-            else:
-                remainders = calc_remainders(o_code, c_code)
-                for remainder in remainders:
-                    compare_route(o_route, compressed_dict, o_code=remainder,
-                                  start=i + 1, f=f)
-            return
-    if not o_route.defaultable:
-        # print("No route found {}".format(o_route))
-        raise PacmanRoutingException("No route found {}".format(o_route))
+        key, mask = o_route.routing_entry_key, o_route.mask
+    else:
+        key, mask = decode(o_code)
+    index = _CompressedIndex(list(compressed_dict.values()))
+    _compare_route(o_route, o_route.spinnaker_route, index, key, mask, start,
+                   f)
 
 
 def compare_tables(original, compressed):
@@ -143,9 +273,7 @@ def compare_tables(original, compressed):
         Which will be considered in order.
     :raises: PacmanRoutingException if there is any error
     """
-    compressed_dict = codify_table(compressed)
-    for o_route in original.multicast_routing_entries:
-        compare_route(o_route, compressed_dict)
+    _check_table(original, compressed)
 
 
 def generate_routing_compression_checker_report(
@@ -180,10 +308,7 @@ def generate_routing_compression_checker_report(
 
                 compressed_table = compressed_routing_tables.\
                     get_routing_table_for_chip(x, y)
-                compressed_dict = codify_table(compressed_table)
-                for o_route in original.multicast_routing_entries:
-                    f.write("\t{}\n".format(reports.format_route(o_route)))
-                    compare_route(o_route, compressed_dict, f=f)
+                _check_table(original, compressed_table, f)
     except IOError:
         logger.exception("Generate_router_comparison_reports: Can't open file"
                          " {} for writing.", file_name)
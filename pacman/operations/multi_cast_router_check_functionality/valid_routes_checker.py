@@ -15,8 +15,10 @@
 
 """ Collection of functions which together validate routes.
 """
-from collections import namedtuple
+from bisect import bisect_left, bisect_right
+from collections import defaultdict, namedtuple
 import logging
+from six import iteritems
 from spinn_utilities.ordered_set import OrderedSet
 from spinn_utilities.progress_bar import ProgressBar
 from spinn_utilities.log import FormatAdapter
@@ -34,6 +36,83 @@ range_masks = {_32_BITS - ((2 ** i) - 1) for i in range(33)}
 PlacementTuple = namedtuple('PlacementTuple', 'x y p')
 
 
+class _RoutingTableLookup(object):
+    """ The entries of a routing table indexed so that those which could\
+        affect the lookup of a key can be found without going through\
+        every entry in the table.
+    """
+
+    __slots__ = [
+        # The entries of the table in order
+        "_entries",
+
+        # Dict of mask to dict of key to the index of the entry
+        "_by_mask",
+
+        # Dict of range mask to a sorted list of the keys and a matching
+        # list of the indices of the entries with that mask
+        "_ranges"]
+
+    def __init__(self, routing_table):
+        """
+        :param routing_table: The table to index
+        :type routing_table:\
+            :py:class:`pacman.model.routing_tables.MulticastRoutingTable`
+        """
+        self._entries = list(routing_table.multicast_routing_entries)
+        self._by_mask = defaultdict(dict)
+        ranges = defaultdict(list)
+        for index, entry in enumerate(self._entries):
+            self._by_mask[entry.mask][entry.routing_entry_key] = index
+            if entry.mask in range_masks:
+                ranges[entry.mask].append((entry.routing_entry_key, index))
+        self._ranges = dict()
+        for mask, keys_and_indices in iteritems(ranges):
+            keys_and_indices.sort()
+            self._ranges[mask] = (
+                [key for key, _ in keys_and_indices],
+                [index for _, index in keys_and_indices])
+
+    def candidates(self, key, n_atoms):
+        """ Get the entries which either match the key or have a range mask\
+            which overlaps the keys of the atoms, in table order.  All other\
+            entries play no part in the lookup of the key.
+
+        :param key: The base key of the atoms
+        :param n_atoms: The number of atoms
+        :rtype: iterable(:py:class:`spinn_machine.MulticastRoutingEntry`)
+        """
+        indices = set()
+        for mask, keys in iteritems(self._by_mask):
+            index = keys.get(key & mask)
+            if index is not None:
+                indices.add(index)
+
+        # Entries with the same range mask cover separate ranges, so those
+        # overlapping the atoms are found by their start keys
+        last_atom = key + n_atoms
+        for mask, (keys, range_indices) in iteritems(self._ranges):
+            first = bisect_left(keys, key - (~mask & _32_BITS))
+            last = bisect_right(keys, last_atom)
+            indices.update(range_indices[first:last])
+        return [self._entries[index] for index in sorted(indices)]
+
+
+def _get_lookup(lookups, routing_table):
+    """ Get the lookup of a routing table, making it if needed
+
+    :param lookups: dict of chip coordinates to lookups made so far
+    :param routing_table: the routing table to look up
+    :rtype: _RoutingTableLookup
+    """
+    chip = (routing_table.x, routing_table.y)
+    lookup = lookups.get(chip)
+    if lookup is None:
+        lookup = _RoutingTableLookup(routing_table)
+        lookups[chip] = lookup
+    return lookup
+
+
 def validate_routes(machine_graph, placements, routing_infos,
                     routing_tables, machine, graph_mapper=None):
     """ Go though the placements given and check that the routing entries\
@@ -58,6 +137,7 @@ def validate_routes(machine_graph, placements, routing_infos,
     progress = ProgressBar(
         placements.placements,
         "Verifying the routes from each core travel to the correct locations")
+    lookups = dict()
     for placement in progress.over(placements.placements):
 
         # locate all placements to which this placement/vertex will
@@ -103,7 +183,7 @@ def validate_routes(machine_graph, placements, routing_infos,
             for key_and_mask in r_info.keys_and_masks:
                 _search_route(
                     placement, destination_placements, key_and_mask,
-                    routing_tables, machine, n_atoms, is_continuous)
+                    routing_tables, machine, n_atoms, is_continuous, lookups)
 
 
 def _check_if_partition_has_continuous_keys(partition):
@@ -114,7 +194,7 @@ def _check_if_partition_has_continuous_keys(partition):
 
 
 def _search_route(source_placement, dest_placements, key_and_mask,
-                  routing_tables, machine, n_atoms, is_continuous):
+                  routing_tables, machine, n_atoms, is_continuous, lookups):
     """ Locate if the routing tables work for the source to desks as\
         defined
 
@@ -125,6 +205,7 @@ def _search_route(source_placement, dest_placements, key_and_mask,
     :param n_atoms: the number of atoms going through this path
     :param is_continuous: \
         whether the keys and atoms mapping is continuous
+    :param lookups: the lookups of the routing tables made so far
     :type source_placement: \
         :py:class:`pacman.model.placements.Placement`
     :type dest_placements: iterable(PlacementTuple)
@@ -145,7 +226,7 @@ def _search_route(source_placement, dest_placements, key_and_mask,
     _start_trace_via_routing_tables(
         source_placement, key_and_mask, located_destinations,
         routing_tables, machine, n_atoms, is_continuous,
-        failed_to_cover_all_keys_routers)
+        failed_to_cover_all_keys_routers, lookups)
 
     # start removing from located_destinations and check if destinations not
     #  reached
@@ -209,7 +290,8 @@ def _search_route(source_placement, dest_placements, key_and_mask,
 
 def _start_trace_via_routing_tables(
         source_placement, key_and_mask, reached_placements, routing_tables,
-        machine, n_atoms, is_continuous, failed_to_cover_all_keys_routers):
+        machine, n_atoms, is_continuous, failed_to_cover_all_keys_routers,
+        lookups):
     """ Start the trace, by using the source placement's router and tracing\
         from the route.
 
@@ -222,6 +304,7 @@ def _start_trace_via_routing_tables(
         bool stating if the keys and atoms mapping is continuous
     :param failed_to_cover_all_keys_routers: \
         list of failed routers for all keys
+    :param lookups: the lookups of the routing tables made so far
     :rtype: None
     :raises None: this method does not raise any known exception
     """
@@ -232,13 +315,13 @@ def _start_trace_via_routing_tables(
 
     # get src router
     entry = _locate_routing_entry(
-        current_router_table, key_and_mask.key, n_atoms)
+        current_router_table, key_and_mask.key, n_atoms, lookups)
 
     _recursive_trace_to_destinations(
         entry, current_router_table, source_placement.x,
         source_placement.y, key_and_mask, visited_routers,
         reached_placements, machine, routing_tables, is_continuous, n_atoms,
-        failed_to_cover_all_keys_routers)
+        failed_to_cover_all_keys_routers, lookups)
 
 
 def _check_all_keys_hit_entry(entry, n_atoms, base_key):
@@ -248,6 +331,16 @@ def _check_all_keys_hit_entry(entry, n_atoms, base_key):
     :param base_key: the base key of the partition
     :return: the list of keys which this entry doesn't cover which it should
     """
+    if n_atoms > 0:
+        # The keys of the atoms agree above the highest bit that differs
+        # between the first and last key, and include a key where that bit
+        # and all below it change together, so all the keys match only if
+        # the first does and the mask ignores all of these bits
+        differ = (base_key ^ (base_key + n_atoms - 1)).bit_length()
+        if (entry.mask & base_key == entry.routing_entry_key and
+                not entry.mask & ((1 << differ) - 1)):
+            return []
+
     bad_entries = list()
     for atom_id in range(0, n_atoms):
         key = base_key + atom_id
@@ -260,7 +353,7 @@ def _check_all_keys_hit_entry(entry, n_atoms, base_key):
 def _recursive_trace_to_destinations(
         entry, current_router, chip_x, chip_y, key_and_mask, visited_routers,
         reached_placements, machine, routing_tables, is_continuous, n_atoms,
-        failed_to_cover_all_keys_routers):
+        failed_to_cover_all_keys_routers, lookups):
     """ Recursively search though routing tables until no more entries are\
         registered with this key.
 
@@ -280,6 +373,7 @@ def _recursive_trace_to_destinations(
         bool stating if the keys and atoms mapping is continuous
     :param failed_to_cover_all_keys_routers: \
         list of failed routers for all keys
+    :param lookups: the lookups of the routing tables made so far
     :type entry: \
         :py:class:`spinn_machine.MulticastRoutingEntry`
     :type current_router:\
@@ -319,7 +413,7 @@ def _recursive_trace_to_destinations(
 
             # locate next entry
             entry = _locate_routing_entry(
-                next_router, key_and_mask.key, n_atoms)
+                next_router, key_and_mask.key, n_atoms, lookups)
 
             if is_continuous:
                 bad_entries = _check_all_keys_hit_entry(
@@ -336,7 +430,7 @@ def _recursive_trace_to_destinations(
                 entry, next_router, link.destination_x, link.destination_y,
                 key_and_mask, visited_routers, reached_placements, machine,
                 routing_tables, is_continuous, n_atoms,
-                failed_to_cover_all_keys_routers)
+                failed_to_cover_all_keys_routers, lookups)
 
     # only goes to a processor
     elif processor_values:
@@ -382,17 +476,20 @@ def _is_dest(processor_ids, current_router, reached_placements):
         reached_placements.add(PlacementTuple(dest_x, dest_y, processor_id))
 
 
-def _locate_routing_entry(current_router, key, n_atoms):
+def _locate_routing_entry(current_router, key, n_atoms, lookups):
     """ Locate the entry from the router based off the edge
 
     :param current_router: the current router being used in the trace
     :param key: the key being used by the source placement
+    :param n_atoms: the number of atoms going through this path
+    :param lookups: the lookups of the routing tables made so far
     :rtype: None
     :raise PacmanRoutingException: \
         when there is no entry located on this router
     """
     found_entry = None
-    for entry in current_router.multicast_routing_entries:
+    lookup = _get_lookup(lookups, current_router)
+    for entry in lookup.candidates(key, n_atoms):
         key_combo = entry.mask & key
         e_key = entry.routing_entry_key
         if key_combo == e_key:
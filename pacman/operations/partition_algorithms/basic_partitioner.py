@@ -24,7 +24,8 @@ from pacman.model.graphs.machine import MachineGraph
 from pacman.utilities import utility_calls
 from pacman.utilities.algorithm_utilities.partition_algorithm_utilities \
     import (generate_machine_edges, get_remaining_constraints)
-from pacman.utilities.utility_objs import ResourceTracker
+from pacman.utilities.utility_objs import (
+    ResourceEstimateCache, ResourceTracker)
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +35,10 @@ class BasicPartitioner(object):
         on the number of atoms in the vertices.
     """
 
-    __slots__ = []
+    __slots__ = [
+        # The cache of the resources used by slices of the vertices
+        "_estimates"
+    ]
 
     @staticmethod
     def _get_ratio(top, bottom):
@@ -43,7 +47,8 @@ class BasicPartitioner(object):
         return top / bottom
 
     # inherited from AbstractPartitionAlgorithm
-    def __call__(self, graph, machine, plan_n_timesteps):
+    def __call__(self, graph, machine, plan_n_timesteps, n_processes=None,
+                 use_threads=False):
         """
         :param graph: The application_graph to partition
         :type graph:\
@@ -54,6 +59,15 @@ class BasicPartitioner(object):
         :type machine: :py:class:`spinn_machine.Machine`
         :param plan_n_timesteps: number of timesteps to plan for
         :type  plan_n_timesteps: int
+        :param n_processes: \
+            The number of processes to estimate the resources of the slices\
+            of each vertex in before they are allocated; if None or 1 the\
+            resources are estimated one slice at a time.  The result is the\
+            same whatever the number of processes.
+        :type n_processes: int or None
+        :param use_threads: \
+            True to estimate resources in threads rather than processes
+        :type use_threads: bool
         :return: A machine graph
         :rtype:\
             :py:class:`pacman.model.graphs.machine.MachineGraph`
@@ -72,6 +86,10 @@ class BasicPartitioner(object):
         machine_graph = MachineGraph("Machine graph for " + graph.label)
         graph_mapper = GraphMapper()
         resource_tracker = ResourceTracker(machine, plan_n_timesteps)
+        self._estimates = ResourceEstimateCache(
+            n_workers=n_processes, use_processes=not use_threads)
+        self._estimates.precompute(
+            (vertex, [Slice(0, 1)]) for vertex in graph.vertices)
 
         # Partition one vertex at a time
         for vertex in progress.over(graph.vertices):
@@ -95,20 +113,25 @@ class BasicPartitioner(object):
                 "Not enough resources available to create vertex")
 
         # Partition into vertices
+        slices = list()
         for first in range(0, vertex.n_atoms, int(atoms_per_core)):
             # Determine vertex size
             last = min(first + atoms_per_core, vertex.n_atoms) - 1
             if first < 0 or last < 0:
                 raise PacmanPartitionException(
                     "Not enough resources available to create vertex")
+            slices.append(Slice(first, last))
+        self._estimates.precompute([(vertex, slices)])
 
-            # Create and store new vertex, and increment elements first
-            vertex_slice = Slice(first, last)
-            resources = vertex.get_resources_used_by_atoms(vertex_slice)
+        for vertex_slice in slices:
+            # Create and store new vertex
+            resources = self._estimates.get_resources_used_by_atoms(
+                vertex, vertex_slice)
 
             m_vertex = vertex.create_machine_vertex(
                 vertex_slice, resources,
-                "{}:{}:{}".format(vertex.label, first, last),
+                "{}:{}:{}".format(
+                    vertex.label, vertex_slice.lo_atom, vertex_slice.hi_atom),
                 get_remaining_constraints(vertex))
             m_graph.add_vertex(m_vertex)
             mapper.add_vertex_mapping(m_vertex, vertex_slice, vertex)
@@ -126,7 +149,8 @@ class BasicPartitioner(object):
         """
         # Get the usage of the first atom, then assume that this will be the
         # usage of all the atoms.
-        requirements = vertex.get_resources_used_by_atoms(Slice(0, 1))
+        requirements = self._estimates.get_resources_used_by_atoms(
+            vertex, Slice(0, 1))
 
         # Locate the maximum resources available
         limits = res_tracker.get_maximum_constrained_resources_available(
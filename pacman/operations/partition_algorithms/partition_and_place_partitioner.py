@@ -31,7 +31,8 @@ from pacman.utilities.algorithm_utilities.partition_algorithm_utilities \
         get_remaining_constraints)
 from pacman.utilities.algorithm_utilities.placer_algorithm_utilities import (
     sort_vertices_by_known_constraints)
-from pacman.utilities.utility_objs import ResourceTracker
+from pacman.utilities.utility_objs import (
+    ResourceEstimateCache, ResourceTracker)
 
 logger = logging.getLogger(__name__)
 
@@ -41,12 +42,15 @@ class PartitionAndPlacePartitioner(object):
         keeping track of the SDRAM usage on the various chips
     """
 
-    __slots__ = []
+    __slots__ = [
+        # The cache of the resources used by slices of the vertices
+        "_estimates"
+    ]
 
     # inherited from AbstractPartitionAlgorithm
     def __call__(
             self, graph, machine, plan_n_timesteps,
-            preallocated_resources=None):
+            preallocated_resources=None, n_processes=None, use_threads=False):
         """
         :param graph: The application_graph to partition
         :type graph:\
@@ -56,6 +60,18 @@ class PartitionAndPlacePartitioner(object):
         :type machine: :py:class:`spinn_machine.Machine`
         :param plan_n_timesteps: number of timesteps to plan for
         :type  plan_n_timesteps: int
+        :param preallocated_resources: resources already allocated
+        :type preallocated_resources:\
+            :py:class:`pacman.model.resources.PreAllocatedResourceContainer`
+        :param n_processes: \
+            The number of processes to estimate the resources of the\
+            largest slices of all the vertices in before any are allocated;\
+            if None or 1 the resources are estimated one slice at a time.\
+            The result is the same whatever the number of processes.
+        :type n_processes: int or None
+        :param use_threads: \
+            True to estimate resources in threads rather than processes
+        :type use_threads: bool
         :return: \
             A machine_graph of partitioned vertices and partitioned edges
         :rtype:\
@@ -92,6 +108,12 @@ class PartitionAndPlacePartitioner(object):
         # Group vertices that are supposed to be the same size
         vertex_groups = get_same_size_vertex_groups(vertices)
 
+        self._estimates = ResourceEstimateCache(
+            n_workers=n_processes, use_processes=not use_threads)
+        if n_processes is not None and n_processes > 1:
+            self._estimates.precompute(
+                self._candidate_slices(vertices, vertex_groups))
+
         # Partition one vertex at a time
         for vertex in vertices:
 
@@ -137,7 +159,32 @@ class PartitionAndPlacePartitioner(object):
             number of atoms than its counterpart.
         """
         partition_together_vertices = list(vertex_groups[vertex])
+        max_atoms_per_core, fixed_n_atoms = self._compute_max_atoms_per_core(
+            vertex, partition_together_vertices)
+
+        # partition by atoms
+        self._partition_by_atoms(
+            partition_together_vertices, plan_n_timesteps, vertex.n_atoms,
+            max_atoms_per_core, machine_graph, graph_mapper, resource_tracker,
+            progress, fixed_n_atoms)
 
+    @staticmethod
+    def _compute_max_atoms_per_core(vertex, partition_together_vertices):
+        """ Work out the most atoms of a vertex that can go on one core,\
+            ignoring the resources available.
+
+        :param vertex: the vertex to partition
+        :type vertex:\
+            :py:class:`pacman.model.graphs.application.ApplicationVertex`
+        :param partition_together_vertices:\
+            the vertices that must be partitioned with the same slices
+        :type partition_together_vertices:\
+            list(:py:class:`pacman.model.graphs.application.ApplicationVertex`)
+        :return: the max atoms per core, and whether that number is fixed
+        :rtype: tuple(int, bool)
+        :raise pacman.exceptions.PacmanPartitionException: \
+            if the constraints on the atoms per core contradict each other
+        """
         # locate max atoms per core and fixed atoms per core
         possible_max_atoms = list()
         n_atoms = None
@@ -169,11 +216,33 @@ class PartitionAndPlacePartitioner(object):
                     "Vertex of {} atoms cannot be divided into units of {}"
                     .format(vertex.n_atoms, n_atoms))
 
-        # partition by atoms
-        self._partition_by_atoms(
-            partition_together_vertices, plan_n_timesteps, vertex.n_atoms,
-            max_atoms_per_core, machine_graph, graph_mapper, resource_tracker,
-            progress, n_atoms is not None)
+        return max_atoms_per_core, n_atoms is not None
+
+    def _candidate_slices(self, vertices, vertex_groups):
+        """ Get the slices each vertex would be split into if the\
+            resources available did not limit the atoms per core.
+
+        :param vertices: the vertices to partition
+        :param vertex_groups: Groups together vertices that are supposed to\
+            be the same size
+        :rtype: iterable(tuple(\
+            :py:class:`pacman.model.graphs.application.ApplicationVertex`,\
+            list(:py:class:`pacman.model.graphs.common.Slice`)))
+        """
+        seen = set()
+        for vertex in vertices:
+            if vertex in seen:
+                continue
+            partition_together_vertices = list(vertex_groups[vertex])
+            seen.update(partition_together_vertices)
+            max_atoms_per_core, _ = self._compute_max_atoms_per_core(
+                vertex, partition_together_vertices)
+            slices = [
+                Slice(lo_atom, min(lo_atom + max_atoms_per_core,
+                                   vertex.n_atoms) - 1)
+                for lo_atom in range(0, vertex.n_atoms, max_atoms_per_core)]
+            for other_vertex in partition_together_vertices:
+                yield other_vertex, slices
 
     def _partition_by_atoms(
             self, vertices, plan_n_timesteps, n_atoms, max_atoms_per_core,
@@ -241,9 +310,8 @@ class PartitionAndPlacePartitioner(object):
 
                 progress.update(vertex_slice.n_atoms)
 
-    @staticmethod
     def _reallocate_resources(
-            used_placements, resource_tracker, lo_atom, hi_atom):
+            self, used_placements, resource_tracker, lo_atom, hi_atom):
         """ Readjusts resource allocation and updates the placement list to\
             take into account the new layout of the atoms
 
@@ -272,8 +340,8 @@ class PartitionAndPlacePartitioner(object):
 
             # Get the new resource usage
             vertex_slice = Slice(lo_atom, hi_atom)
-            new_resources = \
-                placed_vertex.get_resources_used_by_atoms(vertex_slice)
+            new_resources = self._estimates.get_resources_used_by_atoms(
+                placed_vertex, vertex_slice)
 
             if not isinstance(placed_vertex, AbstractVirtual):
                 # Re-allocate the existing resources
@@ -328,7 +396,8 @@ class PartitionAndPlacePartitioner(object):
 
             # get resources used by vertex
             vertex_slice = Slice(lo_atom, hi_atom)
-            used_resources = vertex.get_resources_used_by_atoms(vertex_slice)
+            used_resources = self._estimates.get_resources_used_by_atoms(
+                vertex, vertex_slice)
 
             x = None
             y = None
@@ -358,24 +427,12 @@ class PartitionAndPlacePartitioner(object):
                             resources_available.sdram.get_total_sdram(
                                 plan_n_timesteps)))
 
-                while ratio > 1.0 and hi_atom >= lo_atom:
-                    # Scale the resources available by the ratio
-                    old_n_atoms = (hi_atom - lo_atom) + 1
-                    new_n_atoms = int(old_n_atoms / (ratio * 1.1))
-
-                    # Avoid infinite looping
-                    if old_n_atoms == new_n_atoms:
-                        new_n_atoms -= 1
-
-                    # Find the new resource usage
-                    hi_atom = lo_atom + new_n_atoms - 1
-                    if hi_atom >= lo_atom:
-                        vertex_slice = Slice(lo_atom, hi_atom)
-                        used_resources = \
-                            vertex.get_resources_used_by_atoms(vertex_slice)
-                        ratio = self._find_max_ratio(
-                            used_resources, resources_available,
-                            plan_n_timesteps)
+                # Find the most atoms that fit in the resources available
+                if ratio > 1.0:
+                    used_resources, hi_atom = self._find_hi_atom_that_fits(
+                        vertex, lo_atom, hi_atom, used_resources, ratio,
+                        max_atoms_per_core, resources_available,
+                        plan_n_timesteps)
 
                 # If we couldn't partition, raise an exception
                 if hi_atom < lo_atom:
@@ -390,11 +447,6 @@ class PartitionAndPlacePartitioner(object):
                             resources_available.sdram.get_total_sdram(
                                 plan_n_timesteps)))
 
-                # Try to scale up until just below the resource usage
-                used_resources, hi_atom = self._scale_up_resource_usage(
-                    used_resources, hi_atom, lo_atom, max_atoms_per_core,
-                    vertex, plan_n_timesteps, resources_available, ratio)
-
                 # If this hi_atom is smaller than the current minimum, update
                 # the other placements to use (hopefully) less
                 # resources available
@@ -424,67 +476,89 @@ class PartitionAndPlacePartitioner(object):
 
         return final_placements, min_hi_atom
 
-    def _scale_up_resource_usage(
-            self, used_resources, hi_atom, lo_atom, max_atoms_per_core, vertex,
-            plan_n_timesteps, resources, ratio):
-        """ Try to push up the number of atoms in a vertex to be as close\
-            to the available resources as possible
-
-        :param used_resources: the resources used by the machine so far
-        :type used_resources:\
-            :py:class:`pacman.model.resources.Resource`
-        :param hi_atom: the total number of atoms to place for this vertex
-        :type hi_atom: int
+    def _find_hi_atom_that_fits(
+            self, vertex, lo_atom, hi_atom, used_resources, ratio,
+            max_atoms_per_core, resources, plan_n_timesteps):
+        """ Find the most atoms from lo_atom that fit in the resources\
+            available, given that the atoms up to hi_atom do not.  The\
+            number of atoms is first scaled down by the ratio until some\
+            fit, and then a binary search is made between the most atoms\
+            known to fit and the fewest known not to, so the resources used\
+            are asked for a number of times logarithmic in the number of\
+            atoms.
+
+        :param vertex: the vertex to find the number of atoms for
+        :type vertex:\
+            :py:class:`pacman.model.graphs.application.ApplicationVertex`
         :param lo_atom: the number of atoms already partitioned
         :type lo_atom: int
+        :param hi_atom: the highest atom known not to fit
+        :type hi_atom: int
+        :param used_resources: the resources used by the atoms up to hi_atom
+        :type used_resources:\
+            :py:class:`pacman.model.resources.ResourceContainer`
+        :param ratio: the ratio of the resources used by the atoms up to\
+            hi_atom to the resources available
+        :type ratio: float
         :param max_atoms_per_core: the min max atoms from all the vertexes \
             considered that have max_atom constraints
         :type max_atoms_per_core: int
-        :param vertex: the vertexes to scale up the num atoms per core for
-        :type vertex:\
-            :py:class:`pacman.model.graphs.application.ApplicationVertex`
+        :param resources: the resources available
+        :type resources:\
+            :py:class:`pacman.model.resources.ResourceContainer`
         :param plan_n_timesteps: number of timesteps to plan for
         :type  plan_n_timesteps: int
-        :param resources: the resource estimate for the vertex for a given\
-            number of atoms
-        :type resources:\
-            :py:class:`pacman.model.resources.Resource`
-        :param ratio: the ratio between max atoms and available resources
-        :type ratio: int
-        :return: the new resources used and the new hi_atom
+        :return: the resources used and the new hi_atom, which is less than\
+            lo_atom if not even one atom fits
         :rtype: tuple(:py:class:`pacman.model.resources.Resource`, int)
         """
-
-        previous_used_resources = used_resources
-        previous_hi_atom = hi_atom
-
-        # Keep searching while the ratio is still in range,
-        # the next hi_atom value is still less than the number of atoms,
-        # and the number of atoms is less than the constrained number of atoms
-        while ((ratio < 1.0) and (hi_atom + 1 < vertex.n_atoms) and
-               (hi_atom - lo_atom + 2 < max_atoms_per_core)):
-
-            # Update the hi_atom, keeping track of the last hi_atom which
-            # resulted in a ratio < 1.0
-            previous_hi_atom = hi_atom
-            hi_atom += 1
-
-            # Find the new resource usage, keeping track of the last usage
-            # which resulted in a ratio < 1.0
-            previous_used_resources = used_resources
-            vertex_slice = Slice(lo_atom, hi_atom)
-            used_resources = vertex.get_resources_used_by_atoms(vertex_slice)
-            ratio = self._find_max_ratio(
-                used_resources, resources, plan_n_timesteps)
-
-        # If we have managed to fit everything exactly (unlikely but possible),
-        # return the matched resources and high atom count
-        if ratio == 1.0:
-            return used_resources, hi_atom
-
-        # At this point, the ratio > 1.0, so pick the last allocation of
-        # resources, which will be < 1.0
-        return previous_used_resources, previous_hi_atom
+        def get_usage(n_atoms):
+            usage = self._estimates.get_resources_used_by_atoms(
+                vertex, Slice(lo_atom, lo_atom + n_atoms - 1))
+            return usage, self._find_max_ratio(
+                usage, resources, plan_n_timesteps)
+
+        # Scale down by the ratio until some atoms fit
+        no_fit_atoms = hi_atom - lo_atom + 1
+        fit_atoms = 0
+        while fit_atoms == 0:
+            n_atoms = int(no_fit_atoms / (ratio * 1.1))
+
+            # Avoid infinite looping
+            if n_atoms == no_fit_atoms:
+                n_atoms -= 1
+            if n_atoms < 1:
+                return used_resources, lo_atom - 1
+
+            used_resources, ratio = get_usage(n_atoms)
+            if ratio <= 1.0:
+                fit_atoms, fit_resources, fit_ratio = \
+                    n_atoms, used_resources, ratio
+            else:
+                no_fit_atoms = n_atoms
+        scaled_fit_atoms = fit_atoms
+
+        # Search for the boundary between the atoms that fit and those that
+        # don't
+        while no_fit_atoms - fit_atoms > 1:
+            n_atoms = (fit_atoms + no_fit_atoms) // 2
+            used_resources, ratio = get_usage(n_atoms)
+            if ratio <= 1.0:
+                fit_atoms, fit_resources, fit_ratio = \
+                    n_atoms, used_resources, ratio
+            else:
+                no_fit_atoms = n_atoms
+
+        # Counting up an atom at a time from the scaled down number of atoms
+        # used to stop one atom short of max_atoms_per_core - 1 unless the
+        # resources were used exactly; keep doing so, so that the slices
+        # made don't change
+        if (fit_atoms == max_atoms_per_core - 1 and fit_ratio < 1.0 and
+                scaled_fit_atoms < fit_atoms):
+            fit_atoms -= 1
+            fit_resources, _ = get_usage(fit_atoms)
+
+        return fit_resources, lo_atom + fit_atoms - 1
 
     @staticmethod
     def _get_max_atoms_per_core(vertices):
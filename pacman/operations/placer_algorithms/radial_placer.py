@@ -32,6 +32,21 @@ class RadialPlacer(object):
         machine choosing chips radiating in a circle from the boot chip
     """
 
+    def __init__(self):
+        # The machine for which radial orders of chips have been worked out
+        self._radial_machine = None
+
+        # Dict of start chip coordinates to the coordinates of the chips of
+        # the machine in radial order from that chip
+        self._radial_orders = dict()
+
+        # The resource tracker against which chips have been skipped
+        self._radial_tracker = None
+
+        # Dict of start chip coordinates to the index in the radial order of
+        # the first chip which might still be available in the tracker
+        self._radial_first_available = dict()
+
     def __call__(self, machine_graph, machine, plan_n_timesteps):
         """
 
@@ -126,9 +141,8 @@ class RadialPlacer(object):
                 raise PacmanPlaceException("Non-matching constraints")
         return x, y
 
-    @staticmethod
     def _generate_radial_chips(
-            machine, resource_tracker=None, start_chip_x=None,
+            self, machine, resource_tracker=None, start_chip_x=None,
             start_chip_y=None):
         """ Generates the list of chips from a given starting point in a radial\
             format.
@@ -147,23 +161,62 @@ class RadialPlacer(object):
         """
 
         if start_chip_x is None or start_chip_y is None:
-            first_chip = machine.boot_chip
+            start = (machine.boot_chip.x, machine.boot_chip.y)
         else:
-            first_chip = machine.get_chip_at(start_chip_x, start_chip_y)
-        done_chips = {first_chip}
-        search = deque([first_chip])
+            start = (start_chip_x, start_chip_y)
+        order = self._get_radial_order(machine, start)
+        if resource_tracker is None:
+            for chip in order:
+                yield chip
+            return
+
+        # Chips are never freed during placement, so once a chip is found to
+        # be used up it never needs to be looked at again from this start
+        if resource_tracker is not self._radial_tracker:
+            self._radial_tracker = resource_tracker
+            self._radial_first_available = dict()
+        index = self._radial_first_available.get(start, 0)
+        while (index < len(order) and
+               not resource_tracker.is_chip_available(*order[index])):
+            index += 1
+        self._radial_first_available[start] = index
+        for index in range(index, len(order)):
+            x, y = order[index]
+            if resource_tracker.is_chip_available(x, y):
+                yield x, y
+
+    def _get_radial_order(self, machine, start):
+        """ Get the coordinates of the chips of the machine in the order of\
+            a breadth first search from the given chip, working this out only\
+            once for each start chip
+
+        :param machine: the SpiNNaker machine object
+        :param start: the coordinates of the chip to start from
+        :type start: tuple(int, int)
+        :rtype: list(tuple(int, int))
+        """
+        if machine is not self._radial_machine:
+            self._radial_machine = machine
+            self._radial_orders = dict()
+            self._radial_tracker = None
+        order = self._radial_orders.get(start)
+        if order is not None:
+            return order
+
+        order = [start]
+        done_chips = {start}
+        search = deque([machine.get_chip_at(*start)])
         while search:
             chip = search.pop()
-            if (resource_tracker is None or
-                    resource_tracker.is_chip_available(chip.x, chip.y)):
-                yield chip.x, chip.y
 
             # Examine the links of the chip to find the next chips
             for link in chip.router.links:
-                next_chip = machine.get_chip_at(
-                    link.destination_x, link.destination_y)
+                next_chip = (link.destination_x, link.destination_y)
 
                 # Don't search done chips again
                 if next_chip not in done_chips:
-                    search.appendleft(next_chip)
+                    search.appendleft(machine.get_chip_at(*next_chip))
                     done_chips.add(next_chip)
+                    order.append(next_chip)
+        self._radial_orders[start] = order
+        return order
@@ -14,6 +14,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import logging
+import numpy
 from spinn_utilities.progress_bar import ProgressBar
 from pacman.model.constraints.placer_constraints import SameChipAsConstraint
 from pacman.utilities.algorithm_utilities.placer_algorithm_utilities import (
@@ -25,11 +26,54 @@ from pacman.operations.rigged_algorithms.hilbert_state import HilbertState
 logger = logging.getLogger(__name__)
 
 
+def hilbert_indices(level, x, y):
+    """ Get the distances along a 2D Hilbert curve of the given points.
+
+    This is the closed form of the curve generated by\
+    :py:meth:`HilbertPlacer._hilbert_curve`, working on whole arrays of\
+    points at once.
+
+    :param level: Number of levels of the curve; it is `(2**level)-1`\
+        wide/tall.
+    :type level: int
+    :param x: The x coordinates of the points
+    :type x: iterable(int)
+    :param y: The y coordinates of the points
+    :type y: iterable(int)
+    :return: The index of each point on the curve
+    :rtype: :py:class:`numpy.ndarray`
+    """
+    x = numpy.array(x, dtype="int64")
+    y = numpy.array(y, dtype="int64")
+    side = 1 << level
+    indices = numpy.zeros_like(x)
+    s = side >> 1
+    while s > 0:
+        rx = (x & s) > 0
+        ry = (y & s) > 0
+        indices += s * s * ((3 * rx) ^ ry)
+
+        # Rotate the quadrant so that the curve within it is the same
+        flip = rx & ~ry
+        x = numpy.where(flip, side - 1 - x, x)
+        y = numpy.where(flip, side - 1 - y, y)
+        x, y = numpy.where(ry, x, y), numpy.where(ry, y, x)
+        s >>= 1
+    return indices
+
+
 class HilbertPlacer(object):
     """ A simple placing algorithm using the Hilbert space-filling curve,\
         translated from RIG.
     """
 
+    def __init__(self):
+        # The machine for which the Hilbert order of chips has been worked out
+        self._hilbert_machine = None
+
+        # The coordinates of the chips of the machine in Hilbert order
+        self._hilbert_order = None
+
     def __call__(self, machine_graph, machine, plan_n_timesteps):
         """ Place each vertex in a machine graph on a core in the machine.
 
@@ -103,13 +147,32 @@ class HilbertPlacer(object):
         :rtype int, int
         """
 
+        if machine is not self._hilbert_machine:
+            self._hilbert_order = self._get_hilbert_order(machine)
+            self._hilbert_machine = machine
+        for chip in self._hilbert_order:
+            yield chip
+
+    @staticmethod
+    def _get_hilbert_order(machine):
+        """ Get the coordinates of the chips of a machine in the order of a\
+            Hilbert curve over the machine.
+
+        :param machine: A SpiNNaker machine object.
+        :type machine: :py:class:`spinn_machine.Machine`
+        :rtype: list(tuple(int, int))
+        """
+
         # set size of curve based on number of chips on machine
         max_dimen = max(machine.max_chip_x, machine.max_chip_y)
         hilbert_levels = (max_dimen.bit_length() if max_dimen >= 1 else 0)
+        side = 1 << hilbert_levels
 
-        for x, y in self._hilbert_curve(hilbert_levels):
-            if machine.is_chip_at(x, y):
-                yield x, y
+        chips = [(x, y) for x, y in machine.chip_coordinates
+                 if x < side and y < side]
+        indices = hilbert_indices(
+            hilbert_levels, [x for x, _ in chips], [y for _, y in chips])
+        return [chips[i] for i in numpy.argsort(indices, kind="stable")]
 
     def _place_vertex(self, vertex, resource_tracker, machine, placements,
                       vertices_on_same_chip):
@@ -13,8 +13,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import heapq
 import logging
-import sys
 from six.moves import zip
 from spinn_utilities.progress_bar import ProgressBar, DummyProgressBar
 from pacman.exceptions import PacmanRoutingException
@@ -40,11 +40,15 @@ class _NodeInfo(object):
 
 
 class _DijkstraInfo(object):
-    __slots__ = ["activated", "cost"]
+    __slots__ = ["activated", "cost", "generation", "order"]
 
-    def __init__(self):
+    def __init__(self, order):
         self.activated = False
         self.cost = None
+        # The search that the activated and cost values belong to
+        self.generation = 0
+        # The position of the chip in the machine, used to break ties
+        self.order = order
 
 
 class BasicDijkstraRouting(object):
@@ -64,7 +68,11 @@ class BasicDijkstraRouting(object):
         "_max_bw",
 
         # the SpiNNMachine object used within the system.
-        "_machine"
+        "_machine",
+
+        # the number of the current search; table values from any other
+        # search are out of date
+        "_generation"
     ]
 
     BW_PER_ROUTE_ENTRY = 0.01
@@ -98,6 +106,7 @@ class BasicDijkstraRouting(object):
         self._bw_per_route_entry = bw_per_route_entry
         self._max_bw = max_bw
         self._machine = machine
+        self._generation = 0
 
         nodes_info = self._initiate_node_info(machine)
         tables = self._initiate_dijkstra_tables(machine)
@@ -131,10 +140,11 @@ class BasicDijkstraRouting(object):
             edges_to_route.append(edge)
 
         if dest_chips:
-            self._update_all_weights(node_info)
-            self._reset_tables(tables)
-            tables[placement.x, placement.y].activated = True
-            tables[placement.x, placement.y].cost = 0
+            # Start a new search, so all the table entries are out of date
+            self._generation += 1
+            source = self._table_entry(tables, (placement.x, placement.y))
+            source.activated = True
+            source.cost = 0
             self._propagate_costs_until_reached_destinations(
                 tables, node_info, dest_chips, placement.x, placement.y)
 
@@ -181,8 +191,8 @@ class BasicDijkstraRouting(object):
         # Holds all the information about nodes within one full run of
         # Dijkstra's algorithm
         tables = dict()
-        for chip in machine.chips:
-            tables[chip.x, chip.y] = _DijkstraInfo()
+        for order, chip in enumerate(machine.chips):
+            tables[chip.x, chip.y] = _DijkstraInfo(order)
         return tables
 
     def _update_all_weights(self, nodes_info):
@@ -211,17 +221,23 @@ class BasicDijkstraRouting(object):
             if neighbour is not None:
                 nodes_info[key].weights[n] = 1
 
-    @staticmethod
-    def _reset_tables(tables):
-        """ Reset the Dijkstra tables for a new path search
+    def _table_entry(self, tables, key):
+        """ Get an entry of the Dijkstra tables for the current path search.\
+            The tables are never reset as a whole; an entry last used by an\
+            earlier search, as told by its generation, is reset here.
 
         :param tables: the dictionary object for the Dijkstra-tables
         :type tables: dict
-        :rtype: None
-        :raise None: this method does not raise any known exception
+        :param key: the coordinates of the chip
+        :type key: tuple(int, int)
+        :rtype: _DijkstraInfo
         """
-        for key in tables:
-            tables[key] = _DijkstraInfo()
+        entry = tables[key]
+        if entry.generation != self._generation:
+            entry.generation = self._generation
+            entry.activated = False
+            entry.cost = None
+        return entry
 
     def _propagate_costs_until_reached_destinations(
             self, tables, nodes_info, dest_chips, x_source, y_source):
@@ -250,6 +266,11 @@ class BasicDijkstraRouting(object):
 
         current = source
 
+        # The nodes reached but not yet activated, as (cost, order, key);
+        # nodes are not removed when their cost drops, so entries that are
+        # out of date are skipped when they come out
+        frontier = list()
+
         # Iterate only if the destination node hasn't been activated
         while dest_chips_to_find:
             # PROPAGATE!
@@ -263,44 +284,47 @@ class BasicDijkstraRouting(object):
                     # These variables change with every look at a new neighbour
                     self._update_neighbour(
                         tables, neighbour, current,
-                        source, weight)
+                        source, weight, frontier)
 
             # Set the next activated node as the deactivated node with the
             # lowest current cost
-            current = self._minimum(tables)
-            tables[current].activated = True
+            current = self._minimum(tables, frontier)
+            self._table_entry(tables, current).activated = True
             dest_chips_to_find.discard(current)
 
-    @staticmethod
-    def _minimum(tables):
-        # This is the lowest cost across ALL deactivated nodes in the graph.
-        lowest_cost = sys.maxsize
-        lowest = None
-
-        # Find the next node to be activated
-        for key in tables:
-            # Don't continue if the node hasn't even been touched yet
-            if (tables[key].cost is not None and not tables[key].activated
-                    and tables[key].cost < lowest_cost):
-                lowest_cost = tables[key].cost
-                lowest = key
+    def _minimum(self, tables, frontier):
+        """ Remove and return the deactivated node with the lowest cost from\
+            the frontier.  Of nodes with the same cost, the one that comes\
+            first in the machine is chosen.
+
+        :param tables: the dictionary object for the Dijkstra-tables
+        :param frontier: heap of (cost, order, key) of nodes reached
+        :rtype: tuple(int, int)
+        :raise PacmanRoutingException: \
+            If there are no deactivated nodes with costs
+        """
+        while frontier:
+            cost, _, key = heapq.heappop(frontier)
+            entry = self._table_entry(tables, key)
+
+            # Skip nodes that were activated or found cheaper since added
+            if not entry.activated and entry.cost == cost:
+                return key
 
         # If there were no deactivated nodes with costs, but the destination
         # was not reached this iteration, raise an exception
-        if lowest is None:
-            raise PacmanRoutingException(
-                "Destination could not be activated, ending run")
-
-        return int(lowest[0]), int(lowest[1])
+        raise PacmanRoutingException(
+            "Destination could not be activated, ending run")
 
-    @staticmethod
-    def _update_neighbour(tables, neighbour, current, source, weight):
+    def _update_neighbour(
+            self, tables, neighbour, current, source, weight, frontier):
         """ Update the lowest cost for each neighbour_xy of a node
 
         :rtype: None
         :raise PacmanRoutingException: when the algorithm goes to a node that\
             doesn't exist in the machine or the node's cost was set too low.
         """
+        # pylint: disable=too-many-arguments
         neighbour_xy = (neighbour.destination_x, neighbour.destination_y)
         if neighbour_xy not in tables:
             raise PacmanRoutingException(
@@ -308,19 +332,22 @@ class BasicDijkstraRouting(object):
                 " graph: remove non-existent neighbours"
                 .format(neighbour.destination_x, neighbour.destination_y))
 
-        chip_cost = tables[current].cost
-        neighbour_cost = tables[neighbour_xy].cost
+        chip_cost = self._table_entry(tables, current).cost
+        neighbour_entry = self._table_entry(tables, neighbour_xy)
+        neighbour_cost = neighbour_entry.cost
 
         # Only try to update if the neighbour_xy is within the graph and the
         # cost if the node hasn't already been activated and the lowest cost
         # if the new cost is less, or if there is no current cost.
         new_weight = float(chip_cost + weight)
-        if (not tables[neighbour_xy].activated and
+        if (not neighbour_entry.activated and
                 (neighbour_cost is None or new_weight < neighbour_cost)):
             # update Dijkstra table
-            tables[neighbour_xy].cost = new_weight
+            neighbour_entry.cost = new_weight
+            heapq.heappush(
+                frontier, (new_weight, neighbour_entry.order, neighbour_xy))
 
-        if tables[neighbour_xy].cost == 0 and neighbour_xy != source:
+        if neighbour_entry.cost == 0 and neighbour_xy != source:
             raise PacmanRoutingException(
                 "!!!Cost of non-source node ({}, {}) was set to zero!!!"
                 .format(neighbour.destination_x, neighbour.destination_y))
@@ -371,7 +398,7 @@ class BasicDijkstraRouting(object):
                     entry, dest.x, dest.y, partition)
                 prev_entry = entry
 
-        while tables[x, y].cost != 0:
+        while self._table_entry(tables, (x, y)).cost != 0:
             for idx, neighbour in enumerate(nodes_info[x, y].neighbours):
                 if neighbour is not None:
                     n_xy = (neighbour.destination_x, neighbour.destination_y)
@@ -383,7 +410,7 @@ class BasicDijkstraRouting(object):
                             "Tried to trace back to node not in "
                             "graph: remove non-existent neighbours")
 
-                    if tables[n_xy].cost is not None:
+                    if self._table_entry(tables, n_xy).cost is not None:
                         x, y, prev_entry, added = self._create_routing_entry(
                             n_xy, tables, idx, nodes_info, x, y,
                             prev_entry, edge, graph)
@@ -418,8 +445,9 @@ class BasicDijkstraRouting(object):
         made_an_entry = False
 
         neighbour_weight = nodes_info[neighbour_xy].weights[dec_direction]
-        chip_sought_cost = tables[x, y].cost - neighbour_weight
-        neighbours_lowest_cost = tables[neighbour_xy].cost
+        chip_sought_cost = self._table_entry(tables, (x, y)).cost - \
+            neighbour_weight
+        neighbours_lowest_cost = self._table_entry(tables, neighbour_xy).cost
 
         if (neighbours_lowest_cost is not None and
                 self._close_enough(neighbours_lowest_cost, chip_sought_cost)):
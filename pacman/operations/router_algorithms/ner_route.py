@@ -29,6 +29,8 @@ https://github.com/project-rig/rig/blob/master/rig/place_and_route/route/utils.p
 import heapq
 
 from collections import deque
+from multiprocessing import Pool
+from six.moves import zip
 
 from spinn_utilities.progress_bar import ProgressBar
 from pacman.exceptions import MachineHasDisconnectedSubRegion
@@ -40,6 +42,10 @@ from pacman.model.routing_table_by_partition import (
 from .routing_tree import RoutingTree
 
 
+# The machine used by the routing worker processes
+_worker_machine = None
+
+
 def _convert_a_route(
         routing_tables, partition, incoming_processor, incoming_link,
         partition_route):
@@ -52,6 +58,42 @@ def _convert_a_route(
     :param incoming_link: collection of links this link came from
     :param partition_route: algorithm specific format of the route
     """
+    _add_entries(routing_tables, partition, _route_entries(
+        incoming_processor, incoming_link, partition_route))
+
+
+def _add_entries(routing_tables, partition, entries):
+    """
+    Adds the entries of a route to the routing_tables.
+    :param routing_tables:  spinnaker format routing tables
+    :param partition: Partition this route applices to
+    :param entries: The entries, as from :py:func:`_route_entries`
+    """
+    for x, y, link_ids, processor_ids, incoming_processor, incoming_link in \
+            entries:
+        entry = MulticastRoutingTableByPartitionEntry(
+            link_ids, processor_ids, incoming_processor, incoming_link)
+        routing_tables.add_path_entry(entry, x, y, partition)
+
+
+def _route_entries(incoming_processor, incoming_link, partition_route):
+    """
+    Converts the algorithm specific partition_route to the details of the\
+    entries to add to the routing tables, in the order to add them.
+    :param incoming_processor: collections of processors this link came from
+    :param incoming_link: collection of links this link came from
+    :param partition_route: algorithm specific format of the route
+    :return: list of (x, y, link_ids, processor_ids, incoming_processor,\
+        incoming_link)
+    """
+    entries = list()
+    _add_route_entries(
+        entries, incoming_processor, incoming_link, partition_route)
+    return entries
+
+
+def _add_route_entries(
+        entries, incoming_processor, incoming_link, partition_route):
     x, y = partition_route.chip
 
     next_hops = list()
@@ -72,13 +114,11 @@ def _convert_a_route(
                     next_incoming_link = (link + 3) % 6
                 next_hops.append((next_hop, next_incoming_link))
 
-    entry = MulticastRoutingTableByPartitionEntry(
-        link_ids, processor_ids, incoming_processor, incoming_link)
-    routing_tables.add_path_entry(entry, x, y, partition)
+    entries.append(
+        (x, y, link_ids, processor_ids, incoming_processor, incoming_link))
 
     for next_hop, next_incoming_link in next_hops:
-        _convert_a_route(
-            routing_tables, partition, None, next_incoming_link, next_hop)
+        _add_route_entries(entries, None, next_incoming_link, next_hop)
 
 
 def _ner_net(source, destinations, machine):
@@ -105,31 +145,19 @@ def _ner_net(source, destinations, machine):
     # Map from (x, y) to RoutingTree objects
     route = {source: RoutingTree(source)}
 
+    # Map from (x, y) to the order in which the node was added to the route
+    route_order = {source: 0}
+
     # Handle each destination, sorted by distance from the source, closest
     # first.
     sorted_dest = sorted(
         destinations, key=(lambda destination: machine.get_vector_length(
                 source, destination)))
     for destination in sorted_dest:
-        # We shall attempt to find our nearest neighbouring placed node.
-        neighbour = None
-
         # Try to find a nearby (within radius hops) node in the routing tree
         # that we can route to (falling back on just routing to the source).
-        #
-        # This implementation scans the list of all route nodes created so far
-        # and finds the closest node which is < radius hops
-        # (falling back on the origin if no node is closer than radius hops).
-
-        neighbour = None
-        neighbour_distance = None
-        for candidate_neighbour in route:
-            distance = machine.get_vector_length(
-                candidate_neighbour, destination)
-            if distance <= radius and (
-                    neighbour is None or distance < neighbour_distance):
-                neighbour = candidate_neighbour
-                neighbour_distance = distance
+        neighbour = _nearest_route_node(
+            destination, route, route_order, radius, machine)
 
         # Fall back on routing directly to the source if no nodes within radius
         # hops of the destination was found.
@@ -162,6 +190,7 @@ def _ner_net(source, destinations, machine):
         for direction, (x, y) in ldf:
             this_node = RoutingTree((x, y))
             route[(x, y)] = this_node
+            route_order[(x, y)] = len(route_order)
 
             last_node.append_child((direction, this_node))
             last_node = this_node
@@ -169,6 +198,65 @@ def _ner_net(source, destinations, machine):
     return (route[source], route)
 
 
+def _nearest_route_node(destination, route, route_order, radius, machine):
+    """ Find the closest node of a route to a destination that is within\
+        radius hops; where several nodes are equally close, the one added to\
+        the route first is found.
+
+    While the route has fewer nodes than there are chips within radius hops,\
+    all the nodes of the route are checked.  After that, the chips around the\
+    destination are checked in rings of increasing distance, so only the\
+    chips up to the distance of the nearest node are looked at.
+
+    :param destination: (x, y)
+        The coordinates of the destination.
+    :param route: {(x, y): :py:class:`RoutingTree`, ...}
+        The nodes of the route.
+    :param route_order: {(x, y): int, ...}
+        The order in which each node was added to the route.
+    :param radius: The maximum distance to look for a node.
+    :param machine: machine for which routes are being generated
+    :return: (x, y) of the nearest node, or None if there is none in radius
+    """
+    if len(route) <= 3 * radius * (radius + 1) + 1:
+        neighbour = None
+        neighbour_distance = None
+        for candidate_neighbour in route:
+            distance = machine.get_vector_length(
+                candidate_neighbour, destination)
+            if distance <= radius and (
+                    neighbour is None or distance < neighbour_distance):
+                neighbour = candidate_neighbour
+                neighbour_distance = distance
+        return neighbour
+
+    if destination in route:
+        return destination
+
+    # The ring at distance d starts d hops South West of the destination, and
+    # goes d hops in each direction in turn.  With wrap-arounds a ring might
+    # include chips that are closer than d; those were already checked in an
+    # earlier ring, so any node found in a ring is exactly d hops away.
+    # (Link 4 is South West; links 0 to 5 go round a ring anticlockwise)
+    corner = destination
+    for distance in range(1, radius + 1):
+        corner = machine.xy_over_link(corner[0], corner[1], 4)
+        x, y = corner
+        neighbour = None
+        neighbour_order = None
+        for direction in range(6):
+            for _ in range(distance):
+                x, y = machine.xy_over_link(x, y, direction)
+                order = route_order.get((x, y))
+                if order is not None and (
+                        neighbour is None or order < neighbour_order):
+                    neighbour = (x, y)
+                    neighbour_order = order
+        if neighbour is not None:
+            return neighbour
+    return None
+
+
 def _is_linked(source, target, direction, machine):
     s_chip = machine.get_chip_at(source[0], source[1])
     if s_chip is None:
@@ -448,8 +536,24 @@ def _do_route(source_vertex, post_vertexes, machine, placements):
     :return:
     """
     source_xy = _vertex_xy(source_vertex, placements, machine)
-    destinations = set(_vertex_xy(post_vertex, placements, machine)
-                       for post_vertex in post_vertexes)
+    sinks = [(_vertex_xy(post_vertex, placements, machine),
+              _sink_route(post_vertex, machine, placements), post_vertex)
+             for post_vertex in post_vertexes]
+    return _route_sinks(source_xy, sinks, machine)
+
+
+def _route_sinks(source_xy, sinks, machine):
+    """
+    Generates the routing tree of a net from its source to its sinks.
+
+    :param source_xy: (x, y) of the source of the net
+    :param sinks: [((x, y), route, sink), ...]
+        The location of each sink, the route to the sink from its chip and\
+        the sink itself
+    :param machine:
+    :return: :py:class:`RoutingTree`
+    """
+    destinations = set(xy for xy, _, _ in sinks)
     # Generate routing tree (assuming a perfect machine)
     root, lookup = _ner_net(source_xy, destinations, machine)
 
@@ -458,26 +562,58 @@ def _do_route(source_vertex, post_vertexes, machine, placements):
         root, lookup = _avoid_dead_links(root, machine)
 
     # Add the sinks in the net to the RoutingTree
-    for post_vertex in post_vertexes:
-        tree_node = lookup[_vertex_xy(post_vertex, placements, machine)]
-        if isinstance(post_vertex, AbstractVirtual):
-            # Sinks with route-to-endpoint constraints must be routed
-            # in the according directions.
-            route = _route_to_endpoint(post_vertex, machine)
-            tree_node.append_child((route, post_vertex))
-        else:
-            core = placements.get_placement_of_vertex(post_vertex).p
-            if core is not None:
-                #  Offset the core by 6 as first 6 are the links
-                tree_node.append_child((core + 6, post_vertex))
-            else:
-                # Sinks without that resource are simply included without
-                # an associated route
-                tree_node.append_child((None, post_vertex))
+    for xy, route, sink in sinks:
+        lookup[xy].append_child((route, sink))
 
     return root
 
 
+def _sink_route(post_vertex, machine, placements):
+    """
+    Get the route from the chip of a sink to the sink.
+
+    :return: The link or core (offset by 6) of the sink, or None if the sink\
+        has neither
+    :rtype: int or None
+    """
+    if isinstance(post_vertex, AbstractVirtual):
+        # Sinks with route-to-endpoint constraints must be routed
+        # in the according directions.
+        return _route_to_endpoint(post_vertex, machine)
+    core = placements.get_placement_of_vertex(post_vertex).p
+    if core is not None:
+        #  Offset the core by 6 as first 6 are the links
+        return core + 6
+    # Sinks without that resource are simply included without
+    # an associated route
+    return None
+
+
+def _init_worker(machine):
+    """
+    Sets up a routing worker process.
+
+    :param machine: The machine to route on in this process
+    """
+    global _worker_machine  # pylint: disable=global-statement
+    _worker_machine = machine
+
+
+def _route_in_worker(net):
+    """
+    Routes a net in a routing worker process.
+
+    :param net: (source (x, y), [((x, y), route), ...])
+        The source of the net and the location and route of each sink
+    :return: The entries of the route, as from :py:func:`_route_entries`
+    """
+    source_xy, sinks = net
+    root = _route_sinks(
+        source_xy, [(xy, route, None) for xy, route in sinks],
+        _worker_machine)
+    return _route_entries(0, None, root)
+
+
 def _vertex_xy(vertex, placements, machine):
     if not isinstance(vertex, AbstractVirtual):
         placement = placements.get_placement_of_vertex(vertex)
@@ -565,14 +701,26 @@ class NerRoute(object):
 
     __slots__ = []
 
-    def __call__(self, machine_graph, machine, placements):
+    # The number of nets sent to a worker process at a time
+    CHUNK_SIZE = 64
+
+    def __call__(self, machine_graph, machine, placements, n_processes=None):
         """
 
         :param machine_graph:
         :param machine:
         :param placements:  pacman.model.placements.placements.py
+        :param n_processes: \
+            The number of processes to route in; if more than one, the nets\
+            are routed in parallel in a pool of processes.  The result is the\
+            same whatever the number of processes.
+        :type n_processes: int or None
         :return:
         """
+        if n_processes is not None and n_processes > 1:
+            return self._route_in_parallel(
+                machine_graph, machine, placements, n_processes)
+
         routing_tables = MulticastRoutingTableByPartition()
 
         progress_bar = ProgressBar(len(machine_graph.vertices), "Routing")
@@ -593,3 +741,36 @@ class NerRoute(object):
         progress_bar.end()
 
         return routing_tables
+
+    def _route_in_parallel(
+            self, machine_graph, machine, placements, n_processes):
+        """ Route the nets in a pool of processes.  Only the locations of the\
+            source and sinks of each net are sent to the workers, and the\
+            entries of each route are sent back; these are added to the\
+            tables in the same order as when routing in one process.
+        """
+        partitions = list()
+        nets = list()
+        for source_vertex in machine_graph.vertices:
+            for partition in machine_graph.\
+                    get_outgoing_edge_partitions_starting_at_vertex(
+                        source_vertex):
+                if partition.traffic_type == EdgeTrafficType.MULTICAST:
+                    partitions.append(partition)
+                    nets.append((
+                        _vertex_xy(source_vertex, placements, machine),
+                        [(_vertex_xy(edge.post_vertex, placements, machine),
+                          _sink_route(edge.post_vertex, machine, placements))
+                         for edge in partition.edges]))
+
+        routing_tables = MulticastRoutingTableByPartition()
+        progress_bar = ProgressBar(len(partitions), "Routing")
+        pool = Pool(n_processes, _init_worker, (machine, ))
+        try:
+            for partition, entries in progress_bar.over(zip(
+                    partitions, pool.imap(
+                        _route_in_worker, nets, self.CHUNK_SIZE))):
+                _add_entries(routing_tables, partition, entries)
+        finally:
+            pool.terminate()
+        return routing_tables
@@ -19,6 +19,8 @@ based on https://github.com/project-rig/
 
 from abc import abstractmethod
 import logging
+from multiprocessing import Pool
+import numpy
 from spinn_utilities.progress_bar import ProgressBar
 from pacman.model.routing_tables import (
     MulticastRoutingTable, MulticastRoutingTables)
@@ -26,11 +28,42 @@ from pacman.exceptions import MinimisationFailedError
 
 logger = logging.getLogger(__name__)
 
+# The compressor of a compressing worker process
+_worker_compressor = None
+
+
+def _init_worker(compressor):
+    """
+    Sets up a compressing worker process.
+
+    :param compressor: The compressor to compress with in this process
+    """
+    global _worker_compressor  # pylint: disable=global-statement
+    _worker_compressor = compressor
+
+
+def _compress_in_worker(table):
+    """
+    Compresses a table in a compressing worker process.
+
+    :param table: The table to compress
+    :type table: ~pacman.model.routing_tables.MulticastRoutingTable
+    :return: The compressed table, and the problems found while compressing
+    :rtype: ~pacman.model.routing_tables.MulticastRoutingTable, str
+    """
+    # pylint: disable=protected-access
+    _worker_compressor._problems = ""
+    compressed_table = _worker_compressor._compressed_table(table)
+    return compressed_table, _worker_compressor._problems
+
 
 class AbstractCompressor(object):
 
     MAX_SUPPORTED_LENGTH = 1023
 
+    # The number of tables sent to a worker process at a time
+    CHUNK_SIZE = 1
+
     __slots__ = [
         # Max length below which the algorithm should stop compressing
         "_target_length",
@@ -38,16 +71,34 @@ class AbstractCompressor(object):
         "_problems",
         # Flag to say if the results can be order dependent
         "_ordered",
+        # The number of processes to compress in
+        "_n_processes",
     ]
 
     def __init__(self, ordered=True):
         self._ordered = ordered
+        self._n_processes = None
 
-    def __call__(self, router_tables, target_length=None):
+    def __call__(self, router_tables, target_length=None, n_processes=None):
+        """
+        :param router_tables: Routing tables
+        :type router_tables: \
+            ~pacman.model.routing_tables.MulticastRoutingTables
+        :param target_length: \
+            The length below which a table need not be compressed further
+        :type target_length: int or None
+        :param n_processes: \
+            The number of processes to compress in; if more than one, the\
+            tables are compressed in parallel in a pool of processes.  The\
+            result is the same whatever the number of processes.
+        :type n_processes: int or None
+        :return: The compressed routing tables
+        """
         if target_length is None:
             self._target_length = 0  # Compress as much as you can
         else:
             self._target_length = target_length
+        self._n_processes = n_processes
         # create progress bar
         progress = ProgressBar(
             router_tables.routing_tables,
@@ -86,6 +137,25 @@ class AbstractCompressor(object):
         """
         return (key_a & mask_b) == (key_b & mask_a)
 
+    @staticmethod
+    def intersect_all(keys, masks, key, mask):
+        """
+        Return which of many key-mask pairs intersect a key-mask pair, as\
+        :py:meth:`intersect` does for one pair, in one operation.
+
+        :param keys: The keys of the key-mask pairs to check
+        :type keys: ~numpy.ndarray(uint32)
+        :param masks: The masks of the key-mask pairs to check
+        :type masks: ~numpy.ndarray(uint32)
+        :param key: The key of the key-mask pair to check against
+        :type key: int
+        :param mask: The mask of the key-mask pair to check against
+        :type mask: int
+        :return: True for each key-mask pair that intersects, else False
+        :rtype: ~numpy.ndarray(bool)
+        """
+        return (keys & numpy.uint32(mask)) == (masks & numpy.uint32(key))
+
     def merge(self, entry1, entry2):
         """
         Merges two entries/triples into one that covers both
@@ -128,20 +198,13 @@ class AbstractCompressor(object):
         """
         compressed_tables = MulticastRoutingTables()
         self._problems = ""
-        for table in progress.over(router_tables.routing_tables):
-            if table.number_of_entries < self._target_length:
+        for table, new_table in progress.over(
+                self._compress_each_table(router_tables.routing_tables)):
+            if new_table is None:
                 new_table = table
-            else:
-                compressed_table = self.compress_table(table)
-
-                new_table = MulticastRoutingTable(table.x, table.y)
-
-                for entry in compressed_table:
-                    new_table.add_multicast_routing_entry(
-                        entry.to_MulticastRoutingEntry())
-                if new_table.number_of_entries > self.MAX_SUPPORTED_LENGTH:
-                    self._problems += "(x:{},y:{})={} ".format(
-                        new_table.x, new_table.y, new_table.number_of_entries)
+            elif new_table.number_of_entries > self.MAX_SUPPORTED_LENGTH:
+                self._problems += "(x:{},y:{})={} ".format(
+                    new_table.x, new_table.y, new_table.number_of_entries)
 
             compressed_tables.add_routing_table(new_table)
 
@@ -154,6 +217,67 @@ class AbstractCompressor(object):
                 logger.warning(self._problems)
         return compressed_tables
 
+    def _compress_each_table(self, routing_tables):
+        """ Compress each of the tables that is not already small enough.
+
+        :param routing_tables: The tables to compress
+        :type routing_tables: \
+            iterable(~pacman.model.routing_tables.MulticastRoutingTable)
+        :return: \
+            Each table with its compressed table, or with None if it is\
+            already small enough, in the order of the tables given
+        :rtype: iterable(tuple(\
+            ~pacman.model.routing_tables.MulticastRoutingTable,\
+            ~pacman.model.routing_tables.MulticastRoutingTable))
+        """
+        if self._n_processes is not None and self._n_processes > 1:
+            for item in self._compress_in_parallel(routing_tables):
+                yield item
+            return
+
+        for table in routing_tables:
+            if table.number_of_entries < self._target_length:
+                yield table, None
+            else:
+                yield table, self._compressed_table(table)
+
+    def _compressed_table(self, table):
+        """ Compress a table into a new table for the same chip.
+
+        :param table: The table to compress
+        :type table: ~pacman.model.routing_tables.MulticastRoutingTable
+        :rtype: ~pacman.model.routing_tables.MulticastRoutingTable
+        """
+        new_table = MulticastRoutingTable(table.x, table.y)
+        for entry in self.compress_table(table):
+            new_table.add_entry(
+                entry.key, entry.mask, entry.spinnaker_route,
+                entry.defaultable)
+        return new_table
+
+    def _compress_in_parallel(self, routing_tables):
+        """ Compress the tables in a pool of processes.  The tables are sent\
+            to the workers, and the compressed tables sent back along with any\
+            problems found, as the columns of their entries; the results come\
+            back in the same order as the tables.
+        """
+        tables = list(routing_tables)
+        pool = Pool(self._n_processes, _init_worker, (self, ))
+        try:
+            compressed = pool.imap(_compress_in_worker, (
+                table for table in tables
+                if table.number_of_entries >= self._target_length),
+                self.CHUNK_SIZE)
+            for table in tables:
+                if table.number_of_entries < self._target_length:
+                    yield table, None
+                    continue
+                compressed_table, problems = next(compressed)
+                self._problems += problems
+                yield table, compressed_table
+        finally:
+            pool.terminate()
+
     @property
     def ordered(self):
         return self._ordered
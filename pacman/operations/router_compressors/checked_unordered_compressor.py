@@ -21,12 +21,13 @@ from .unordered_compressor import UnorderedCompressor
 class CheckedUnorderedCompressor(UnorderedCompressor):
     __slots__ = []
 
-    def __call__(self, router_tables, target_length=None):
+    def __call__(self, router_tables, target_length=None, n_processes=None):
         if target_length is None:
             # Stop when enought
             self._target_length = self.MAX_SUPPORTED_LENGTH
         else:
             self._target_length = target_length
+        self._n_processes = n_processes
         # create progress bar
         progress = ProgressBar(
             router_tables.routing_tables, "Compressing routing Tables")
@@ -14,6 +14,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 from collections import defaultdict
+import numpy
 from pacman.exceptions import MinimisationFailedError
 
 from .abstract_compressor import AbstractCompressor
@@ -24,33 +25,43 @@ class ClashCompressor(AbstractCompressor):
 
     __slots__ = [
         "_all_entries",
-        "_max_clashes"
+        "_max_clashes",
+        # The entries with other routes, in the order they are checked
+        "_check_entries",
+        # The keys of the entries to check, for checking in one go
+        "_check_keys",
+        # The masks of the entries to check, matching _check_keys
+        "_check_masks"
     ]
 
     def find_merge(self, an_entry, route_entries):
         for another in route_entries:
             m_key, m_mask, defaultable = self.merge(an_entry, another)
-            clashers = []
-            for route in self._all_entries:
-                for check in self._all_entries[route]:
-                    if self.intersect(check.key, check.mask, m_key, m_mask):
-                        if len(clashers) >= self._max_clashes:
-                            break
-                        else:
-                            clashers.append(check)
-                if len(clashers) >= self._max_clashes:
-                    break
+            clashers = numpy.flatnonzero(self.intersect_all(
+                self._check_keys, self._check_masks, m_key, m_mask))
             if len(clashers) == 0:
                 route_entries.remove(another)
                 return Entry(
                     m_key, m_mask, defaultable, an_entry.spinnaker_route)
-            if len(clashers) <= self._max_clashes:
-                for entry in clashers:
-                    entry.clashes += 1
+            for index in clashers[:self._max_clashes]:
+                self._check_entries[index].clashes += 1
         return None
 
+    def _set_check_entries(self):
+        """ Sets the entries with other routes, which merges must not\
+            intersect, and their keys and masks as arrays
+        """
+        self._check_entries = [
+            entry for route in self._all_entries
+            for entry in self._all_entries[route]]
+        self._check_keys = numpy.array(
+            [entry.key for entry in self._check_entries], dtype="uint32")
+        self._check_masks = numpy.array(
+            [entry.mask for entry in self._check_entries], dtype="uint32")
+
     def compress_by_route(self, route_entries):
         results = []
+        self._set_check_entries()
         while len(route_entries) > 1:
             an_entry = route_entries.pop()
             merged = self.find_merge(an_entry, route_entries)
@@ -67,8 +78,7 @@ class ClashCompressor(AbstractCompressor):
     def compress_ignore_clashers(self, router_table, top_entries):
         while True:
             self._all_entries = defaultdict(list)
-            for mcr_entry in router_table.multicast_routing_entries:
-                entry = Entry.from_MulticastRoutingEntry(mcr_entry)
+            for entry in Entry.from_MulticastRoutingTable(router_table):
                 if entry not in top_entries:
                     self._all_entries[entry.spinnaker_route].append(entry)
 
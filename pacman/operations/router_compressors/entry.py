@@ -13,6 +13,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from six.moves import zip
 from spinn_machine import MulticastRoutingEntry
 
 
@@ -41,6 +42,19 @@ class Entry(object):
             mre._routing_entry_key, mre._mask, mre._defaultable,
             mre._spinnaker_route)
 
+    @staticmethod
+    def from_MulticastRoutingTable(router_table):
+        """ Get the entries of a table, made directly from its columns
+
+        :param router_table: The table to get the entries of
+        :type router_table: ~pacman.model.routing_tables.MulticastRoutingTable
+        :rtype: list(Entry)
+        """
+        return [Entry(key, mask, bool(defaultable), spinnaker_route)
+                for key, mask, defaultable, spinnaker_route in zip(
+                    router_table.keys, router_table.masks,
+                    router_table.defaultables, router_table.spinnaker_routes)]
+
     def to_MulticastRoutingEntry(self):
         return MulticastRoutingEntry(
             self.key, self.mask, defaultable=self.defaultable,
@@ -142,7 +142,10 @@ As a heuristic:
 based on
 https://github.com/project-rig/rig/blob/master/rig/routing_table/ordered_covering.py
 """
-from pacman.operations.router_compressors import Entry
+import numpy
+from six import iteritems
+from spinn_utilities.ordered_default_dict import DefaultOrderedDict
+from pacman.operations.router_compressors import AbstractCompressor, Entry
 from pacman.exceptions import MinimisationFailedError
 from .remove_default_routes import \
     minimise as remove_default_routes
@@ -242,9 +245,13 @@ def ordered_covering(routing_table, target_length, aliases=None,
         key=lambda entry: _get_generality(entry.key, entry.mask)
     )
 
+    # What is known about the merges of the table, kept between iterations
+    # as applying a merge only changes some of it
+    merge_cache = _MergeCache(routing_table, aliases)
+
     while target_length is None or len(routing_table) > target_length:
         # Get the best merge
-        merge = _get_best_merge(routing_table, aliases)
+        merge = _get_best_merge(routing_table, aliases, merge_cache)
 
         # If there is no merge then stop
         if merge.goodness <= 0:
@@ -252,7 +259,7 @@ def ordered_covering(routing_table, target_length, aliases=None,
 
         # Otherwise apply the merge, this returns a new routing table and a new
         # aliases dictionary.
-        routing_table, aliases = merge.apply(aliases)
+        routing_table, aliases = merge_cache.apply(merge, aliases)
 
     # If the table is still too big then raise an error
     if (not no_raise and
@@ -277,11 +284,11 @@ def _get_generality(key, mask):
         >>> _get_generality(0xffffffff, 0xffffffff)
         0
     """
-    xs = (~key) & (~mask)
-    return sum(1 for i in range(32) if xs & (1 << i))
+    xs = (~key) & (~mask) & 0xFFFFFFFF
+    return bin(xs).count("1")
 
 
-def _get_best_merge(routing_table, aliases):
+def _get_best_merge(routing_table, aliases, merge_cache=None):
     """
     Inspect all possible merges for the routing table and return the merge
     which would combine the greatest number of entries.
@@ -296,30 +303,65 @@ def _get_best_merge(routing_table, aliases):
         table. This should be supplied when using this method to update an
         already minimised table.
     :type aliases: dict((int, int): set((int, int))
+    :param merge_cache: \
+        What is known about the merges of this table from previous calls, \
+        which is updated with any merges refined by this call.
+    :type merge_cache: py:class:`~._MergeCache` or None
     :return: Merge
     :rtype py:class:`~._Merge`
     """
+    if merge_cache is None:
+        merge_cache = _MergeCache(routing_table, aliases)
+
     # Create an empty merge to start with
     best_merge = _Merge(routing_table)
+    best_entries = None
     best_goodness = 0
 
     # Look through every merge, discarding those that are no better than the
     # best we currently know about.
-    for merge in _get_all_merges(routing_table):
+    for route, entries in iteritems(_get_all_merges(routing_table)):
         # If the merge isn't sufficiently good ignore it and move on
-        if merge.goodness <= best_goodness:
+        if len(entries) - 1 <= best_goodness:
             continue
 
+        # If the merge is known not to refine to a better one move on, and
+        # if it is known to be better remember the entries it refines to
+        cached = merge_cache.merges.get(route)
+        if cached is not None:
+            _, _, goodness, refined_ids = cached
+            if goodness <= best_goodness:
+                continue
+            if refined_ids is not None:
+                best_entries = [i for i in entries
+                                if id(routing_table[i]) in refined_ids]
+                best_goodness = goodness
+                continue
+
         # After the merge refines itself to remove entries which would either
         # be aliased under other entries or entries which would cause the
         # aliasing of other entries we check if it is better than the current
-        # best merge and reject it if it isn't.
-        merge = _refine_merge(merge, aliases, min_goodness=best_goodness)
-        if merge.goodness > best_goodness:
+        # best merge and reject it if it isn't; either way we remember what
+        # we learned about it.
+        merge = _Merge(routing_table, entries)
+        refined = _refine_merge(
+            merge, min_goodness=best_goodness, merge_cache=merge_cache)
+        if refined.goodness > best_goodness:
             # The merge we now have a reference to is better than the best
             # merge that we've previously encountered.
-            best_merge = merge
-            best_goodness = merge.goodness
+            merge_cache.merges[route] = (
+                merge.key, merge.mask, refined.goodness,
+                set(id(routing_table[i]) for i in refined.entries))
+            best_merge = refined
+            best_entries = None
+            best_goodness = refined.goodness
+        else:
+            merge_cache.merges[route] = (
+                merge.key, merge.mask, best_goodness, None)
+
+    # If the best merge was found in the cache, make it against this table
+    if best_entries is not None:
+        best_merge = _Merge(routing_table, best_entries)
 
     # Return the best merge and the best goodness for the calling method
     return best_merge
@@ -330,30 +372,18 @@ def _get_all_merges(routing_table):
 
     :param routing_table: Routing entries to be merged.
     :type routing_table: Entry
-    :rtype: py:class:`~.Merge`
+    :return: \
+        The indices of the entries with each route that has more than one \
+        entry, in order of the first entry with each route.
+    :rtype: dict(int, list(int))
     """
-    # Memorise entries that have been considered as part of a merge
-    considered_entries = set()
-
+    merges = DefaultOrderedDict(list)
     for i, entry in enumerate(routing_table):
-        # If we've already considered this entry then skip
-        if i in considered_entries:
-            continue
-
-        # Construct a merge by including other routing table entries below this
-        # one which have equivalent routes.
-        merge = set([i])
-        merge.update(
-            j for j, other_entry in enumerate(routing_table[i+1:], start=i+1)
-            if entry.spinnaker_route == other_entry.spinnaker_route
-        )
-
-        # Mark all these entries as considered
-        considered_entries.update(merge)
-
-        # If the merge contains multiple entries then yield it
-        if len(merge) > 1:
-            yield _Merge(routing_table, merge)
+        merges[entry.spinnaker_route].append(i)
+    for route in [route for route, entries in iteritems(merges)
+                  if len(entries) < 2]:
+        del merges[route]
+    return merges
 
 
 def _get_insertion_index(routing_table, generality):
@@ -512,44 +542,250 @@ class _Merge(object):
         return new_table, aliases
 
 
-def _refine_merge(merge, aliases, min_goodness):
+class _MergeCache(object):
+    """ What is known about the merges of a routing table, which is kept up \
+        to date as merges are applied to the table rather than being worked \
+        out again for each merge.
+    """
+
+    __slots__ = [
+        # The routing table as it is after the merges applied so far
+        # list(Entry)
+        "_routing_table",
+
+        # The index in the routing table of each entry, by id of the entry
+        # dict(int, int)
+        "_indices",
+
+        # The keys and masks of the entries in the routing table
+        # numpy.ndarray(uint32)
+        "_keys",
+        # numpy.ndarray(uint32)
+        "_masks",
+
+        # The keys and masks which each entry in the routing table stands
+        # for (its aliases, or itself if it has none), in table order
+        # numpy.ndarray(uint32)
+        "_covered_keys",
+        # numpy.ndarray(uint32)
+        "_covered_masks",
+
+        # Where the keys and masks which each entry stands for start in
+        # _covered_keys and _covered_masks, with the total number at the end
+        # list(int)
+        "_covered_starts",
+
+        # The first entry below each entry which intersects it, or None if
+        # there is no such entry, by id of the entry; only those entries
+        # whose intersecting entry has been looked for are included
+        # dict(int, Entry or None)
+        "_intersecting",
+
+        # The key and mask of the merge of all the entries with each route,
+        # the goodness of that merge once refined, and the ids of the entries
+        # left in the refined merge (or None if the goodness is only an upper
+        # bound), by route; only those routes whose merges are unaffected
+        # by the merges applied since they were refined are included
+        # dict(int, (int, int, int, set(int) or None))
+        "merges"]
+
+    def __init__(self, routing_table, aliases):
+        """
+        :param routing_table: The routing table before any merges
+        :type routing_table: list(Entry)
+        :param aliases: The aliases of the routing table
+        :type aliases: dict((int, int): set((int, int))
+        """
+        self._intersecting = dict()
+        self.merges = dict()
+        self._set_routing_table(routing_table, aliases)
+
+    def _set_routing_table(self, routing_table, aliases):
+        self._routing_table = routing_table
+        self._indices = {id(entry): i for i, entry in enumerate(routing_table)}
+        self._keys = numpy.array(
+            [entry.key for entry in routing_table], dtype="uint32")
+        self._masks = numpy.array(
+            [entry.mask for entry in routing_table], dtype="uint32")
+
+        covered_keys = list()
+        covered_masks = list()
+        self._covered_starts = [0]
+        for entry in routing_table:
+            key_mask = (entry.key, entry.mask)
+            for key, mask in aliases.get(key_mask, [key_mask]):
+                covered_keys.append(key)
+                covered_masks.append(mask)
+            self._covered_starts.append(len(covered_keys))
+        self._covered_keys = numpy.array(covered_keys, dtype="uint32")
+        self._covered_masks = numpy.array(covered_masks, dtype="uint32")
+
+    def first_intersecting(self, index):
+        """ Get the index of the first entry below an entry in the routing \
+            table which intersects it.
+
+        :param index: The index of the entry in the routing table
+        :type index: int
+        :return: \
+            The index of the intersecting entry, or the length of the table \
+            if there is no such entry
+        :rtype: int
+        """
+        entry = self._routing_table[index]
+        if id(entry) in self._intersecting:
+            other = self._intersecting[id(entry)]
+        else:
+            below = numpy.flatnonzero(AbstractCompressor.intersect_all(
+                self._keys[index + 1:], self._masks[index + 1:],
+                entry.key, entry.mask))
+            other = None
+            if len(below):
+                other = self._routing_table[index + 1 + int(below[0])]
+            self._intersecting[id(entry)] = other
+        if other is None:
+            return len(self._routing_table)
+        return self._indices[id(other)]
+
+    def keys_and_masks(self, indices):
+        """ Get the keys and masks of some of the entries in the routing table.
+
+        :param indices: The indices of the entries in the routing table
+        :type indices: iterable(int)
+        :return: The indices in ascending order, and the keys and masks of \
+            the entries at them
+        :rtype: (~numpy.ndarray(int), ~numpy.ndarray(uint32), \
+            ~numpy.ndarray(uint32))
+        """
+        indices = numpy.array(sorted(indices), dtype=int)
+        return indices, self._keys[indices], self._masks[indices]
+
+    def covered_keys_and_masks(self, merge):
+        """ Get the keys and masks which would be covered by the entry \
+            resulting from a merge.
+
+        :param merge: The merge, made against the current table
+        :type merge: py:class:`~._Merge`
+        :return: The keys and masks of the entries below the insertion index \
+            of the merge (or of their aliases) which the merge intersects
+        :rtype: (~numpy.ndarray(uint32), ~numpy.ndarray(uint32))
+        """
+        start = self._covered_starts[merge.insertion_index]
+        keys = self._covered_keys[start:]
+        masks = self._covered_masks[start:]
+        covered = AbstractCompressor.intersect_all(
+            keys, masks, merge.key, merge.mask)
+        return keys[covered], masks[covered]
+
+    def apply(self, merge, aliases):
+        """ Apply a merge to the routing table, updating what is known.
+
+        :param merge: The merge to apply, made against the current table
+        :type merge: py:class:`~._Merge`
+        :param aliases: The aliases of the current table
+        :type aliases: dict((int, int): set((int, int))
+        :return: The new routing table and the new aliases dictionary
+        :rtype: list(Entry), dict((int, int): set((int, int))
+        """
+        routing_table, new_aliases = merge.apply(aliases)
+        removed = set(id(self._routing_table[i]) for i in merge.entries)
+        position = merge.insertion_index - sum(
+            1 for i in merge.entries if i < merge.insertion_index)
+        new_entry = routing_table[position]
+        self._set_routing_table(routing_table, new_aliases)
+
+        # A merge is refined only against the entries (and their aliases)
+        # that intersect the merge of all the entries with its route.
+        # Applying a merge only removes entries of its route and adds an entry
+        # whose aliases cover them, so only the merges of its route and those
+        # which intersect the new entry or its aliases (including any aliases
+        # it replaces) can have changed.
+        self.merges.pop(new_entry.spinnaker_route, None)
+        key_mask = (new_entry.key, new_entry.mask)
+        changed = [key_mask]
+        changed.extend(new_aliases[key_mask])
+        changed.extend(aliases.get(key_mask, ()))
+        key, mask = _cover(changed)
+        for route in [route for route, (other_key, other_mask, _, _) in
+                      iteritems(self.merges)
+                      if intersect(key, mask, other_key, other_mask)]:
+            del self.merges[route]
+
+        # Forget the intersecting entries of the removed entries, and of any
+        # entry intersected first by a removed entry; the new entry might now
+        # be the first intersecting entry of entries above it
+        for entry_id in removed:
+            self._intersecting.pop(entry_id, None)
+        for entry in routing_table[:position]:
+            if id(entry) not in self._intersecting:
+                continue
+            other = self._intersecting[id(entry)]
+            if other is not None and id(other) in removed:
+                del self._intersecting[id(entry)]
+            elif ((other is None or self._indices[id(other)] > position) and
+                    intersect(entry.key, entry.mask,
+                              new_entry.key, new_entry.mask)):
+                self._intersecting[id(entry)] = new_entry
+        for entry in routing_table[position + 1:]:
+            other = self._intersecting.get(id(entry))
+            if other is not None and id(other) in removed:
+                del self._intersecting[id(entry)]
+
+        return routing_table, new_aliases
+
+
+def _cover(keys_and_masks):
+    """ Get the most specific key and mask which covers all of the given \
+        keys and masks.
+
+    :param keys_and_masks: The keys and masks to cover
+    :type keys_and_masks: iterable((int, int))
+    :rtype: (int, int)
+    """
+    any_ones = 0x00000000  # Wherever there is a 1 in *any* of the keys
+    all_ones = 0xffffffff  # ... 1 in *all* of the keys
+    all_selected = 0xffffffff  # ... 1 in *all* of the masks
+    for key, mask in keys_and_masks:
+        any_ones |= key
+        all_ones &= key
+        all_selected &= mask
+    mask = all_selected & (any_ones ^ ~all_ones)
+    return all_ones & mask, mask
+
+
+def _refine_merge(merge, min_goodness, merge_cache):
     """ Remove entries from a merge to generate a valid merge which may be
     applied to the routing table.
 
     :param merge:  Initial merge to refine.
     :type merge: py:class:`~_Merge`
-    :param aliases:
-        Dictionary of which keys and masks in the routing table are
-        combinations of other (now removed) keys and masks; this allows us to
-        consider only the keys and masks the user actually cares about when
-        determining if inserting a new entry will break the correctness of the
-        table. This should be supplied when using this method to update an
-        already minimised table.
-    :type aliases: dict((int, int): set((int, int))
     :param min_goodness: \
         Reject merges which are worse than the minimum goodness.
+    :param merge_cache: \
+        What is known about the merges of the routing table, including the \
+        keys and masks its entries stand for given the aliases
+    :type merge_cache: py:class:`~._MergeCache`
     :return: Valid merge which may be applied to the routing table
     :rtype: _Merge
     """
     # Perform the down-check
-    merge = _refine_downcheck(merge, aliases, min_goodness)
+    merge = _refine_downcheck(merge, min_goodness, merge_cache)
 
     # If the merge is still sufficiently good then continue to refine it.
     if merge.goodness > min_goodness:
         # Perform the up-check
-        merge, changed = _refine_upcheck(merge, min_goodness)
+        merge, changed = _refine_upcheck(merge, min_goodness, merge_cache)
 
         if changed and merge.goodness > min_goodness:
             # If the up-check removed any entries we need to re-perform the
             # down-check; but we do not need to re-perform the up-check as the
             # down check can only move the resultant merge nearer the top of
             # the routing table.
-            merge = _refine_downcheck(merge, aliases, min_goodness)
+            merge = _refine_downcheck(merge, min_goodness, merge_cache)
 
     return merge
 
 
-def _refine_upcheck(merge, min_goodness):
+def _refine_upcheck(merge, min_goodness, merge_cache):
     """
     Remove from the merge any entries which would be covered by entries
     between their current position and the merge insertion position.
@@ -567,6 +803,7 @@ def _refine_upcheck(merge, min_goodness):
 
     :param merge:
     :param min_goodness:
+    :param merge_cache: What is known about the merges of the routing table
     :return: \
         New merge with entries possibly removed. If the goodness of the merge \
         ever drops below `min_goodness` then an empty merge will be returned. \
@@ -579,10 +816,7 @@ def _refine_upcheck(merge, min_goodness):
         # Get all the entries that are between the entry we're looking at the
         # insertion index of the proposed merged index. If this entry would be
         # covered up by any of them then we remove it from the merge.
-        entry = merge.routing_table[i]
-        key, mask = entry.key, entry.mask
-        if any(intersect(key, mask, other.key, other.mask) for other in
-               merge.routing_table[i+1:merge.insertion_index]):
+        if merge_cache.first_intersecting(i) < merge.insertion_index:
             # The entry would be partially or wholly covered by another entry,
             # remove it from the merge and return a new merge.
             merge = _Merge(merge.routing_table, merge.entries - {i})
@@ -597,7 +831,7 @@ def _refine_upcheck(merge, min_goodness):
     return merge, changed
 
 
-def _refine_downcheck(merge, aliases, min_goodness):
+def _refine_downcheck(merge, min_goodness, merge_cache):
     """
     Prune the merge to avoid it covering up any entries which are below the
     merge insertion position.
@@ -633,8 +867,8 @@ def _refine_downcheck(merge, aliases, min_goodness):
         XX1XX -> 3 5
 
     :param merge:
-    :param aliases:
     :param min_goodness:
+    :param merge_cache: What is known about the merges of the routing table
     :return: \
         New merge with entries possibly removed. If the goodness of the merge \
         ever drops below `min_goodness` then an empty merge will be returned.
@@ -721,44 +955,37 @@ def _refine_downcheck(merge, aliases, min_goodness):
     #     generality and is therefore nearer the top of the table so new
     #     entries may be have become covered
 
-    # Set of bit positions
-    all_bits = tuple(1 << i for i in range(32))
-
     # While the merge is still worth considering continue to perform the
     # down-check.
     while merge.goodness > min_goodness:
-        covered = list(_get_covered_keys_and_masks(merge, aliases))
+        keys, masks = merge_cache.covered_keys_and_masks(merge)
 
         # If there are no covered entries (the merge is valid) then break out
         # of the loop.
-        if not covered:
+        if not len(keys):
             break
 
         # For each covered entry work out which bits in the key-mask pair which
-        # are not Xs are not covered by Xs in the merge key-mask pair. Only
-        # keep track of the entries which have the fewest bits that we could
-        # set.
-        most_stringent = 33  # Not at all stringent
+        # are not Xs are not covered by Xs in the merge key-mask pair, that is
+        # the bit positions where there ISN'T an X in the covered entry but
+        # there IS an X in the merged entry.
+        settable = masks & numpy.uint32(~merge.mask & 0xFFFFFFFF)
+
+        # Only keep track of the entries which have the fewest bits that we
+        # could set, and of the bits that we need to set to meet their
+        # constraints, with the values required.
+        n_settable = _get_bit_counts(settable)
+        most_stringent = int(n_settable.min())
+        stringent = n_settable == most_stringent
+        settable = settable[stringent]
+        keys = keys[stringent]
         bits_and_vals = set()
-        for key, mask in covered:
-            # Get the bit positions where there ISN'T an X in the covered entry
-            # but there IS an X in the merged entry.
-            settable = mask & ~merge.mask
-
-            # Count the number of settable bits, if this is a more stringent
-            # constraint than the previous constraint then ensure that we
-            # record the new stringency and store which bits we need to set to
-            # meet the constraint.
-            n_settable = sum(1 for bit in all_bits if bit & settable)
-            if n_settable <= most_stringent:
-                if n_settable < most_stringent:
-                    most_stringent = n_settable
-                    bits_and_vals = set()
-
-                # Add this settable mask and the required values to the
-                # settables list.
-                bits_and_vals.update((bit, not (key & bit)) for bit in
-                                     all_bits if bit & settable)
+        for val, bits in ((True, settable & ~keys), (False, settable & keys)):
+            bits = int(numpy.bitwise_or.reduce(bits))
+            while bits:
+                bit = bits & -bits
+                bits_and_vals.add((bit, val))
+                bits ^= bit
 
         if most_stringent == 0:
             # If are there any instances where we could not possibly change a
@@ -770,29 +997,28 @@ def _refine_downcheck(merge, aliases, min_goodness):
             # Get the smallest number of entries to remove to modify the
             # resultant key-mask to avoid covering a lower entry. Prefer to
             # modify more significant bits of the key mask.
-            remove = set()  # Entries to remove
+            entries, entry_keys, entry_masks = merge_cache.keys_and_masks(
+                merge.entries)
+            remove = None  # Which of the entries to remove
+            n_remove = 0
             for bit, val in sorted(bits_and_vals, reverse=True):
-                working_remove = set()  # Holder for working remove set
-
-                for i in merge.entries:
-                    entry = merge.routing_table[i]
-
-                    if ((not entry.mask & bit) or
-                            (bool(entry.key & bit) is (not val))):
-                        # If the entry has an X in this position then it will
-                        # need to be removed regardless of whether we want to
-                        # set a 0 or a 1 in this position, likewise it will
-                        # need to be removed if it is a 0 and we want a 1 or
-                        # vice-versa.
-                        working_remove.add(i)
+                # If an entry has an X in this position then it will need to
+                # be removed regardless of whether we want to set a 0 or a 1
+                # in this position, likewise it will need to be removed if it
+                # is a 0 and we want a 1 or vice-versa.
+                working_remove = (((entry_masks & bit) == 0) |
+                                  (((entry_keys & bit) != 0) == (not val)))
+                n_working_remove = int(numpy.count_nonzero(working_remove))
 
                 # If the current remove set is empty or the new remove set is
                 # smaller update the remove set.
-                if not remove or len(working_remove) < len(remove):
+                if not n_remove or n_working_remove < n_remove:
                     remove = working_remove
+                    n_remove = n_working_remove
 
             # Remove the selected entries from the merge
-            merge = _Merge(merge.routing_table, merge.entries - remove)
+            merge = _Merge(merge.routing_table, merge.entries.difference(
+                entries[remove].tolist()))
     else:
         # NOTE: If there are no covered entries, that is, if the merge is
         # better than min goodness AND valid this `else` clause is not reached.
@@ -803,25 +1029,14 @@ def _refine_downcheck(merge, aliases, min_goodness):
     return merge
 
 
-def _get_covered_keys_and_masks(merge, aliases):
-    """
-    Get keys and masks which would be covered by the entry resulting from
-    the merge.
+def _get_bit_counts(values):
+    """ Count the number of 1s in each of an array of 32-bit values.
 
-    :param merge:
-    :param aliases: {(key, mask): {(key, mask), ...}, ...}
-        Map of key-mask pairs to the sets of key-mask pairs that they actually
-        represent.
-    :return: (key, mask)
-        Pairs of keys and masks which would be covered if the given `merge`
-        were to be applied to the routing table.
+    :param values: The values to count the 1s of
+    :type values: ~numpy.ndarray(uint32)
+    :rtype: ~numpy.ndarray(uint32)
     """
-    # For every entry in the table below the insertion index see which keys
-    # and masks would overlap with the key and mask of the merged entry.
-    for entry in merge.routing_table[merge.insertion_index:]:
-        key_mask = (entry.key, entry.mask)
-        keys_masks = aliases.get(key_mask, [key_mask])
-
-        for key, mask in keys_masks:
-            if intersect(merge.key, merge.mask, key, mask):
-                yield key, mask
+    values = values - ((values >> 1) & 0x55555555)
+    values = (values & 0x33333333) + ((values >> 2) & 0x33333333)
+    values = (values + (values >> 4)) & 0x0F0F0F0F
+    return (values * 0x01010101) >> 24
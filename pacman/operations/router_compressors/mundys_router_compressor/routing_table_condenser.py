@@ -29,12 +29,7 @@ class MundyRouterCompressor(AbstractCompressor):
 
     def compress_table(self, router_table):
         # convert to rig inspired format
-        entries = list()
-
-        # handle entries
-        for router_entry in router_table.multicast_routing_entries:
-            # Add the new entry
-            entries.append(Entry.from_MulticastRoutingEntry(router_entry))
+        entries = Entry.from_MulticastRoutingTable(router_table)
 
         compressed_router_table_entries = \
             rigs_compressor.minimise(entries, self._target_length)
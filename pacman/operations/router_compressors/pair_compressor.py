@@ -13,6 +13,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import numpy
 from .abstract_compressor import AbstractCompressor
 from .entry import Entry
 
@@ -99,10 +100,28 @@ class PairCompressor(AbstractCompressor):
     (0 to _previous_pointer(-1)) are not considered for clash checking
     """
 
+    # The most merges to check in one go
+    MAX_BATCH = 64
+
+    # The most merge-entry pairs to check in one go
+    MAX_BATCH_CHECKS = 1 << 18
+
     __slots__ = [
         # A list of all entries which may be sorted
         #   of entries represented as (key, mask, defautible)
         "_all_entries",
+        # The keys of the entries, matching _all_entries for the previous
+        # and later buckets, to check for clashes in one go
+        "_keys",
+        # The masks of the entries, matching _all_entries as _keys does
+        "_masks",
+        # The keys of the entries with different routes to the current
+        # bucket which any merge must not intersect
+        "_check_keys",
+        # The masks of the entries to check, matching _check_keys
+        "_check_masks",
+        # The most merges to check against the entries in one go
+        "_max_batch",
         # The next index to write a merged/unmergable entry to
         "_write_index",
         # Inclusive index of last entry in the array (len in python)
@@ -240,38 +259,81 @@ class PairCompressor(AbstractCompressor):
             self._quicksort_routes(low, left - 1)
             self._quicksort_routes(right, high)
 
-    def _find_merge(self, left, index):
+    def _find_merge(self, left, right):
         """
-        Attempt to find a merge between the left entry and the index entry
+        Attempt to find a merge between the left entry and any entry after it
 
-        Creates a merge and then checks it does not intersect with entries \
-        with different routes.
+        Creates the merges with the entries after left in growing batches, \
+        and checks each batch in one go that the merges do not intersect \
+        with entries with different routes.
 
-        If no intersect detected entry[left] is replaced with the merge
+        If a merge with no intersect is detected entry[left] is replaced \
+        with the first such merge
 
         :param left: Index of Entry to merge and replace if possible
-        :param index: Index of entry to merge with
-        :return: True if and only if a merge was found and done
+        :param right: Inclusive index of the last entry to merge with
+        :return: The index of the entry merged with, or None if no merge \
+            was found
+        """
+        left_entry = self._all_entries[left]
+        l_key = numpy.uint32(left_entry.key)
+        l_mask = numpy.uint32(left_entry.mask)
+        index = left + 1
+        batch = 1
+        while index <= right:
+            others = self._all_entries[index:min(index + batch, right + 1)]
+            o_keys = numpy.array([other.key for other in others], "uint32")
+            o_masks = numpy.array([other.mask for other in others], "uint32")
+
+            # As merge does, for each of the others at once
+            m_masks = l_mask & o_masks & ~(l_key ^ o_keys)
+            m_keys = l_key & o_keys & m_masks
+            free = numpy.flatnonzero(~self._intersects_any(m_keys, m_masks))
+            if len(free):
+                found = free[0]
+                self._all_entries[left] = Entry(
+                    int(m_keys[found]), int(m_masks[found]),
+                    left_entry.defaultable and others[found].defaultable,
+                    left_entry.spinnaker_route)
+                return index + int(found)
+            index += len(others)
+            batch = min(batch * 2, self._max_batch)
+        return None
+
+    def _intersects_any(self, keys, masks):
+        """
+        Check which of some key-mask pairs intersect any of the entries \
+        with different routes that have to be checked
+
+        :param keys: The keys to check
+        :type keys: ~numpy.ndarray(uint32)
+        :param masks: The masks to check
+        :type masks: ~numpy.ndarray(uint32)
+        :return: True for each pair that intersects any checked entry
+        :rtype: ~numpy.ndarray(bool)
         """
-        m_key, m_mask, defaultable = self.merge(
-            self._all_entries[left], self._all_entries[index])
-        if not self.ordered:
-            for check in range(self._previous_index):
-                if self.intersect(
-                        self._all_entries[check].key,
-                        self._all_entries[check].mask,
-                        m_key, m_mask):
-                    return False
-        for check in range(self._remaining_index, self._max_index + 1):
-            if self.intersect(
-                    self._all_entries[check].key,
-                    self._all_entries[check].mask,
-                    m_key, m_mask):
-                return False
-        self._all_entries[left] = Entry(
-            m_key, m_mask, defaultable,
-            self._all_entries[left].spinnaker_route)
-        return True
+        return self.intersect_all(
+            self._check_keys, self._check_masks,
+            keys[:, numpy.newaxis], masks[:, numpy.newaxis]).any(axis=1)
+
+    def _set_check_entries(self):
+        """
+        Sets the keys and masks of the entries which merges of the current\
+        bucket must not intersect, and so how many merges to check at once
+        """
+        start = self._remaining_index
+        if self.ordered:
+            self._check_keys = self._keys[start:]
+            self._check_masks = self._masks[start:]
+        else:
+            previous = self._previous_index
+            self._check_keys = numpy.concatenate(
+                (self._keys[:previous], self._keys[start:]))
+            self._check_masks = numpy.concatenate(
+                (self._masks[:previous], self._masks[start:]))
+        self._max_batch = max(
+            1, min(self.MAX_BATCH,
+                   self.MAX_BATCH_CHECKS // max(1, len(self._check_keys))))
 
     def _compress_by_route(self, left, right):
         """
@@ -281,18 +343,13 @@ class PairCompressor(AbstractCompressor):
         :param right: Inclusive index of last entry to merge
         """
         while left < right:
-            index = left + 1
-            while index <= right:
-                merged = self._find_merge(left, index)
-                if merged:
-                    self._all_entries[index] = self._all_entries[right]
-                    # Setting None not needed but easier when debugging
-                    # self._all_entries[right] = None
-                    right -= 1
-                    break
-
-                index += 1
-            if not merged:
+            index = self._find_merge(left, right)
+            if index is not None:
+                self._all_entries[index] = self._all_entries[right]
+                # Setting None not needed but easier when debugging
+                # self._all_entries[right] = None
+                right -= 1
+            else:
                 self._all_entries[self._write_index] = self._all_entries[left]
                 self._write_index += 1
                 left += 1
@@ -326,19 +383,21 @@ class PairCompressor(AbstractCompressor):
         """
 
         # Split the entries into buckets based on spinnaker_route
-        self._all_entries = []
+        self._all_entries = Entry.from_MulticastRoutingTable(router_table)
         self._routes_count = 0
         # Imitate creating fixed size arrays
         self._routes = self.MAX_SUPPORTED_LENGTH * [None]
         self._routes_frequency = self.MAX_SUPPORTED_LENGTH * [None]
 
-        for entry in router_table.multicast_routing_entries:
-            self._all_entries.append(
-                Entry.from_MulticastRoutingEntry(entry))
+        for entry in self._all_entries:
             self.update_frequency(entry.spinnaker_route)
 
         self._quicksort_routes(0, self._routes_count - 1)
         self._quicksort_table(0, len(self._all_entries) - 1)
+        self._keys = numpy.array(
+            [entry.key for entry in self._all_entries], dtype="uint32")
+        self._masks = numpy.array(
+            [entry.mask for entry in self._all_entries], dtype="uint32")
 
         self._write_index = 0
         self._max_index = len(self._all_entries) - 1
@@ -352,8 +411,12 @@ class PairCompressor(AbstractCompressor):
                    == self._all_entries[left].spinnaker_route):
                 right += 1
             self._remaining_index = right + 1
+            self._set_check_entries()
             self._compress_by_route(left, right)
             left = right + 1
+            for index in range(self._previous_index, self._write_index):
+                self._keys[index] = self._all_entries[index].key
+                self._masks[index] = self._all_entries[index].mask
             self._previous_index = self._write_index
 
         return self._all_entries[0:self._write_index]
@@ -37,6 +37,11 @@ class KeyFieldGenerator(object):
         # The position in the free space list
         "_free_space_pos",
 
+        # The number of keys in the lowest block of keys given the mask;
+        # there can only be a key in a free space that can hold a block of
+        # this many keys aligned to its size
+        "_block_size",
+
         # True if the next key has been read, False if not
         "_next_key_read",
 
@@ -56,12 +61,16 @@ class KeyFieldGenerator(object):
     def __init__(self, fixed_mask, fields, free_space_list):
         """
         :type fields: list(FixedKeyFieldConstraint)
+        :type free_space_list: \
+            ~pacman.utilities.utility_objs.FreeSpaceTracker
         """
 
         self._fixed_mask = fixed_mask
         self._is_next_key = True
         self._free_space_list = free_space_list
-        self._free_space_pos = 0
+        self._block_size = (fixed_mask & -fixed_mask) or 2 ** 32
+        self._free_space_pos = free_space_list.find_block_space(
+            self._block_size)
         self._next_key_read = False
         self._field_ones = dict()
         self._field_value = dict()
@@ -89,6 +98,9 @@ class KeyFieldGenerator(object):
         self._fields = sorted(the_fields, key=lambda field: field.value,
                               reverse=True)
 
+        if self._free_space_pos is None:
+            self._is_next_key = False
+            return
         self._update_next_valid_fields()
         self._increment_space_until_valid_key()
 
@@ -99,7 +111,12 @@ class KeyFieldGenerator(object):
     def _increment_space_until_valid_key(self):
         while (self._is_next_key and self._get_next_key() >=
                 self._get_current_space_end_address()):
-            self._free_space_pos += 1
+            # Skip the spaces that no key could fit in
+            self._free_space_pos = self._free_space_list.find_block_space(
+                self._block_size, self._free_space_pos + 1)
+            if self._free_space_pos is None:
+                self._is_next_key = False
+                return
             self._update_next_valid_fields()
 
     def _update_next_valid_fields(self):
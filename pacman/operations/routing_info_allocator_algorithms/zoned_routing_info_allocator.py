@@ -13,7 +13,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-import math
+from collections import OrderedDict
+from six import iteritems
 from spinn_utilities.progress_bar import ProgressBar
 from pacman.model.routing_info import (
     RoutingInfo, PartitionRoutingInfo, BaseKeyAndMask)
@@ -29,13 +30,26 @@ KEY_SIZE = 32
 
 class ZonedRoutingInfoAllocator(object):
     """ An basic algorithm that can produce routing keys and masks for\
-        edges in a graph based on the x,y,p of the placement\
-        of the preceding vertex.
+        edges in a graph based on the application vertex, the partition and\
+        the index of the machine vertex of each outgoing edge partition.
+
+    The key space is packed into fields, from the top bit down:
+
+    * the application vertex, among those with multicast partitions
+    * the partition identifier, among those of the application vertex
+    * the machine vertex, among those of the application vertex
+    * the keys of the machine partition
+
+    The application vertex field is the same size for all application\
+    vertices, and the machine vertex and key fields are the same size for\
+    all partitions of an application vertex with the same identifier, so\
+    that each application vertex, and each partition identifier of it, has\
+    a single key and mask covering all its keys.
 
     .. note::
-        No constraints are supported, and that the number of keys\
-        required by each edge must be 2048 or less, and that all edges coming\
-        out of a vertex will be given the same key/mask assignment.
+        No constraints are supported, and all outgoing multicast partitions\
+        of a machine vertex with the same identifier as those of the other\
+        machine vertices of its application vertex are treated as one zone.
     """
 
     __slots__ = [
@@ -45,8 +59,11 @@ class ZonedRoutingInfoAllocator(object):
         "_machine_graph",
         "_placements",
         "_n_keys_map",
+        # The number of bits below the application vertex field
         "_max_app_keys_bites",
-        "_key_bites_per_app"
+        # OrderedDict of application vertex -> (bits below the partition
+        # field, OrderedDict of identifier -> bits of the key field)
+        "_zones"
     ]
     # pylint: disable=attribute-defined-outside-init
 
@@ -65,9 +82,13 @@ class ZonedRoutingInfoAllocator(object):
             edges
         :type n_keys_map:\
             :py:class:`pacman.model.routing_info.AbstractMachinePartitionNKeysMap`
-        :return: The routing information
-        :rtype:\
-            :py:class:`pacman.model.routing_info.PartitionRoutingInfo`
+        :return: The routing information, the key and mask of each\
+            application vertex, and the key and mask of each (application\
+            vertex, partition identifier)
+        :rtype: tuple(\
+            :py:class:`pacman.model.routing_info.PartitionRoutingInfo`,\
+            dict(ApplicationVertex, BaseKeyAndMask),\
+            dict(tuple(ApplicationVertex, str), BaseKeyAndMask))
         :raise pacman.exceptions.PacmanRouteInfoAllocationException: \
             If something goes wrong with the allocation
         """
@@ -85,79 +106,104 @@ class ZonedRoutingInfoAllocator(object):
             supported_constraints=[ContiguousKeyRangeContraint],
             abstract_constraint_type=AbstractKeyAllocatorConstraint)
 
-        if self._caluculate_zones() != 1:
-            raise NotImplementedError()
+        self._caluculate_zones()
 
-        return self._simple_allocate()
+        return self._allocate()
 
     def _caluculate_zones(self):
+        """ Work out the size of the fields of the keys of each application\
+            vertex and partition identifier.
+        """
         progress = ProgressBar(
             self._application_graph.n_vertices, "Calculating zones")
         self._max_app_keys_bites = 0
-        source_zones = 0
-        max_partitions = 0
-        self._key_bites_per_app = dict()
+        self._zones = OrderedDict()
         for app_vertex in progress.over(self._application_graph.vertices):
-            app_max_partitions = 0
             machine_vertices = self._graph_mapper.get_machine_vertices(
                 app_vertex)
-            max_keys = 0
+
+            # The most keys of any partition with each identifier
+            max_keys = OrderedDict()
             for vertex in machine_vertices:
-                partitions = self._machine_graph.\
-                    get_outgoing_edge_partitions_starting_at_vertex(vertex)
-                app_max_partitions = max(app_max_partitions, len(partitions))
-                # Do we need to check type here
-                for partition in partitions:
+                for partition in self._machine_graph.\
+                        get_outgoing_edge_partitions_starting_at_vertex(
+                            vertex):
                     if partition.traffic_type == EdgeTrafficType.MULTICAST:
                         n_keys = self._n_keys_map.n_keys_for_partition(
                             partition)
-                        max_keys = max(max_keys, n_keys)
-            if max_keys > 0:
-                max_partitions = max(max_partitions, app_max_partitions)
-                source_zones += app_max_partitions
-                key_bites = self._bites_needed(max_keys)
-                machine_bites = self._bites_needed(len(machine_vertices))
-                self._max_app_keys_bites = max(
-                    self._max_app_keys_bites, machine_bites + key_bites)
-                self._key_bites_per_app[app_vertex] = key_bites
-        source_bites = self._bites_needed(source_zones)
-
+                        max_keys[partition.identifier] = max(
+                            max_keys.get(partition.identifier, 0), n_keys)
+            if not any(n_keys > 0 for n_keys in max_keys.values()):
+                continue
+
+            machine_bites = self._bites_needed(len(machine_vertices))
+            key_bites = OrderedDict(
+                (identifier, self._bites_needed(n_keys))
+                for identifier, n_keys in iteritems(max_keys))
+            partition_stride = machine_bites + max(key_bites.values())
+            self._zones[app_vertex] = (partition_stride, key_bites)
+            self._max_app_keys_bites = max(
+                self._max_app_keys_bites,
+                self._bites_needed(len(key_bites)) + partition_stride)
+
+        source_bites = self._bites_needed(len(self._zones))
         if source_bites + self._max_app_keys_bites > KEY_SIZE:
             raise PacmanRouteInfoAllocationException(
                 "Unable to use ZonedRoutingInfoAllocator please select a "
                 "different allocator as it needs {} + {} bites".format(
                     source_bites, self._max_app_keys_bites))
-        return max_partitions
 
-    def _simple_allocate(self):
-        progress = ProgressBar(
-            self._application_graph.n_vertices, "Allocating routing keys")
+    def _allocate(self):
+        """ Allocate the keys of each zone.
+        """
+        progress = ProgressBar(len(self._zones), "Allocating routing keys")
         routing_infos = RoutingInfo()
         by_app_vertex = dict()
-        app_mask = 2 ** 32 - 2 ** self._max_app_keys_bites
+        by_app_partition = dict()
+        app_mask = self._mask(self._max_app_keys_bites)
 
-        for source_index, app_vertex in progress.over(
-                enumerate(self._application_graph.vertices)):
-            machine_vertices = self._graph_mapper.get_machine_vertices(
-                app_vertex)
-            if app_vertex in self._key_bites_per_app:
-                key_bites = self._key_bites_per_app[app_vertex]
-                for machine_index, vertex in enumerate(machine_vertices):
-                    partitions = self._machine_graph. \
-                        get_outgoing_edge_partitions_starting_at_vertex(vertex)
-                    partition = partitions.peek()
-                    if partition.traffic_type == EdgeTrafficType.MULTICAST:
-                        mask = 2 ** 32 - 2 ** key_bites
-                        key = source_index << self._max_app_keys_bites | \
-                            machine_index << key_bites
-                        key_and_mask = BaseKeyAndMask(base_key=key, mask=mask)
-                        info = PartitionRoutingInfo([key_and_mask], partition)
-                        routing_infos.add_partition_info(info)
+        for source_index, (app_vertex, (partition_stride, key_bites)) in \
+                progress.over(enumerate(iteritems(self._zones))):
             app_key = source_index << self._max_app_keys_bites
             by_app_vertex[app_vertex] = BaseKeyAndMask(
                 base_key=app_key, mask=app_mask)
 
-        return routing_infos, by_app_vertex
+            # The key of each partition identifier of the vertex
+            partition_keys = dict()
+            for partition_index, identifier in enumerate(key_bites):
+                partition_keys[identifier] = \
+                    app_key | partition_index << partition_stride
+                by_app_partition[app_vertex, identifier] = BaseKeyAndMask(
+                    base_key=partition_keys[identifier],
+                    mask=self._mask(partition_stride))
+
+            machine_vertices = self._graph_mapper.get_machine_vertices(
+                app_vertex)
+            for machine_index, vertex in enumerate(machine_vertices):
+                for partition in self._machine_graph.\
+                        get_outgoing_edge_partitions_starting_at_vertex(
+                            vertex):
+                    if partition.traffic_type != EdgeTrafficType.MULTICAST:
+                        continue
+                    bites = key_bites[partition.identifier]
+                    key = partition_keys[partition.identifier] | \
+                        machine_index << bites
+                    key_and_mask = BaseKeyAndMask(
+                        base_key=key, mask=self._mask(bites))
+                    info = PartitionRoutingInfo([key_and_mask], partition)
+                    routing_infos.add_partition_info(info)
+
+        return routing_infos, by_app_vertex, by_app_partition
+
+    @staticmethod
+    def _mask(bites):
+        """ Get the mask that matches all but the bottom bits of a key
+        """
+        return 2 ** KEY_SIZE - 2 ** bites
 
-    def _bites_needed(self, size):
-        return math.ceil(math.log(size, 2))
+    @staticmethod
+    def _bites_needed(size):
+        """ Get the number of bits needed to give each of a number of items\
+            a different value
+        """
+        return max(size - 1, 0).bit_length()
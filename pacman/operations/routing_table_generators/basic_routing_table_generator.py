@@ -13,8 +13,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from six import iteritems
 from spinn_utilities.progress_bar import ProgressBar
-from spinn_machine import MulticastRoutingEntry
 from pacman.model.routing_tables import (
     MulticastRoutingTable, MulticastRoutingTables)
 
@@ -34,24 +34,49 @@ class BasicRoutingTableGenerator(object):
         """
         progress = ProgressBar(machine.n_chips, "Generating routing tables")
         routing_tables = MulticastRoutingTables()
+
+        # The keys and masks of each partition, worked out once for all the
+        # chips that the partition goes through
+        keys_and_masks = {
+            r_info.partition: (
+                [key_and_mask.key_combo
+                 for key_and_mask in r_info.keys_and_masks],
+                [key_and_mask.mask for key_and_mask in r_info.keys_and_masks])
+            for r_info in routing_infos}
+
         for chip in progress.over(machine.chips):
             partitions_in_table = routing_table_by_partitions.\
                 get_entries_for_router(chip.x, chip.y)
             if partitions_in_table:
                 routing_tables.add_routing_table(self._create_routing_table(
-                    chip, partitions_in_table, routing_infos))
+                    chip, partitions_in_table, keys_and_masks))
 
         return routing_tables
 
-    def _create_routing_table(self, chip, partitions_in_table, routing_infos):
+    @staticmethod
+    def _create_routing_table(chip, partitions_in_table, keys_and_masks):
+        """ Create the routing table of a chip, adding its entries in one go
+
+        :param chip: The chip to create the table of
+        :param partitions_in_table: The entry of each partition on the chip
+        :param keys_and_masks: \
+            The keys (combined with the masks) and masks of each partition
+        :type keys_and_masks: dict(partition, (list(int), list(int)))
+        :rtype: ~pacman.model.routing_tables.MulticastRoutingTable
+        """
+        # The keys and masks, route and defaultable flag of each partition
+        partition_entries = [
+            (keys_and_masks[partition], entry.spinnaker_route,
+             entry.defaultable)
+            for partition, entry in iteritems(partitions_in_table)]
+
         table = MulticastRoutingTable(chip.x, chip.y)
-        for partition in partitions_in_table:
-            r_info = routing_infos.get_routing_info_from_partition(partition)
-            entry = partitions_in_table[partition]
-            for key_and_mask in r_info.keys_and_masks:
-                table.add_multicast_routing_entry(MulticastRoutingEntry(
-                    routing_entry_key=key_and_mask.key_combo,
-                    defaultable=entry.defaultable, mask=key_and_mask.mask,
-                    link_ids=entry.link_ids,
-                    processor_ids=entry.processor_ids))
+        table.add_entries(
+            [key for (keys, _), _, _ in partition_entries for key in keys],
+            [mask for (_, masks), _, _ in partition_entries
+             for mask in masks],
+            [route for (keys, _), route, _ in partition_entries
+             for _ in keys],
+            [defaultable for (keys, _), _, defaultable in partition_entries
+             for _ in keys])
         return table
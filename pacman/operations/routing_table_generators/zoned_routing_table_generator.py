@@ -13,34 +13,13 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from collections import OrderedDict
+from six import iteritems
 from spinn_utilities.progress_bar import ProgressBar
-from spinn_utilities.ordered_default_dict import DefaultOrderedDict
-from spinn_machine import MulticastRoutingEntry
 from pacman.model.routing_tables import (
     MulticastRoutingTable, MulticastRoutingTables)
 
 
-class SharedEntry(object):
-    slots = [
-
-        # the edges this path entry goes down
-        "link_ids",
-
-        # the processors this path entry goes to
-        "processor_ids",
-
-        "defaultable"
-        ]
-
-    def __init__(self, entry):
-        self.link_ids = entry.link_ids
-        self.processor_ids = entry.processor_ids
-        self.defaultable = entry.defaultable
-
-    def still_defaultable(self, entry):
-        self.defaultable = self.defaultable & entry.defaultable
-
-
 class ZonedRoutingTableGenerator(object):
     """ An basic algorithm that can produce routing tables
     """
@@ -49,72 +28,126 @@ class ZonedRoutingTableGenerator(object):
 
     def __call__(
             self, routing_infos, routing_table_by_partitions, machine,
-            graph_mapper, info_by_app_vertex):
+            graph_mapper, info_by_app_vertex, info_by_app_partition=None):
         """
         :param routing_infos:
         :param routing_table_by_partitions:
         :param machine:
+        :param graph_mapper:
+        :param info_by_app_vertex: \
+            The key and mask shared by the partitions of each application\
+            vertex
+        :param info_by_app_partition: \
+            The key and mask shared by the partitions of each application\
+            vertex with each identifier
         """
+        if info_by_app_partition is None:
+            info_by_app_partition = dict()
         progress = ProgressBar(machine.n_chips, "Generating routing tables")
         routing_tables = MulticastRoutingTables()
+
+        # The application vertex and the keys and masks of each partition,
+        # worked out once for all the chips that the partition goes through
+        app_vertices = dict()
+        keys_and_masks = dict()
+        for r_info in routing_infos:
+            partition = r_info.partition
+            app_vertices[partition] = graph_mapper.get_application_vertex(
+                partition.pre_vertex)
+            keys_and_masks[partition] = (
+                [key_and_mask.key_combo
+                 for key_and_mask in r_info.keys_and_masks],
+                [key_and_mask.mask for key_and_mask in r_info.keys_and_masks])
+
         for chip in progress.over(machine.chips):
             partitions_in_table = routing_table_by_partitions.\
                 get_entries_for_router(chip.x, chip.y)
             if partitions_in_table:
                 routing_tables.add_routing_table(self._create_routing_table(
-                    chip, partitions_in_table, routing_infos, graph_mapper,
-                    info_by_app_vertex))
+                    chip, partitions_in_table, app_vertices, keys_and_masks,
+                    graph_mapper, info_by_app_vertex, info_by_app_partition))
 
         return routing_tables
 
-    def _create_routing_table(self, chip, partitions_in_table, routing_infos,
-                              graph_mapper, info_by_app_vertex):
+    @staticmethod
+    def _create_routing_table(
+            chip, partitions_in_table, app_vertices, keys_and_masks,
+            graph_mapper, info_by_app_vertex, info_by_app_partition):
+        """ Create the routing table of a chip.  The partitions of an\
+            application vertex that all take the same route through the\
+            chip share one entry with the key and mask of the application\
+            vertex.  Failing that, the partitions with each identifier that\
+            all take the same route share one entry with the key and mask of\
+            the application vertex and identifier.  The others have an entry\
+            for each of their keys and masks.
+
+        :param chip: The chip to create the table of
+        :param partitions_in_table: The entry of each partition on the chip
+        :param app_vertices: The application vertex of each partition
+        :type app_vertices: dict(partition, ApplicationVertex)
+        :param keys_and_masks: \
+            The keys (combined with the masks) and masks of each partition
+        :type keys_and_masks: dict(partition, (list(int), list(int)))
+        :param graph_mapper: The mapper for any partition not in app_vertices
+        :param info_by_app_vertex: \
+            The key and mask shared by the partitions of each application\
+            vertex
+        :param info_by_app_partition: \
+            The key and mask shared by the partitions of each application\
+            vertex with each identifier
+        :rtype: ~pacman.model.routing_tables.MulticastRoutingTable
+        """
+        entries_by_app_vertex = OrderedDict()
+        for partition, entry in iteritems(partitions_in_table):
+            app_vertex = app_vertices.get(partition)
+            if app_vertex is None:
+                app_vertex = graph_mapper.get_application_vertex(
+                    partition.pre_vertex)
+            group = entries_by_app_vertex.get(app_vertex)
+            if group is None:
+                group = entries_by_app_vertex[app_vertex] = list()
+            group.append((partition, entry))
+
+        keys = list()
+        masks = list()
+        routes = list()
+        defaultables = list()
+
+        def add_shared_entry(key_and_mask, group):
+            """ Add one entry for a group of partitions if they all take the\
+                same route, returning whether it was added
+            """
+            # The route as an int says which links and processors are used
+            route = group[0][1].spinnaker_route
+            if key_and_mask is None or any(
+                    entry.spinnaker_route != route for _, entry in group):
+                return False
+            keys.append(key_and_mask.key_combo)
+            masks.append(key_and_mask.mask)
+            routes.append(route)
+            defaultables.append(all(entry.defaultable for _, entry in group))
+            return True
+
+        for app_vertex, group in iteritems(entries_by_app_vertex):
+            if add_shared_entry(info_by_app_vertex.get(app_vertex), group):
+                continue
+            groups_by_identifier = OrderedDict()
+            for partition, entry in group:
+                groups_by_identifier.setdefault(
+                    partition.identifier, list()).append((partition, entry))
+            for identifier, id_group in iteritems(groups_by_identifier):
+                if add_shared_entry(info_by_app_partition.get(
+                        (app_vertex, identifier)), id_group):
+                    continue
+                for partition, entry in id_group:
+                    partition_keys, partition_masks = keys_and_masks[partition]
+                    keys.extend(partition_keys)
+                    masks.extend(partition_masks)
+                    routes.extend(
+                        entry.spinnaker_route for _ in partition_keys)
+                    defaultables.extend(
+                        entry.defaultable for _ in partition_keys)
+
         table = MulticastRoutingTable(chip.x, chip.y)
-        partitions_by_app_vertex = DefaultOrderedDict(set)
-        for partition in partitions_in_table:
-            machine_vertex = partition.pre_vertex
-            app_vertex = graph_mapper.get_application_vertex(machine_vertex)
-            partitions_by_app_vertex[app_vertex].add(partition)
-        for app_vertex in partitions_by_app_vertex:
-            if app_vertex in info_by_app_vertex:
-                shared_entry = self._find_shared_entry(
-                    partitions_by_app_vertex[app_vertex], partitions_in_table)
-            else:
-                shared_entry = None
-            if shared_entry is None:
-                self._add_partition_based(
-                    partitions_by_app_vertex[app_vertex], routing_infos,
-                    partitions_in_table, table)
-            else:
-                self._add_key_and_mask(
-                    info_by_app_vertex[app_vertex], shared_entry, table)
+        table.add_entries(keys, masks, routes, defaultables)
         return table
-
-    def _find_shared_entry(self, partitions, partitions_in_table):
-        shared_entry = None
-        for partition in partitions:
-            entry = partitions_in_table[partition]
-            if shared_entry is None:
-                shared_entry = SharedEntry(entry)
-            else:
-                if shared_entry.link_ids != entry.link_ids:
-                    return None
-                if shared_entry.processor_ids != entry.processor_ids:
-                    return None
-                shared_entry.still_defaultable(entry)
-        return shared_entry
-
-    def _add_partition_based(
-            self, partitions, routing_infos, partitions_in_table, table):
-        for partition in partitions:
-            r_info = routing_infos.get_routing_info_from_partition(partition)
-            entry = partitions_in_table[partition]
-            for key_and_mask in r_info.keys_and_masks:
-                self._add_key_and_mask(key_and_mask, entry, table)
-
-    def _add_key_and_mask(self, key_and_mask, entry, table):
-        table.add_multicast_routing_entry(MulticastRoutingEntry(
-            routing_entry_key=key_and_mask.key_combo,
-            defaultable=entry.defaultable, mask=key_and_mask.mask,
-            link_ids=entry.link_ids,
-            processor_ids=entry.processor_ids))
@@ -13,11 +13,11 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-import math
 from six import add_metaclass
 from spinn_utilities.abstract_base import AbstractBase
 from pacman.model.resources import ElementFreeSpace
 from pacman.exceptions import PacmanElementAllocationException
+from pacman.utilities.utility_objs import FreeSpaceTracker
 
 
 @add_metaclass(AbstractBase)
@@ -32,8 +32,7 @@ class ElementAllocatorAlgorithm(object):
     ]
 
     def __init__(self, size_begin, size_end):
-        self._free_space_tracker = list()
-        self._free_space_tracker.append(ElementFreeSpace(size_begin, size_end))
+        self._free_space_tracker = FreeSpaceTracker(size_begin, size_end)
 
     def _allocate_elements(self, base_element_id, n_elements):
         """ Handle the allocating of space for a given set of elements
@@ -55,23 +54,14 @@ class ElementAllocatorAlgorithm(object):
 
     def _find_slot(self, base_element_id, lo=0):
         """ Find the free slot with the closest\
-            base element ID  <= base element using a binary search
+            base element ID  <= base element, at or after a given slot
         """
-        hi = len(self._free_space_tracker) - 1
-        while lo < hi:
-            mid = int(math.ceil(float(lo + hi) / 2.0))
-            free_space_slot = self._free_space_tracker[mid]
-
-            if free_space_slot.start_address > base_element_id:
-                hi = mid - 1
-            else:
-                lo = mid
-
-        # If we have gone off the end of the array, we haven't found a slot
-        if (lo >= len(self._free_space_tracker) or hi < 0 or
-                self._free_space_tracker[lo].start_address > base_element_id):
+        index = self._free_space_tracker.find_space(base_element_id)
+
+        # If the slot is before the first one to look at, there isn't one
+        if index is None or index < lo:
             return None
-        return lo
+        return index
 
     def _do_allocation(self, index, base_element_id, n_elements):
         """ Allocate a given base element ID and number of elements into the\
@@ -96,39 +86,14 @@ class ElementAllocatorAlgorithm(object):
                 "Not enough space to allocate {} elements starting at {}"
                 .format(n_elements, hex(base_element_id)))
 
-        if (free_space_slot.start_address == base_element_id and
-                free_space_slot.size == n_elements):
-
-            # If the slot exactly matches the space, remove it
-            del self._free_space_tracker[index]
-
-        elif free_space_slot.start_address == base_element_id:
-
-            # If the slot starts with the element ID, reduce the size
-            self._free_space_tracker[index] = ElementFreeSpace(
-                free_space_slot.start_address + n_elements,
-                free_space_slot.size - n_elements)
-
-        elif space == n_elements:
-
-            # If the space at the end exactly matches the spot, reduce the size
-            self._free_space_tracker[index] = ElementFreeSpace(
+        # Replace the slot with the spaces before and after the allocation,
+        # either of which may be empty
+        self._free_space_tracker.replace(index, [
+            ElementFreeSpace(
                 free_space_slot.start_address,
-                free_space_slot.size - n_elements)
-
-        else:
-
-            # Otherwise, the allocation lies in the middle of the region:
-            # First, reduce the size of the space before the allocation
-            self._free_space_tracker[index] = ElementFreeSpace(
-                free_space_slot.start_address,
-                base_element_id - free_space_slot.start_address)
-
-            # Then add a new space after the allocation
-            self._free_space_tracker.insert(index + 1, ElementFreeSpace(
-                base_element_id + n_elements,
-                free_space_slot.start_address + free_space_slot.size -
-                (base_element_id + n_elements)))
+                base_element_id - free_space_slot.start_address),
+            ElementFreeSpace(
+                base_element_id + n_elements, space - n_elements)])
 
     def _check_allocation(self, index, base_element_id, n_elements):
         """ Check if there is enough space for a given set of element IDs\
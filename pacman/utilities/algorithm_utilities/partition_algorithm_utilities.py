@@ -49,26 +49,30 @@ def generate_machine_edges(machine_graph, graph_mapper, application_graph):
         application_outgoing_partitions = application_graph.\
             get_outgoing_edge_partitions_starting_at_vertex(vertex)
         for application_partition in application_outgoing_partitions:
+            identifier = application_partition.identifier
+            machine_partition = None
             for application_edge in application_partition.edges:
-                # create new partitions
-                for dest_vertex in graph_mapper.get_machine_vertices(
-                        application_edge.post_vertex):
-                    machine_edge = application_edge.create_machine_edge(
-                        source_vertex, dest_vertex,
-                        "machine_edge_for{}".format(application_edge.label))
-                    machine_graph.add_edge(
-                        machine_edge, application_partition.identifier)
-
-                    # add constraints from the application partition
-                    machine_partition = machine_graph.\
-                        get_outgoing_edge_partition_starting_at_vertex(
-                            source_vertex, application_partition.identifier)
-                    machine_partition.add_constraints(
-                        application_partition.constraints)
-
-                    # update mapping object
-                    graph_mapper.add_edge_mapping(
-                        machine_edge, application_edge)
+                # create new edges, which all have the same label
+                label = "machine_edge_for{}".format(application_edge.label)
+                machine_edges = [
+                    application_edge.create_machine_edge(
+                        source_vertex, dest_vertex, label)
+                    for dest_vertex in graph_mapper.get_machine_vertices(
+                        application_edge.post_vertex)]
+                if not machine_edges:
+                    continue
+                machine_graph.add_edges(machine_edges, identifier)
+                machine_partition = machine_graph.\
+                    get_outgoing_edge_partition_starting_at_vertex(
+                        source_vertex, identifier)
+
+                # update mapping object
+                graph_mapper.add_edge_mappings(machine_edges, application_edge)
+
+            # add constraints from the application partition
+            if machine_partition is not None:
+                machine_partition.add_constraints(
+                    application_partition.constraints)
 
 
 def get_remaining_constraints(vertex):
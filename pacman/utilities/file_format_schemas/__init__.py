@@ -37,3 +37,29 @@ def validate(json_obj, schema_filename):
     schema_file = os.path.join(os.path.dirname(__file__), schema_filename)
     with open(schema_file, "r") as f:
         jsonschema.validate(json_obj, json.load(f))
+
+
+def validate_items(schema_filename):
+    """ Get a function that checks that a single item of a JSON array is\
+        valid against the ``items`` of the given array schema, so that a\
+        large array can be validated one item at a time.
+
+    :param schema_filename: \
+        The name of the file containing the schema of the array\
+        (e.g., "router.json")
+    :type schema_filename: str
+    :return: A function that takes an item and raises if it isn't valid
+    :rtype: callable(dict or list, None)
+    :raises IOError: If the schema file doesn't exist.
+    """
+    schema_file = os.path.join(os.path.dirname(__file__), schema_filename)
+    with open(schema_file, "r") as f:
+        schema = json.load(f)
+
+    # Keep everything but the array itself, so references still resolve
+    item_schema = dict(schema)
+    del item_schema["type"]
+    del item_schema["items"]
+    item_schema.update(schema["items"])
+    validator = jsonschema.validators.validator_for(schema)(item_schema)
+    return validator.validate
@@ -15,6 +15,9 @@
 
 from .field import Field
 from .flexi_field import FlexiField
+from .free_space_tracker import FreeSpaceTracker
+from .resource_estimate_cache import ResourceEstimateCache
 from .resource_tracker import ResourceTracker
 
-__all__ = ["Field", "FlexiField", "ResourceTracker"]
+__all__ = ["Field", "FlexiField", "FreeSpaceTracker",
+           "ResourceEstimateCache", "ResourceTracker"]
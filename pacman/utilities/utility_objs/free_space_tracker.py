@@ -0,0 +1,146 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from sortedcontainers import SortedKeyList, SortedList
+from pacman.model.resources import ElementFreeSpace
+
+# The number of sizes of aligned blocks of elements, from 2^0 to 2^32
+_N_BLOCK_SIZES = 33
+
+
+def _get_start_address(space):
+    return space.start_address
+
+
+def _get_block_size(space):
+    """ Get the log2 of the size of the largest block of elements aligned\
+        to its size that fits in a free space.
+
+    :param space: The free space
+    :type space: ~pacman.model.resources.ElementFreeSpace
+    :rtype: int
+    """
+    size_bits = space.size.bit_length() - 1
+    block = 1 << size_bits
+    aligned = (space.start_address + block - 1) & ~(block - 1)
+    if aligned + block <= space.start_address + space.size:
+        return size_bits
+    # A block of half the size always fits
+    return size_bits - 1
+
+
+class FreeSpaceTracker(object):
+    """ The free spaces of a pool of elements, in order of start address,\
+        which can find a space by element or a space big enough for an\
+        aligned block of elements in time logarithmic in the number of\
+        free spaces.
+
+    The spaces can be read as a sequence of\
+    :py:class:`~pacman.model.resources.ElementFreeSpace`.
+    """
+
+    __slots__ = [
+        # The free spaces, sorted by start address
+        "_spaces",
+
+        # The start addresses of the free spaces, sorted, by the log2 of the
+        # size of the largest aligned block of elements that fits in them
+        "_starts_by_block_size"
+    ]
+
+    def __init__(self, start_address, size):
+        """
+        :param start_address: The first element of the pool
+        :type start_address: int
+        :param size: The number of elements in the pool
+        :type size: int
+        """
+        self._spaces = SortedKeyList(key=_get_start_address)
+        self._starts_by_block_size = [
+            SortedList() for _ in range(_N_BLOCK_SIZES)]
+        self._add(ElementFreeSpace(start_address, size))
+
+    def _add(self, space):
+        self._spaces.add(space)
+        self._starts_by_block_size[_get_block_size(space)].add(
+            space.start_address)
+
+    def __len__(self):
+        return len(self._spaces)
+
+    def __getitem__(self, index):
+        return self._spaces[index]
+
+    def __iter__(self):
+        return iter(self._spaces)
+
+    def __repr__(self):
+        return repr(list(self._spaces))
+
+    def find_space(self, element_id):
+        """ Find the free space with the largest start address that is no\
+            more than an element.
+
+        :param element_id: The element to find the space of
+        :type element_id: int
+        :return: The index of the space, or None if there is no such space
+        :rtype: int or None
+        """
+        index = self._spaces.bisect_key_right(element_id) - 1
+        if index < 0:
+            return None
+        return index
+
+    def find_block_space(self, n_elements, index=0):
+        """ Find the first free space, from a given one onwards, big enough\
+            for a block of elements aligned to the size of the block.
+
+        :param n_elements: \
+            The number of elements in the block; must be a power of 2
+        :type n_elements: int
+        :param index: The index of the first free space to consider
+        :type index: int
+        :return: The index of the space, or None if there is no such space
+        :rtype: int or None
+        """
+        if index >= len(self._spaces):
+            return None
+        start_address = self._spaces[index].start_address
+        found = None
+        for starts in self._starts_by_block_size[
+                n_elements.bit_length() - 1:]:
+            position = starts.bisect_left(start_address)
+            if position < len(starts) and (
+                    found is None or starts[position] < found):
+                found = starts[position]
+        if found is None:
+            return None
+        return self._spaces.bisect_key_left(found)
+
+    def replace(self, index, spaces):
+        """ Replace a free space with some (smaller) free spaces within it.
+
+        :param index: The index of the space to replace
+        :type index: int
+        :param spaces: The spaces to replace it with; empty spaces are ignored
+        :type spaces: iterable(~pacman.model.resources.ElementFreeSpace)
+        """
+        space = self._spaces[index]
+        del self._spaces[index]
+        self._starts_by_block_size[_get_block_size(space)].remove(
+            space.start_address)
+        for new_space in spaces:
+            if new_space.size > 0:
+                self._add(new_space)
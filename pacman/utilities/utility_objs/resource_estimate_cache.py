@@ -0,0 +1,147 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections import OrderedDict
+from multiprocessing import Pool
+from multiprocessing.pool import ThreadPool
+from pacman.model.graphs.common import Slice
+
+
+def _estimate_vertex_slices(vertex_and_slices):
+    """ Estimate the resources of some slices of a vertex; run in a worker\
+        of the pool.
+
+    :param vertex_and_slices: The vertex and the (lo_atom, hi_atom) of\
+        each slice
+    :return: The resources used by each slice, in the same order
+    :rtype: list(~pacman.model.resources.ResourceContainer)
+    """
+    vertex, slices = vertex_and_slices
+    return [vertex.get_resources_used_by_atoms(Slice(lo_atom, hi_atom))
+            for lo_atom, hi_atom in slices]
+
+
+class ResourceEstimateCache(object):
+    """ A bounded cache of the resources used by slices of application\
+        vertices, so that a partitioner asks each vertex for the resources\
+        of each slice only once.
+
+    The least recently used estimates are dropped once the cache holds\
+    more than its maximum size.  The estimates of a set of slices can also\
+    be computed in advance in a pool of threads or processes.
+    """
+
+    __slots__ = [
+        # OrderedDict of (vertex, lo_atom, hi_atom) -> resources, from least
+        # to most recently used
+        "_estimates",
+
+        # The largest number of estimates to keep
+        "_max_size",
+
+        # The number of workers to compute estimates in advance with
+        "_n_workers",
+
+        # True if the estimates are computed in advance in processes rather
+        # than threads
+        "_use_processes"
+    ]
+
+    #: The largest number of estimates kept by default
+    DEFAULT_MAX_SIZE = 100000
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE, n_workers=None,
+                 use_processes=False):
+        """
+        :param max_size: The largest number of estimates to keep
+        :type max_size: int
+        :param n_workers: \
+            The number of threads or processes to compute estimates in\
+            advance with; if None or 1, :py:meth:`precompute` does nothing
+        :type n_workers: int or None
+        :param use_processes: \
+            True to compute estimates in advance in processes rather than\
+            threads; the vertices and the resources must then be picklable
+        :type use_processes: bool
+        """
+        self._estimates = OrderedDict()
+        self._max_size = max_size
+        self._n_workers = n_workers
+        self._use_processes = use_processes
+
+    def __len__(self):
+        return len(self._estimates)
+
+    def _store(self, key, resources):
+        self._estimates[key] = resources
+        while len(self._estimates) > self._max_size:
+            self._estimates.popitem(last=False)
+
+    def get_resources_used_by_atoms(self, vertex, vertex_slice):
+        """ Get the resources used by a slice of a vertex, asking the\
+            vertex only if they are not already known.
+
+        :param vertex: The application vertex
+        :type vertex: ~pacman.model.graphs.application.ApplicationVertex
+        :param vertex_slice: The slice of the vertex
+        :type vertex_slice: ~pacman.model.graphs.common.Slice
+        :rtype: ~pacman.model.resources.ResourceContainer
+        """
+        # A Slice holds a slice, which can't be hashed, so key on the atoms
+        key = (vertex, vertex_slice.lo_atom, vertex_slice.hi_atom)
+        resources = self._estimates.pop(key, None)
+        if resources is None:
+            resources = vertex.get_resources_used_by_atoms(vertex_slice)
+        self._store(key, resources)
+        return resources
+
+    def precompute(self, vertex_slices):
+        """ Compute the resources of several slices in a pool of workers\
+            and keep them, if the cache has more than one worker.  Slices\
+            whose resources are already known are not estimated again.
+
+        :param vertex_slices: The vertices and the slices of each to estimate
+        :type vertex_slices: iterable(tuple(\
+            ~pacman.model.graphs.application.ApplicationVertex,\
+            iterable(~pacman.model.graphs.common.Slice)))
+        """
+        if self._n_workers is None or self._n_workers <= 1:
+            return
+
+        # Send each vertex to the workers once, with all its slices
+        work = list()
+        for vertex, slices in vertex_slices:
+            slices = [
+                (vertex_slice.lo_atom, vertex_slice.hi_atom)
+                for vertex_slice in slices
+                if (vertex, vertex_slice.lo_atom, vertex_slice.hi_atom)
+                not in self._estimates]
+            if slices:
+                work.append((vertex, slices))
+        if not work:
+            return
+
+        pool_type = Pool if self._use_processes else ThreadPool
+        pool = pool_type(min(self._n_workers, len(work)))
+        try:
+            results = pool.map(_estimate_vertex_slices, work)
+        finally:
+            pool.close()
+            pool.join()
+
+        # Store in order, so the slices estimated first are dropped first
+        for (vertex, slices), estimates in zip(work, results):
+            for (lo_atom, hi_atom), resources in zip(slices, estimates):
+                self._store((vertex, lo_atom, hi_atom), resources)
@@ -29,6 +29,146 @@ from pacman.exceptions import (
 from sortedcollections import ValueSortedDict
 from pacman.utilities import constants
 
+# The value stored in a chip index for a chip that cannot be used at all
+_UNUSABLE = float("-inf")
+
+
+class _ChipIndex(object):
+    """ An ordered index of chips, which can find the first chip (in the\
+        order in which the chips were added) that has at least a given\
+        amount of a resource, in time logarithmic in the number of chips.
+
+    This is a segment tree of maximum values over the chip positions.\
+    Removed chips leave a hole which is compacted away when the tree is\
+    next resized, so the relative order of the remaining chips is kept.
+    """
+
+    __slots__ = [
+        # The (x, y) key of the chip at each position, or None if removed
+        "_keys",
+
+        # The position of each key in _keys
+        "_positions",
+
+        # The number of leaves in the tree
+        "_size",
+
+        # The tree of maximum values; the leaves start at index _size
+        "_tree"
+    ]
+
+    def __init__(self):
+        self._keys = list()
+        self._positions = dict()
+        self._size = 1
+        self._tree = [_UNUSABLE, _UNUSABLE]
+
+    def __contains__(self, key):
+        return key in self._positions
+
+    def add(self, key, value):
+        """ Add a chip after all the chips already in the index
+
+        :param key: The (x, y) coordinates of the chip
+        :param value: The amount of resource available on the chip
+        """
+        if len(self._keys) == self._size:
+            self._resize()
+        position = len(self._keys)
+        self._keys.append(key)
+        self._positions[key] = position
+        self._set(position, value)
+
+    def remove(self, key):
+        """ Remove a chip from the index
+
+        :param key: The (x, y) coordinates of the chip
+        """
+        position = self._positions.pop(key)
+        self._keys[position] = None
+        self._set(position, _UNUSABLE)
+
+    def update(self, key, value):
+        """ Update the amount of resource available on a chip, if the chip\
+            is in the index
+
+        :param key: The (x, y) coordinates of the chip
+        :param value: The amount of resource available on the chip
+        """
+        position = self._positions.get(key)
+        if position is not None:
+            self._set(position, value)
+
+    def keys_with_at_least(self, value):
+        """ Iterate, in order, over the chips with at least the given amount\
+            of resource available
+
+        :param value: The amount of resource needed
+        :rtype: iterable(tuple(int, int))
+        """
+        position = self._find(value, 0)
+        while position is not None:
+            yield self._keys[position]
+            position = self._find(value, position + 1)
+
+    def _set(self, position, value):
+        tree = self._tree
+        node = position + self._size
+        tree[node] = value
+        node >>= 1
+        while node:
+            tree[node] = max(tree[2 * node], tree[2 * node + 1])
+            node >>= 1
+
+    def _find(self, value, start):
+        """ Find the first position at or after start with at least the\
+            given value
+
+        :rtype: int or None
+        """
+        size = self._size
+        tree = self._tree
+        if start >= size or tree[1] < value:
+            return None
+        node = start + size
+        if tree[node] < value:
+
+            # Go up until there is a subtree to the right which has a value
+            while True:
+                while node & 1:
+                    node >>= 1
+                if not node:
+                    return None
+                node += 1
+                if tree[node] >= value:
+                    break
+
+        # Go down to the leftmost leaf of that subtree with a value
+        while node < size:
+            node <<= 1
+            if tree[node] < value:
+                node += 1
+        return node - size
+
+    def _resize(self):
+        """ Compact out removed chips, growing the tree if it is more than\
+            half full
+        """
+        values = [self._tree[self._size + position]
+                  for position, key in enumerate(self._keys)
+                  if key is not None]
+        self._keys = [key for key in self._keys if key is not None]
+        self._positions = {key: position
+                           for position, key in enumerate(self._keys)}
+        if len(self._keys) * 2 > self._size:
+            self._size *= 2
+        size = self._size
+        tree = [_UNUSABLE] * (2 * size)
+        tree[size:size + len(values)] = values
+        for node in range(size - 1, 0, -1):
+            tree[node] = max(tree[2 * node], tree[2 * node + 1])
+        self._tree = tree
+
 
 class ResourceTracker(object):
     """ Tracks the usage of resources of a machine.
@@ -100,8 +240,20 @@ class ResourceTracker(object):
         "_real_chips_with_n_cores_available",
 
         # the number of virtual chips with the n cores currently available
-        "_virtual_chips_with_n_cores_available"
+        "_virtual_chips_with_n_cores_available",
 
+        # Index of the SDRAM available on the chips in _chips_available,
+        # in the same order, holding only chips with a core available
+        "_chip_index",
+
+        # Index of the SDRAM available on the chips of each board, in the
+        # order of the chips on the board, indexed by board address
+        # Note that entries are only added when a board is first used
+        "_board_chip_indexes",
+
+        # The board index containing each chip, indexed by the (x, y) tuple
+        # of coordinates of the chip
+        "_chip_board_index"
     ]
 
     def __init__(self, machine, plan_n_timesteps, chips=None,
@@ -211,6 +363,16 @@ class ResourceTracker(object):
             for x, y in chips:
                 self._chips_available.add((x, y))
 
+        # Index of the chips available, to find the first chip which fits
+        # without checking every chip
+        self._chip_index = _ChipIndex()
+        for key in self._chips_available:
+            self._chip_index.add(key, self._chip_index_value(key))
+
+        # Indexes of the chips on each board
+        self._board_chip_indexes = dict()
+        self._chip_board_index = dict()
+
     def _convert_preallocated_resources(self, preallocated_resources):
         """ Allocates preallocated SDRAM and specific cores to the trackers.\
             Also builds an arbitrary core map for use throughout resource\
@@ -419,6 +581,71 @@ class ResourceTracker(object):
                 if self._chip_available(x, y):
                     yield (x, y)
 
+    def _chip_index_value(self, key):
+        """ Get the value of a chip in the chip indexes; this is the SDRAM\
+            available if the chip has a core available, or a value which is\
+            never enough otherwise
+
+        :param key: The (x, y) coordinates of the chip
+        :type key: tuple(int, int)
+        """
+        if not self._chip_available(*key):
+            return _UNUSABLE
+        return self._sdram_tracker[key]
+
+    def _update_chip_index(self, key):
+        """ Update the chip indexes after a change to the resources of a chip
+
+        :param key: The (x, y) coordinates of the chip
+        :type key: tuple(int, int)
+        """
+        value = self._chip_index_value(key)
+        self._chip_index.update(key, value)
+        board_index = self._chip_board_index.get(key)
+        if board_index is not None:
+            board_index.update(key, value)
+
+    def _get_board_chip_index(self, board_address):
+        """ Get the index of the chips on a board, creating it if needed
+
+        :param board_address: the address of the board
+        :type board_address: str
+        :rtype: _ChipIndex
+        """
+        board_index = self._board_chip_indexes.get(board_address)
+        if board_index is None:
+            board_index = _ChipIndex()
+            eth_chip = self._machine.get_chip_at(
+                *self._ethernet_chips[board_address])
+            for key in self._machine.get_existing_xys_on_board(eth_chip):
+                board_index.add(key, self._chip_index_value(key))
+                self._chip_board_index[key] = board_index
+            self._board_chip_indexes[board_address] = board_index
+        return board_index
+
+    def _get_indexed_chips(self, board_address, sdram):
+        """ Get the chips which have a core and the given SDRAM available,\
+            in the same order as :py:meth:`_get_usable_chips` would check\
+            them when not given any chips
+
+        :param board_address: the board address to check for usable chips on
+        :type board_address: str or None
+        :param sdram: the amount of SDRAM needed
+        :type sdram: int
+        :return: iterable of tuples of (x, y) coordinates of usable chips
+        :rtype: iterable(tuple(int, int))
+        :raise PacmanInvalidParameterException:
+            If the board address is unknown
+        """
+        if board_address is None:
+            return self._chip_index.keys_with_at_least(sdram)
+        if board_address not in self._ethernet_chips:
+            raise PacmanInvalidParameterException(
+                "board_address", str(board_address),
+                "Unrecognised board address")
+        return self._get_board_chip_index(board_address).keys_with_at_least(
+            sdram)
+
     def _check_chip_not_used(self, chips):
         """
         Check to see if any of the candidates chip have already been used.
@@ -774,6 +1001,7 @@ class ResourceTracker(object):
         """
         self._sdram_tracker[chip.x, chip.y] -= \
             resources.sdram.get_total_sdram(self._plan_n_timesteps)
+        self._update_chip_index((chip.x, chip.y))
 
     def _allocate_core(self, chip, key, processor_id):
         """ Allocates a core on the given chip
@@ -807,9 +1035,11 @@ class ResourceTracker(object):
 
         if len(self._core_tracker[key]) == self._n_cores_preallocated[key]:
             self._chips_available.remove(key)
+            self._chip_index.remove(key)
 
         # update chip tracker
         self._chips_used.add(key)
+        self._update_chip_index(key)
 
         # return processor ID
         return processor_id
@@ -1205,8 +1435,17 @@ class ResourceTracker(object):
         :raises pacman.exceptions.PacmanValueError: \
             If there isn't a chip available that can take the allocation.
         """
+        # If any chip can be used, only chips with a free core and enough
+        # SDRAM need to be looked at, and these can be found in the index
+        if chips is None and processor_id is None:
+            usable_chips = self._get_indexed_chips(
+                board_address,
+                resources.sdram.get_total_sdram(self._plan_n_timesteps))
+        else:
+            usable_chips = self._get_usable_chips(chips, board_address)
+
         # Find the first usable chip which fits the resources
-        for (chip_x, chip_y) in self._get_usable_chips(chips, board_address):
+        for (chip_x, chip_y) in usable_chips:
             chip = self._machine.get_chip_at(chip_x, chip_y)
             key = (chip_x, chip_y)
 
@@ -1462,6 +1701,11 @@ class ResourceTracker(object):
                     self._reverse_ip_tag_listen_port.remove(
                         (board_address, port))
 
+        # Update the indexes with the resources released
+        if (chip_x, chip_y) not in self._chip_index:
+            self._chip_index.add((chip_x, chip_y), _UNUSABLE)
+        self._update_chip_index((chip_x, chip_y))
+
     def is_chip_available(self, chip_x, chip_y):
         """ Check if a given chip is available
 
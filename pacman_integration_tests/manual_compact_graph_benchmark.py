@@ -0,0 +1,54 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+""" Measures the memory used by the edge indices of a machine graph with\
+    half a million edges, with and without compact edge storage.
+
+Usage: python manual_compact_graph_benchmark.py
+"""
+
+import random
+import time
+import tracemalloc
+from pacman.model.graphs.machine import (
+    MachineEdge, MachineGraph, SimpleMachineVertex)
+
+N_VERTICES = 5000
+N_EDGES = 500000
+
+rng = random.Random(0)
+vertices = [SimpleMachineVertex(None) for _ in range(N_VERTICES)]
+edges = [MachineEdge(pre_vertex, rng.choice(vertices))
+         for pre_vertex in vertices
+         for _ in range(N_EDGES // N_VERTICES)]
+
+for compact in (False, True):
+    tracemalloc.start()
+    start = time.time()
+    graph = MachineGraph("Benchmark", compact=compact)
+    graph.add_vertices(vertices)
+    graph.add_edges(edges, "Test")
+    built = time.time() - start
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    start = time.time()
+    for vertex in vertices:
+        graph.get_edges_starting_at_vertex(vertex)
+        graph.get_edges_ending_at_vertex(vertex)
+    print("compact={}: built in {:.2f}s using {:.0f}MB,"
+          " queried every vertex in {:.2f}s".format(
+              compact, built, memory / 1e6, time.time() - start))
+    del graph
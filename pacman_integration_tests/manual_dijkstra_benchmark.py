@@ -0,0 +1,73 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Times BasicDijkstraRouting on synthetic all-to-all and sparse graphs.
+
+Usage: python manual_dijkstra_benchmark.py
+"""
+
+import random
+import time
+from spinn_machine import virtual_machine
+from pacman.model.graphs.machine import (
+    MachineGraph, MachineEdge, SimpleMachineVertex)
+from pacman.model.placements import Placements, Placement
+from pacman.model.resources import ResourceContainer
+from pacman.operations.router_algorithms import BasicDijkstraRouting
+
+
+def make_graph(machine, n_vertices, n_edges_per_vertex, seed=0):
+    """ Place vertices in turn on the cores of the machine, and connect each\
+        to the given number of others (or to all others if None)
+    """
+    graph = MachineGraph("Benchmark")
+    placements = Placements()
+    vertices = list()
+    cores = ((chip.x, chip.y, p.processor_id)
+             for chip in machine.chips for p in chip.processors
+             if not p.is_monitor)
+    for _, (x, y, p) in zip(range(n_vertices), cores):
+        vertex = SimpleMachineVertex(resources=ResourceContainer())
+        graph.add_vertex(vertex)
+        placements.add_placement(Placement(vertex, x, y, p))
+        vertices.append(vertex)
+    rng = random.Random(seed)
+    for vertex in vertices:
+        if n_edges_per_vertex is None:
+            targets = vertices
+        else:
+            targets = rng.sample(vertices, n_edges_per_vertex)
+        for target in targets:
+            if target != vertex:
+                graph.add_edge(MachineEdge(vertex, target), "Test")
+    return graph, placements
+
+
+def run(name, machine, graph, placements):
+    start = time.time()
+    BasicDijkstraRouting()(placements, machine, graph,
+                           use_progress_bar=False)
+    print("{}: {} vertices, {} edges on {} chips: {:.2f}s".format(
+        name, graph.n_vertices, len(graph.edges), machine.n_chips,
+        time.time() - start))
+
+
+m = virtual_machine(width=8, height=8)
+g, pl = make_graph(m, 200, None)
+run("All-to-all", m, g, pl)
+
+m = virtual_machine(width=48, height=48)
+g, pl = make_graph(m, 1000, 4)
+run("Sparse", m, g, pl)
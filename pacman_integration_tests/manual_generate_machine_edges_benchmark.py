@@ -0,0 +1,93 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+""" Times generate_machine_edges on an all-to-all application graph that\
+    becomes a million machine edges, against adding the machine edges one\
+    at a time.
+
+Usage: python manual_generate_machine_edges_benchmark.py
+"""
+
+import time
+from pacman.model.graphs.application import ApplicationEdge, ApplicationGraph
+from pacman.model.graphs.common import GraphMapper, Slice
+from pacman.model.graphs.machine import MachineGraph
+from pacman.model.resources import ResourceContainer
+from pacman.utilities.algorithm_utilities.partition_algorithm_utilities \
+    import generate_machine_edges
+from uinit_test_objects import SimpleTestVertex
+
+N_VERTICES = 100
+N_SPLITS = 10
+ATOMS_PER_SPLIT = 10
+
+
+def per_edge_generate_machine_edges(
+        machine_graph, graph_mapper, application_graph):
+    """ Make the machine edges by adding each to the graph and mapper in\
+        turn
+    """
+    for source_vertex in machine_graph.vertices:
+        vertex = graph_mapper.get_application_vertex(source_vertex)
+        for application_partition in application_graph.\
+                get_outgoing_edge_partitions_starting_at_vertex(vertex):
+            for application_edge in application_partition.edges:
+                for dest_vertex in graph_mapper.get_machine_vertices(
+                        application_edge.post_vertex):
+                    machine_edge = application_edge.create_machine_edge(
+                        source_vertex, dest_vertex,
+                        "machine_edge_for{}".format(application_edge.label))
+                    machine_graph.add_edge(
+                        machine_edge, application_partition.identifier)
+                    machine_partition = machine_graph.\
+                        get_outgoing_edge_partition_starting_at_vertex(
+                            source_vertex, application_partition.identifier)
+                    machine_partition.add_constraints(
+                        application_partition.constraints)
+                    graph_mapper.add_edge_mapping(
+                        machine_edge, application_edge)
+
+
+def make_graphs():
+    app_graph = ApplicationGraph("Benchmark")
+    vertices = [SimpleTestVertex(N_SPLITS * ATOMS_PER_SPLIT)
+                for _ in range(N_VERTICES)]
+    app_graph.add_vertices(vertices)
+    for pre_vertex in vertices:
+        for post_vertex in vertices:
+            app_graph.add_edge(
+                ApplicationEdge(pre_vertex, post_vertex), "Test")
+    machine_graph = MachineGraph("Benchmark")
+    graph_mapper = GraphMapper()
+    for vertex in vertices:
+        for i in range(N_SPLITS):
+            vertex_slice = Slice(
+                i * ATOMS_PER_SPLIT, (i + 1) * ATOMS_PER_SPLIT - 1)
+            machine_vertex = vertex.create_machine_vertex(
+                vertex_slice, ResourceContainer())
+            machine_graph.add_vertex(machine_vertex)
+            graph_mapper.add_vertex_mapping(
+                machine_vertex, vertex_slice, vertex)
+    return app_graph, machine_graph, graph_mapper
+
+
+for name, generate in [("Per edge", per_edge_generate_machine_edges),
+                       ("generate_machine_edges", generate_machine_edges)]:
+    app_g, machine_g, mapper = make_graphs()
+    start = time.time()
+    generate(machine_g, mapper, app_g)
+    print("{}: {} machine edges: {:.2f}s".format(
+        name, len(machine_g.edges), time.time() - start))
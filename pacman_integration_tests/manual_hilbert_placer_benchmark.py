@@ -0,0 +1,42 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Times the Hilbert ordering of the chips of a 1200 board virtual machine,\
+    and HilbertPlacer placing vertices on it.
+
+Usage: python manual_hilbert_placer_benchmark.py [n_vertices]
+"""
+
+import sys
+import time
+from spinn_machine import virtual_machine
+from pacman.model.graphs.machine import MachineGraph, SimpleMachineVertex
+from pacman.model.resources import ResourceContainer
+from pacman.operations.rigged_algorithms import HilbertPlacer
+
+N_VERTICES = 2000
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else N_VERTICES
+m = virtual_machine(width=240, height=240)
+start = time.time()
+chips = list(HilbertPlacer()._generate_hilbert_chips(m))
+print("Ordered {} chips: {:.3f}s".format(len(chips), time.time() - start))
+
+g = MachineGraph("Benchmark")
+for _ in range(n):
+    g.add_vertex(SimpleMachineVertex(resources=ResourceContainer()))
+start = time.time()
+HilbertPlacer()(g, m, 100)
+print("Placed {} vertices: {:.2f}s".format(n, time.time() - start))
@@ -0,0 +1,79 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Times the malloc based routing key allocator on a machine graph with\
+    many outgoing edge partitions needing different numbers of keys, some\
+    of them fixed at scattered keys, so that the key space becomes\
+    fragmented.
+
+Usage: python manual_key_allocation_benchmark.py [n_partitions]
+"""
+
+import random
+import sys
+import time
+from pacman.model.constraints.key_allocator_constraints import (
+    FixedKeyAndMaskConstraint)
+from pacman.model.graphs.machine import (
+    MachineEdge, MachineGraph, SimpleMachineVertex)
+from pacman.model.routing_info import (
+    BaseKeyAndMask, DictBasedMachinePartitionNKeysMap)
+from pacman.operations.routing_info_allocator_algorithms import (
+    MallocBasedRoutingInfoAllocator)
+
+N_PARTITIONS = 500000
+PARTITIONS_PER_VERTEX = 10
+
+# The numbers of keys the partitions need, which are mostly not powers of
+# two so that each allocation leaves a gap
+N_KEYS = [1, 3, 5, 17, 33, 100, 255, 1000]
+
+# One partition in this many has a single fixed key, somewhere in the part
+# of the key space that the others will mostly fill
+FIXED_EVERY = 10
+FIXED_KEYS_PER_PARTITION = 256
+
+
+def make_graph(n_partitions, seed=0):
+    rng = random.Random(seed)
+    graph = MachineGraph("Benchmark")
+    n_keys_map = DictBasedMachinePartitionNKeysMap()
+    vertices = [SimpleMachineVertex(resources=None)
+                for _ in range(n_partitions // PARTITIONS_PER_VERTEX)]
+    for vertex in vertices:
+        graph.add_vertex(vertex)
+    fixed_keys = iter(rng.sample(
+        range(n_partitions * FIXED_KEYS_PER_PARTITION), n_partitions))
+    for i, vertex in enumerate(vertices):
+        target = vertices[(i + 1) % len(vertices)]
+        for p in range(PARTITIONS_PER_VERTEX):
+            graph.add_edge(MachineEdge(vertex, target), str(p))
+            partition = graph.get_outgoing_edge_partition_starting_at_vertex(
+                vertex, str(p))
+            if rng.randrange(FIXED_EVERY) == 0:
+                partition.add_constraint(FixedKeyAndMaskConstraint(
+                    [BaseKeyAndMask(next(fixed_keys), 0xFFFFFFFF)]))
+                n_keys_map.set_n_keys_for_partition(partition, 1)
+            else:
+                n_keys_map.set_n_keys_for_partition(
+                    partition, rng.choice(N_KEYS))
+    return graph, n_keys_map
+
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else N_PARTITIONS
+g, keys_map = make_graph(n)
+start = time.time()
+MallocBasedRoutingInfoAllocator()(g, keys_map)
+print("{} partitions: {:.2f}s".format(n, time.time() - start))
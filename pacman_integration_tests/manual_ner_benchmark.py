@@ -0,0 +1,43 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Times the NER routing of single nets with many destinations on a 1200\
+    board virtual machine.
+
+Usage: python manual_ner_benchmark.py
+"""
+
+import random
+import time
+from spinn_machine import virtual_machine
+from pacman.operations.router_algorithms.ner_route import _ner_net
+
+N_DESTINATIONS = [1000, 2000, 5000, 10000]
+
+
+def random_net(machine, n_destinations, seed=0):
+    rng = random.Random(seed)
+    chips = sorted(machine.chip_coordinates)
+    source = rng.choice(chips)
+    return source, rng.sample(chips, n_destinations)
+
+
+m = virtual_machine(width=240, height=240)
+for n in N_DESTINATIONS:
+    src, dests = random_net(m, n)
+    start = time.time()
+    _, route = _ner_net(src, dests, m)
+    print("{} destinations: {} nodes in tree: {:.2f}s".format(
+        n, len(route), time.time() - start))
@@ -0,0 +1,41 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Times ordered covering compression of the tables in\
+    malloc_hard_routing_tables.json.gz
+
+Usage: python manual_ordered_covering_benchmark.py
+"""
+
+import os
+import time
+from pacman.model.routing_tables.multicast_routing_tables import from_json
+from pacman.operations.router_compressors import Entry
+from pacman.operations.router_compressors.mundys_router_compressor.\
+    ordered_covering import ordered_covering
+
+path = os.path.dirname(os.path.abspath(__file__))
+tables = from_json(os.path.join(path, "malloc_hard_routing_tables.json.gz"))
+total = 0.0
+for table in sorted(tables, key=lambda t: (t.x, t.y)):
+    entries = [Entry.from_MulticastRoutingEntry(entry)
+               for entry in table.multicast_routing_entries]
+    start = time.time()
+    compressed, _ = ordered_covering(entries, None)
+    taken = time.time() - start
+    total += taken
+    print("({}, {}): {} entries to {}: {:.2f}s".format(
+        table.x, table.y, len(entries), len(compressed), taken))
+print("Total: {:.2f}s".format(total))
@@ -0,0 +1,60 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Counts the resource estimates PartitionAndPlacePartitioner makes, and\
+    times it, for vertices whose cores are limited by SDRAM well below\
+    their maximum atoms per core.
+
+Usage: python manual_partitioner_benchmark.py [n_vertices]
+"""
+
+import sys
+import time
+from spinn_machine import virtual_machine
+from pacman.model.graphs.application import ApplicationGraph
+from pacman.operations.partition_algorithms import PartitionAndPlacePartitioner
+from uinit_test_objects import SimpleTestVertex
+
+N_VERTICES = 100
+N_ATOMS = 20000
+MAX_ATOMS_PER_CORE = 5000
+SDRAM_PER_ATOM = 100000
+
+
+class BenchmarkVertex(SimpleTestVertex):
+    """ A vertex that counts the estimates of its resources
+    """
+    n_estimates = 0
+
+    def get_resources_used_by_atoms(self, vertex_slice):
+        BenchmarkVertex.n_estimates += 1
+        return super(BenchmarkVertex, self).get_resources_used_by_atoms(
+            vertex_slice)
+
+    def get_sdram_usage_for_atoms(self, vertex_slice, graph):
+        return SDRAM_PER_ATOM * vertex_slice.n_atoms
+
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else N_VERTICES
+g = ApplicationGraph("Benchmark")
+g.add_vertices([
+    BenchmarkVertex(N_ATOMS, max_atoms_per_core=MAX_ATOMS_PER_CORE)
+    for _ in range(n)])
+m = virtual_machine(width=96, height=96)
+start = time.time()
+machine_graph, _, _ = PartitionAndPlacePartitioner()(g, m, 100)
+print("{} vertices into {} machine vertices: {} estimates, {:.2f}s".format(
+    n, machine_graph.n_vertices, BenchmarkVertex.n_estimates,
+    time.time() - start))
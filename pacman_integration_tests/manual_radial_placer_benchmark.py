@@ -0,0 +1,53 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Times RadialPlacer on vertices with radial placement constraints from a\
+    few chips of a 192 board virtual machine.
+
+Usage: python manual_radial_placer_benchmark.py [n_vertices]
+"""
+
+import random
+import sys
+import time
+from spinn_machine import virtual_machine
+from pacman.model.constraints.placer_constraints import (
+    RadialPlacementFromChipConstraint)
+from pacman.model.graphs.machine import MachineGraph, SimpleMachineVertex
+from pacman.model.resources import ResourceContainer
+from pacman.operations.placer_algorithms import RadialPlacer
+
+N_VERTICES = 100000
+N_STARTS = 4
+
+
+def make_graph(machine, n_vertices, seed=0):
+    rng = random.Random(seed)
+    starts = rng.sample(sorted(machine.chip_coordinates), N_STARTS)
+    graph = MachineGraph("Benchmark")
+    for _ in range(n_vertices):
+        x, y = rng.choice(starts)
+        graph.add_vertex(SimpleMachineVertex(
+            resources=ResourceContainer(),
+            constraints=[RadialPlacementFromChipConstraint(x, y)]))
+    return graph
+
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else N_VERTICES
+m = virtual_machine(width=96, height=96)
+g = make_graph(m, n)
+start = time.time()
+RadialPlacer()(g, m, 100)
+print("{} vertices: {:.2f}s".format(n, time.time() - start))
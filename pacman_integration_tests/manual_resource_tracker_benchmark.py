@@ -0,0 +1,67 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Places machine vertices on a 1200 board virtual machine with the\
+    resource tracker, and reports the allocations per second both when\
+    scanning the available chips in turn (as was done before the chip index)\
+    and when using the chip index.
+
+Usage: python manual_resource_tracker_benchmark.py [n_vertices]
+"""
+
+import sys
+import time
+from spinn_machine import virtual_machine
+from pacman.model.resources import ResourceContainer, ConstantSDRAM
+from pacman.utilities.utility_objs import ResourceTracker
+
+# 20 x 20 triads of boards
+WIDTH = 240
+HEIGHT = 240
+N_VERTICES = 100000
+
+# One vertex in this many asks for more than half the SDRAM of a chip, so
+# that many chips have free cores but not enough SDRAM for the next one
+BIG_EVERY = 10
+
+
+def resources_for(machine):
+    sdram = machine.get_chip_at(0, 0).sdram.size
+    small = ResourceContainer(sdram=ConstantSDRAM(sdram // 100))
+    big = ResourceContainer(sdram=ConstantSDRAM(sdram // 2 + 1))
+    return small, big
+
+
+def place(machine, n_vertices, scan):
+    tracker = ResourceTracker(machine, plan_n_timesteps=None)
+    small, big = resources_for(machine)
+    start = time.time()
+    for i in range(n_vertices):
+        resources = big if i % BIG_EVERY == 0 else small
+        if scan:
+            # Passing the chips forces every available chip to be checked
+            tracker.allocate_resources(
+                resources, chips=tracker.chips_available)
+        else:
+            tracker.allocate_resources(resources)
+    return n_vertices / (time.time() - start)
+
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else N_VERTICES
+m = virtual_machine(width=WIDTH, height=HEIGHT)
+print("Machine with {} chips on {} boards".format(
+    m.n_chips, len(m.ethernet_connected_chips)))
+print("Scanning: {:.0f} allocations per second".format(place(m, n, True)))
+print("Indexed: {:.0f} allocations per second".format(place(m, n, False)))
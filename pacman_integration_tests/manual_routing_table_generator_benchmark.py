@@ -0,0 +1,73 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Times BasicRoutingTableGenerator on synthetic routes of many partitions\
+    through many chips of a 1200 board virtual machine.
+
+Usage: python manual_routing_table_generator_benchmark.py [n_partitions]
+"""
+
+import random
+import sys
+import time
+from spinn_machine import virtual_machine
+from pacman.model.graphs.machine import (
+    MachineEdge, MachineGraph, SimpleMachineVertex)
+from pacman.model.routing_info import (
+    BaseKeyAndMask, PartitionRoutingInfo, RoutingInfo)
+from pacman.model.routing_table_by_partition import (
+    MulticastRoutingTableByPartition, MulticastRoutingTableByPartitionEntry)
+from pacman.operations.routing_table_generators.\
+    basic_routing_table_generator import BasicRoutingTableGenerator
+
+N_PARTITIONS = 200000
+PARTITIONS_PER_VERTEX = 10
+CHIPS_PER_PARTITION = 20
+
+
+def make_routes(machine, n_partitions, seed=0):
+    rng = random.Random(seed)
+    chips = sorted(machine.chip_coordinates)
+    graph = MachineGraph("Benchmark")
+    routing_infos = RoutingInfo()
+    routes = MulticastRoutingTableByPartition()
+    vertices = [SimpleMachineVertex(resources=None)
+                for _ in range(n_partitions // PARTITIONS_PER_VERTEX)]
+    for vertex in vertices:
+        graph.add_vertex(vertex)
+    key = 0
+    for vertex in vertices:
+        for p in range(PARTITIONS_PER_VERTEX):
+            graph.add_edge(MachineEdge(vertex, vertex), str(p))
+            partition = graph.get_outgoing_edge_partition_starting_at_vertex(
+                vertex, str(p))
+            routing_infos.add_partition_info(PartitionRoutingInfo(
+                [BaseKeyAndMask(key, 0xFFFFFF00)], partition))
+            key += 0x100
+            for x, y in rng.sample(chips, CHIPS_PER_PARTITION):
+                routes.add_path_entry(MulticastRoutingTableByPartitionEntry(
+                    rng.randrange(6), [rng.randrange(1, 18)],
+                    incoming_link=rng.randrange(6)), x, y, partition)
+    return routing_infos, routes
+
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else N_PARTITIONS
+m = virtual_machine(width=240, height=240)
+infos, by_partition = make_routes(m, n)
+start = time.time()
+tables = BasicRoutingTableGenerator()(infos, by_partition, m)
+print("{} entries in {} tables: {:.2f}s".format(
+    sum(table.number_of_entries for table in tables.routing_tables),
+    len(tables.routing_tables), time.time() - start))
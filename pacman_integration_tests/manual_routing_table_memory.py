@@ -0,0 +1,65 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Reports the memory used by routing tables holding a million entries,\
+    added as MulticastRoutingEntry objects and, where the tables support it,\
+    added directly by key, mask, route and defaultable.
+
+Usage: python manual_routing_table_memory.py
+"""
+
+import random
+import tracemalloc
+from spinn_machine import MulticastRoutingEntry
+from pacman.model.routing_tables import (
+    MulticastRoutingTable, MulticastRoutingTables)
+
+N_TABLES = 1000
+N_ENTRIES_PER_TABLE = 1000
+
+
+def entries(seed=0):
+    rng = random.Random(seed)
+    for i in range(N_ENTRIES_PER_TABLE):
+        yield (i << 11, 0xFFFFF800, rng.getrandbits(24), rng.random() < 0.5)
+
+
+def by_object(table):
+    for key, mask, route, defaultable in entries():
+        table.add_multicast_routing_entry(MulticastRoutingEntry(
+            key, mask, defaultable=defaultable, spinnaker_route=route))
+
+
+def by_value(table):
+    for key, mask, route, defaultable in entries():
+        table.add_entry(key, mask, route, defaultable)
+
+
+def measure(name, add):
+    tracemalloc.start()
+    tables = MulticastRoutingTables()
+    for x in range(N_TABLES):
+        table = MulticastRoutingTable(x, 0)
+        add(table)
+        tables.add_routing_table(table)
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print("{}: {:.1f} MB per million entries".format(
+        name, used * 1e6 / (N_TABLES * N_ENTRIES_PER_TABLE) / 2 ** 20))
+
+
+measure("MulticastRoutingEntry objects", by_object)
+if hasattr(MulticastRoutingTable, "add_entry"):
+    measure("Keys, masks and routes", by_value)
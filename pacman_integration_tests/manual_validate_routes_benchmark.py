@@ -0,0 +1,74 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Times validate_routes on the routes of randomly connected vertices\
+    spread over a 48 board virtual machine.
+
+Usage: python manual_validate_routes_benchmark.py [n_vertices]
+"""
+
+import random
+import sys
+import time
+from spinn_machine import virtual_machine
+from pacman.model.graphs.machine import (
+    MachineEdge, MachineGraph, SimpleMachineVertex)
+from pacman.model.placements import Placement, Placements
+from pacman.model.resources import ResourceContainer
+from pacman.model.routing_info import (
+    BaseKeyAndMask, PartitionRoutingInfo, RoutingInfo)
+from pacman.operations.multi_cast_router_check_functionality import (
+    validate_routes)
+from pacman.operations.router_algorithms import NerRoute
+from pacman.operations.routing_table_generators.\
+    basic_routing_table_generator import BasicRoutingTableGenerator
+
+N_VERTICES = 5000
+TARGETS_PER_VERTEX = 8
+
+
+def make_graph(machine, n_vertices, seed=0):
+    rng = random.Random(seed)
+    graph = MachineGraph("Benchmark")
+    placements = Placements()
+    cores = [(chip.x, chip.y, p.processor_id)
+             for chip in machine.chips for p in chip.processors
+             if not p.is_monitor]
+    vertices = list()
+    for x, y, p in rng.sample(cores, n_vertices):
+        vertex = SimpleMachineVertex(resources=ResourceContainer())
+        graph.add_vertex(vertex)
+        placements.add_placement(Placement(vertex, x, y, p))
+        vertices.append(vertex)
+    routing_infos = RoutingInfo()
+    for i, vertex in enumerate(vertices):
+        for target in rng.sample(vertices, TARGETS_PER_VERTEX):
+            graph.add_edge(MachineEdge(vertex, target), "Test")
+        partition = graph.get_outgoing_edge_partition_starting_at_vertex(
+            vertex, "Test")
+        routing_infos.add_partition_info(PartitionRoutingInfo(
+            [BaseKeyAndMask(i << 8, 0xFFFFFF00)], partition))
+    return graph, placements, routing_infos
+
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else N_VERTICES
+m = virtual_machine(width=48, height=48)
+g, pl, infos = make_graph(m, n)
+tables = BasicRoutingTableGenerator()(infos, NerRoute()(g, m, pl), m)
+start = time.time()
+validate_routes(g, pl, infos, tables, m)
+print("{} vertices, {} entries in {} tables: {:.2f}s".format(
+    n, sum(table.number_of_entries for table in tables.routing_tables),
+    len(tables.routing_tables), time.time() - start))
@@ -0,0 +1,92 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Times ZonedRoutingTableGenerator on synthetic routes of the partitions\
+    of many application vertices through many chips of a 1200 board virtual\
+    machine, where the machine vertices of most application vertices take\
+    the same route through a chip.
+
+Usage: python manual_zoned_routing_table_generator_benchmark.py \
+    [n_app_vertices]
+"""
+
+import random
+import sys
+import time
+from spinn_machine import virtual_machine
+from pacman.model.graphs.common import GraphMapper, Slice
+from pacman.model.graphs.machine import (
+    MachineEdge, MachineGraph, SimpleMachineVertex)
+from pacman.model.routing_info import (
+    BaseKeyAndMask, PartitionRoutingInfo, RoutingInfo)
+from pacman.model.routing_table_by_partition import (
+    MulticastRoutingTableByPartition, MulticastRoutingTableByPartitionEntry)
+from pacman.operations.routing_table_generators.\
+    zoned_routing_table_generator import ZonedRoutingTableGenerator
+from uinit_test_objects import SimpleTestVertex
+
+N_APP_VERTICES = 2000
+MACHINE_VERTICES_PER_APP_VERTEX = 50
+CHIPS_PER_APP_VERTEX = 40
+SHARED_ROUTE_PROBABILITY = 0.8
+
+
+def make_routes(machine, n_app_vertices, seed=0):
+    rng = random.Random(seed)
+    chips = sorted(machine.chip_coordinates)
+    graph = MachineGraph("Benchmark")
+    mapper = GraphMapper()
+    routing_infos = RoutingInfo()
+    info_by_app_vertex = dict()
+    routes = MulticastRoutingTableByPartition()
+    for app_index in range(n_app_vertices):
+        app_vertex = SimpleTestVertex(MACHINE_VERTICES_PER_APP_VERTEX)
+        info_by_app_vertex[app_vertex] = BaseKeyAndMask(
+            app_index << 16, 0xFFFF0000)
+        partitions = list()
+        for index in range(MACHINE_VERTICES_PER_APP_VERTEX):
+            vertex = SimpleMachineVertex(resources=None)
+            graph.add_vertex(vertex)
+            mapper.add_vertex_mapping(vertex, Slice(index, index), app_vertex)
+            graph.add_edge(MachineEdge(vertex, vertex), "Test")
+            partition = graph.get_outgoing_edge_partition_starting_at_vertex(
+                vertex, "Test")
+            routing_infos.add_partition_info(PartitionRoutingInfo(
+                [BaseKeyAndMask(app_index << 16 | index << 8, 0xFFFFFF00)],
+                partition))
+            partitions.append(partition)
+        for x, y in rng.sample(chips, CHIPS_PER_APP_VERTEX):
+            shared = rng.random() < SHARED_ROUTE_PROBABILITY
+            link = rng.randrange(6)
+            processor = rng.randrange(1, 18)
+            for partition in partitions:
+                if not shared:
+                    link = rng.randrange(6)
+                    processor = rng.randrange(1, 18)
+                routes.add_path_entry(MulticastRoutingTableByPartitionEntry(
+                    link, [processor], incoming_link=rng.randrange(6)),
+                    x, y, partition)
+    return routing_infos, routes, mapper, info_by_app_vertex
+
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else N_APP_VERTICES
+m = virtual_machine(width=240, height=240)
+infos, by_partition, graph_mapper, by_app_vertex = make_routes(m, n)
+start = time.time()
+tables = ZonedRoutingTableGenerator()(
+    infos, by_partition, m, graph_mapper, by_app_vertex)
+print("{} entries in {} tables: {:.2f}s".format(
+    sum(table.number_of_entries for table in tables.routing_tables),
+    len(tables.routing_tables), time.time() - start))
@@ -80,7 +80,8 @@ setup(
         'numpy',
         'lxml',
         'jsonschema',
-        'sortedcollections'],
+        'sortedcollections',
+        'sortedcontainers'],
     maintainer="SpiNNakerTeam",
     maintainer_email="spinnakerusers@googlegroups.com"
 )
@@ -143,6 +143,25 @@ class TestGraphMapper(unittest.TestCase):
             edge)
         self.assertIsNone(graph.get_application_edge(edges[1]))
 
+    def test_add_edge_mappings(self):
+        """
+        test adding several machine edges for an edge at once
+        """
+        vertices = [SimpleMachineVertex(None, "") for _ in range(3)]
+        machine_edges = [MachineEdge(vertices[0], vertices[1]),
+                         MachineEdge(vertices[0], vertices[2])]
+        other = MachineEdge(vertices[1], vertices[2])
+        graph = GraphMapper()
+        edge = SimpleTestEdge(SimpleTestVertex(10, "pre"),
+                              SimpleTestVertex(5, "post"))
+        graph.add_edge_mappings(machine_edges, edge)
+        graph.add_edge_mapping(other, edge)
+
+        self.assertEqual(list(graph.get_machine_edges(edge)),
+                         machine_edges + [other])
+        for machine_edge in machine_edges:
+            self.assertEqual(graph.get_application_edge(machine_edge), edge)
+
 
 if __name__ == '__main__':
     unittest.main()
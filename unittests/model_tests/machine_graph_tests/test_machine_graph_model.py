@@ -146,6 +146,86 @@ class TestMachineGraphModel(unittest.TestCase):
             graph.add_vertices(vertices)
             graph.add_edges(edges, "bar")
 
+    def test_add_edges_matches_add_edge(self):
+        """
+        test that adding edges in bulk builds the same partitions and\
+        indices as adding them one at a time
+        """
+        vertices = [SimpleMachineVertex(None, "") for _ in range(4)]
+        edges = [MachineEdge(vertices[pre], vertices[post])
+                 for pre, post in [(0, 1), (0, 2), (1, 2), (0, 3), (1, 1)]]
+        graph = MachineGraph("foo")
+        graph.add_vertices(vertices)
+        graph.add_edges(edges, "bar")
+        single = MachineGraph("foo")
+        single.add_vertices(vertices)
+        for edge in edges:
+            single.add_edge(edge, "bar")
+
+        self.assertEqual(list(graph.edges), list(single.edges))
+        for vertex in vertices:
+            self.assertEqual(
+                list(graph.get_edges_starting_at_vertex(vertex)),
+                list(single.get_edges_starting_at_vertex(vertex)))
+            self.assertEqual(
+                list(graph.get_edges_ending_at_vertex(vertex)),
+                list(single.get_edges_ending_at_vertex(vertex)))
+            self.assertEqual(
+                list(graph.get_edges_ending_at_vertex_with_partition_name(
+                    vertex, "bar")),
+                list(single.get_edges_ending_at_vertex_with_partition_name(
+                    vertex, "bar")))
+        for edge in edges:
+            partition = graph.get_outgoing_partition_for_edge(edge)
+            self.assertIs(partition.pre_vertex, edge.pre_vertex)
+            self.assertIn(edge, partition.edges)
+        self.assertEqual(
+            graph.get_outgoing_edge_partition_starting_at_vertex(
+                vertices[0], "bar").n_edges, 3)
+
+    def test_compact_graph(self):
+        """
+        test that a compact graph answers queries in the same way as one\
+        that is not compact
+        """
+        vertices = [SimpleMachineVertex(None, "") for _ in range(5)]
+        edges = [MachineEdge(vertices[pre], vertices[post])
+                 for pre, post in [(0, 1), (0, 2), (1, 2), (3, 2), (0, 0),
+                                   (4, 1), (2, 0), (1, 4)]]
+        graphs = [MachineGraph("foo"), MachineGraph("foo", compact=True)]
+        for graph in graphs:
+            graph.add_vertices(vertices)
+            graph.add_edges(edges[:3], "bar")
+            for edge in edges[3:]:
+                graph.add_edge(edge, "baz" if edge.pre_vertex != vertices[0]
+                               else "bar")
+        graph, compact = graphs
+
+        self.assertEqual(list(graph.edges), list(compact.edges))
+        for vertex in vertices:
+            self.assertEqual(
+                list(graph.get_edges_starting_at_vertex(vertex)),
+                list(compact.get_edges_starting_at_vertex(vertex)))
+            self.assertEqual(
+                list(graph.get_edges_ending_at_vertex(vertex)),
+                list(compact.get_edges_ending_at_vertex(vertex)))
+            for name in ["bar", "baz", "other"]:
+                self.assertEqual(
+                    list(graph.get_edges_ending_at_vertex_with_partition_name(
+                        vertex, name)),
+                    list(compact.
+                         get_edges_ending_at_vertex_with_partition_name(
+                             vertex, name)))
+        for edge in edges:
+            self.assertEqual(
+                graph.get_outgoing_partition_for_edge(edge).identifier,
+                compact.get_outgoing_partition_for_edge(edge).identifier)
+        self.assertEqual(compact.get_edges_ending_at_vertex(
+            SimpleMachineVertex(None, "")), [])
+        with self.assertRaises(KeyError):
+            compact.get_outgoing_partition_for_edge(
+                MachineEdge(vertices[3], vertices[0]))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -115,6 +115,21 @@ class TestRoutingInfo(unittest.TestCase):
         assert k.tolist() == [1073741824, 1073741825]
         assert n == 2
 
+    def test_get_keys_scattered_mask(self):
+        bkm = BaseKeyAndMask(0x80000000, _32_BITS & ~0x1 & ~0x6 & ~0x100)
+        assert bkm.n_keys == 16
+        keys, n_keys = bkm.get_keys()
+        assert n_keys == 16
+        assert keys.tolist() == [
+            0x80000000 | (value & 0x7) | (value & 0x8) << 5
+            for value in range(16)]
+        key_array = [0] * 6
+        bkm.get_keys(key_array, offset=2, n_keys=3)
+        assert key_array == [0, 0, 0x80000000, 0x80000001, 0x80000002, 0]
+        chunks = list(bkm.get_key_chunks(5))
+        assert [len(chunk) for chunk in chunks] == [5, 5, 5, 1]
+        assert sum((chunk.tolist() for chunk in chunks), []) == keys.tolist()
+
     def test_dict_based_machine_partition_n_keys_map(self):
         pmap = DictBasedMachinePartitionNKeysMap()
         p1 = OutgoingEdgePartition("foo", None)
@@ -13,13 +13,20 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import os
+import pickle
+import shutil
+import tempfile
 import unittest
+from jsonschema import ValidationError
 from spinn_machine import MulticastRoutingEntry
 from pacman.model.graphs.impl import OutgoingEdgePartition
 from pacman.model.routing_tables import (
     MulticastRoutingTable, MulticastRoutingTables)
+from pacman.model.routing_tables import multicast_routing_tables
 from pacman.model.routing_tables.multicast_routing_tables import (
-    to_json, from_json)
+    to_json, from_json, read_binary, read_binary_table, read_json,
+    write_binary, write_json)
 from pacman.model.routing_table_by_partition import (
     MulticastRoutingTableByPartition, MulticastRoutingTableByPartitionEntry)
 from pacman.exceptions import (
@@ -122,6 +129,76 @@ class TestRoutingTable(unittest.TestCase):
         with self.assertRaises(PacmanAlreadyExistsException):
             MulticastRoutingTable(0, 0, multicast_entries)
 
+    def test_add_entry(self):
+        mrt = MulticastRoutingTable(1, 2)
+        mrt.add_entry(0xff00, 0xff00, 0b1000001, True)
+        mrt.add_multicast_routing_entry(
+            MulticastRoutingEntry(0xfe00, 0xff00, [2], [], False))
+        self.assertEqual(list(mrt.keys), [0xff00, 0xfe00])
+        self.assertEqual(list(mrt.masks), [0xff00, 0xff00])
+        self.assertEqual(list(mrt.spinnaker_routes), [0b1000001, 1 << 8])
+        self.assertEqual(list(mrt.defaultables), [1, 0])
+        self.assertEqual(mrt.number_of_entries, 2)
+        self.assertEqual(mrt.number_of_defaultable_entries, 1)
+
+        mre = mrt.multicast_routing_entries
+        self.assertEqual(len(mre), 2)
+        self.assertEqual(mre[0], MulticastRoutingEntry(
+            0xff00, 0xff00, [0], [0], True))
+        self.assertEqual(list(mre[1].processor_ids), [2])
+        self.assertEqual(mre[-1], mre[1])
+        self.assertEqual(mre[:], list(mre))
+        with self.assertRaises(IndexError):
+            mre[2]
+        self.assertEqual(mrt.get_multicast_routing_entry_by_routing_entry_key(
+            0xfe00, 0xff00), mre[1])
+
+        with self.assertRaises(PacmanAlreadyExistsException):
+            mrt.add_entry(0xff00, 0xff00, 0, False)
+        with self.assertRaises(PacmanInvalidParameterException):
+            mrt.add_entry(0xff01, 0xff00, 0, False)
+        mrt.add_entry(0xfd00, 0xff00, 1, False)
+        self.assertEqual(mrt.get_multicast_routing_entry_by_routing_entry_key(
+            0xfd00, 0xff00).spinnaker_route, 1)
+
+    def test_add_entries(self):
+        mrt = MulticastRoutingTable(1, 2)
+        mrt.add_entry(0xff00, 0xff00, 1, True)
+        self.assertIsNotNone(
+            mrt.get_multicast_routing_entry_by_routing_entry_key(
+                0xff00, 0xff00))
+        mrt.add_entries(
+            [0xfe00, 0xfd00], [0xff00, 0xff00], [2, 3], [False, True])
+        self.assertEqual(list(mrt.keys), [0xff00, 0xfe00, 0xfd00])
+        self.assertEqual(list(mrt.spinnaker_routes), [1, 2, 3])
+        self.assertEqual(list(mrt.defaultables), [1, 0, 1])
+        self.assertEqual(mrt.number_of_defaultable_entries, 2)
+        self.assertEqual(mrt.get_multicast_routing_entry_by_routing_entry_key(
+            0xfd00, 0xff00).spinnaker_route, 3)
+
+        # Problems are found with the entries added in turn
+        with self.assertRaises(PacmanAlreadyExistsException):
+            mrt.add_entries(
+                [0xfc00, 0xfb00, 0xfb00], [0xff00] * 3, [4] * 3, [False] * 3)
+        self.assertEqual(mrt.number_of_entries, 5)
+        with self.assertRaises(PacmanAlreadyExistsException):
+            mrt.add_entries([0xff00], [0xff00], [4], [False])
+        with self.assertRaises(PacmanInvalidParameterException):
+            mrt.add_entries(
+                [0xfa00, 0xf901], [0xff00] * 2, [4] * 2, [False] * 2)
+        self.assertEqual(mrt.number_of_entries, 6)
+
+    def test_pickle_multicast_routing_table(self):
+        mrt = MulticastRoutingTable(3, 4)
+        for i in range(10):
+            mrt.add_entry(i << 4, 0xfff0, i, i % 2 == 0)
+        copied = pickle.loads(pickle.dumps(mrt))
+        self.assertEqual((copied.x, copied.y), (3, 4))
+        self.assertEqual(copied, mrt)
+        self.assertEqual(copied.number_of_defaultable_entries, 5)
+        with self.assertRaises(PacmanAlreadyExistsException):
+            copied.add_entry(0x10, 0xfff0, 0, False)
+
     def test_new_multicast_routing_tables(self):
         key_combo = 0xff35
         mask = 0xffff
@@ -158,6 +235,87 @@ class TestRoutingTable(unittest.TestCase):
         self.assertEqual(new_tables.get_routing_table_for_chip(1, 0), t2)
         self.assertEqual(new_tables.get_routing_table_for_chip(2, 0), None)
 
+    def test_multicast_routing_tables_json_file(self):
+        tables = MulticastRoutingTables()
+        for x in range(3):
+            table = MulticastRoutingTable(x, 1)
+            for i in range(x * 100):
+                table.add_entry(i << 8, 0xFFFFFF00, i & 0xFFFFFF, i % 3 == 0)
+            tables.add_routing_table(table)
+        folder = tempfile.mkdtemp()
+        read_size = multicast_routing_tables._JSON_READ_SIZE
+        try:
+            # Read a little at a time so that tables span several reads
+            multicast_routing_tables._JSON_READ_SIZE = 100
+            for name in ["tables.json", "tables.json.gz"]:
+                file_path = os.path.join(folder, name)
+                write_json(tables, file_path)
+                new_tables = list(read_json(file_path))
+                self.assertEqual(
+                    new_tables, list(tables.routing_tables))
+                self.assertEqual(
+                    list(from_json(file_path).routing_tables), new_tables)
+            self.assertEqual(
+                list(from_json(to_json(tables)).routing_tables), new_tables)
+
+            file_path = os.path.join(folder, "empty.json")
+            write_json([], file_path)
+            self.assertEqual(list(read_json(file_path)), [])
+
+            table = MulticastRoutingTable(0, 0)
+            table.add_entry(0x100, 0xFFFFFF00, 1 << 24, False)
+            with self.assertRaises(ValidationError):
+                write_json([table], file_path)
+            write_json([table], file_path, validate=False)
+            with self.assertRaises(ValidationError):
+                list(read_json(file_path))
+            self.assertEqual(
+                list(read_json(file_path, validate=False)), [table])
+        finally:
+            multicast_routing_tables._JSON_READ_SIZE = read_size
+            shutil.rmtree(folder)
+
+    def test_multicast_routing_tables_binary_file(self):
+        tables = MulticastRoutingTables()
+        for x in range(3):
+            table = MulticastRoutingTable(x, 2)
+            for i in range(x * 100):
+                table.add_entry(
+                    0xFFFFFF00 - (i << 8), 0xFFFFFF00, (1 << 24) - i - 1,
+                    i % 3 == 0)
+            tables.add_routing_table(table)
+        folder = tempfile.mkdtemp()
+        try:
+            file_path = os.path.join(folder, "tables.bin")
+            write_binary(tables, file_path)
+            self.assertEqual(
+                os.path.getsize(file_path), 16 + 3 * 16 + 300 * 16)
+            self.assertEqual(
+                list(read_binary(file_path)), list(tables.routing_tables))
+            self.assertEqual(
+                read_binary_table(file_path, 2, 2),
+                tables.get_routing_table_for_chip(2, 2))
+            self.assertEqual(
+                read_binary_table(file_path, 0, 2).number_of_entries, 0)
+            self.assertIsNone(read_binary_table(file_path, 2, 0))
+
+            # Convert to JSON and back
+            json_path = os.path.join(folder, "tables.json.gz")
+            write_json(read_binary(file_path), json_path)
+            copy_path = os.path.join(folder, "copy.bin")
+            write_binary(read_json(json_path), copy_path)
+            with open(file_path, "rb") as f, open(copy_path, "rb") as g:
+                self.assertEqual(f.read(), g.read())
+
+            with open(copy_path, "r+b") as f:
+                f.truncate(100)
+            with self.assertRaises(ValueError):
+                read_binary_table(copy_path, 1, 2)
+            with self.assertRaises(ValueError):
+                read_binary_table(json_path, 1, 2)
+        finally:
+            shutil.rmtree(folder)
+
     def test_new_multicast_routing_tables_empty(self):
         MulticastRoutingTables()
 
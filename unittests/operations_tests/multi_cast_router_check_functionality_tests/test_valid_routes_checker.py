@@ -0,0 +1,122 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import random
+import unittest
+from spinn_machine import MulticastRoutingEntry, virtual_machine
+from pacman.exceptions import PacmanRoutingException
+from pacman.model.graphs.machine import (
+    MachineEdge, MachineGraph, SimpleMachineVertex)
+from pacman.model.placements import Placement, Placements
+from pacman.model.resources import ResourceContainer
+from pacman.model.routing_info import (
+    BaseKeyAndMask, PartitionRoutingInfo, RoutingInfo)
+from pacman.model.routing_tables import (
+    MulticastRoutingTable, MulticastRoutingTables)
+from pacman.operations.multi_cast_router_check_functionality import (
+    validate_routes)
+from pacman.operations.multi_cast_router_check_functionality.\
+    valid_routes_checker import (
+        _check_all_keys_hit_entry, _RoutingTableLookup, range_masks)
+from pacman.operations.router_algorithms import NerRoute
+from pacman.operations.routing_table_generators.\
+    basic_routing_table_generator import BasicRoutingTableGenerator
+
+
+class TestValidRoutesChecker(unittest.TestCase):
+
+    def test_lookup_candidates(self):
+        rng = random.Random(0)
+        table = MulticastRoutingTable(0, 0)
+        for _ in range(300):
+            mask = rng.choice([
+                0xFFFFFFFF, 0xFFFFFFF0, 0xFFFFFF00, 0xFFFF0F0F,
+                rng.getrandbits(32) | 0xFFFF0000])
+            key = rng.getrandbits(16) & mask
+            if not any(entry.routing_entry_key == key and entry.mask == mask
+                       for entry in table.multicast_routing_entries):
+                table.add_multicast_routing_entry(
+                    MulticastRoutingEntry(key, mask, [1], [], False))
+        entries = list(table.multicast_routing_entries)
+        lookup = _RoutingTableLookup(table)
+        for _ in range(200):
+            key = rng.getrandbits(16)
+            n_atoms = rng.randrange(300)
+            expected = [
+                entry for entry in entries
+                if entry.mask & key == entry.routing_entry_key or (
+                    entry.mask in range_masks and
+                    entry.routing_entry_key <= key + n_atoms and
+                    key <= entry.routing_entry_key + (
+                        ~entry.mask & 0xFFFFFFFF))]
+            self.assertEqual(lookup.candidates(key, n_atoms), expected)
+
+    def test_check_all_keys_hit_entry(self):
+        rng = random.Random(0)
+        for _ in range(1000):
+            mask = rng.choice([
+                0xFFFFFFF0, 0xFFFFFF00, 0xFFFFFFFF, 0xFFFF0F0F,
+                rng.getrandbits(32) | 0xFFF00000])
+            base_key = rng.getrandbits(14)
+            entry = MulticastRoutingEntry(
+                base_key & mask, mask, [1], [], False)
+            n_atoms = rng.randrange(600)
+            self.assertEqual(
+                _check_all_keys_hit_entry(entry, n_atoms, base_key),
+                [base_key + atom for atom in range(n_atoms)
+                 if mask & (base_key + atom) != base_key & mask])
+
+    def test_validate_routes(self):
+        machine = virtual_machine(width=8, height=8)
+        graph = MachineGraph("Test")
+        placements = Placements()
+        routing_infos = RoutingInfo()
+        chips = list(machine.chips)
+        vertices = list()
+        for i in range(20):
+            vertex = SimpleMachineVertex(resources=ResourceContainer())
+            graph.add_vertex(vertex)
+            chip = chips[i * 2]
+            placements.add_placement(Placement(vertex, chip.x, chip.y, 1))
+            vertices.append(vertex)
+        for i, vertex in enumerate(vertices):
+            for target in vertices[i + 1:i + 4]:
+                graph.add_edge(MachineEdge(vertex, target), "Test")
+            for partition in \
+                    graph.get_outgoing_edge_partitions_starting_at_vertex(
+                        vertex):
+                routing_infos.add_partition_info(PartitionRoutingInfo(
+                    [BaseKeyAndMask(i << 8, 0xFFFFFF00)], partition))
+        tables = BasicRoutingTableGenerator()(
+            routing_infos, NerRoute()(graph, machine, placements), machine)
+        validate_routes(graph, placements, routing_infos, tables, machine)
+
+        # Remove an entry from a table a route passes through
+        broken = MulticastRoutingTables()
+        removed = False
+        for table in tables.routing_tables:
+            entries = list(table.multicast_routing_entries)
+            if not removed and len(entries) > 1:
+                entries = entries[1:]
+                removed = True
+            broken.add_routing_table(MulticastRoutingTable(
+                table.x, table.y, entries))
+        with self.assertRaises(PacmanRoutingException):
+            validate_routes(
+                graph, placements, routing_infos, broken, machine)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -382,6 +382,23 @@ class TestBasicPartitioner(unittest.TestCase):
             app_graph, machine, plan_n_timesteps=None)
         self.assert_(len(machine_graph.vertices) == 4)
 
+    def test_partition_in_parallel(self):
+        """
+        test that estimating resources in parallel gives the same slices
+        """
+        self.setup()
+        large_vertex = SimpleTestVertex(1000, "Large vertex")
+        self.graph.add_vertex(large_vertex)
+        slices = list()
+        for n_processes, use_threads in [(None, False), (2, True), (2, False)]:
+            graph, mapper, _ = BasicPartitioner()(
+                self.graph, self.machine, 1000, n_processes=n_processes,
+                use_threads=use_threads)
+            slices.append([mapper.get_slice(vertex)[:2]
+                           for vertex in graph.vertices])
+        self.assertEqual(slices[0], slices[1])
+        self.assertEqual(slices[0], slices[2])
+
 
 if __name__ == '__main__':
     unittest.main()
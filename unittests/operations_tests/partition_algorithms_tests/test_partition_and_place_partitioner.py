@@ -32,6 +32,22 @@ from pacman.operations.partition_algorithms import PartitionAndPlacePartitioner
 from uinit_test_objects import NewPartitionerConstraint, SimpleTestVertex
 
 
+class _CountingVertex(SimpleTestVertex):
+    def __init__(self, n_atoms, max_atoms_per_core, sdram_per_atom):
+        super(_CountingVertex, self).__init__(
+            n_atoms, max_atoms_per_core=max_atoms_per_core)
+        self._sdram_per_atom = sdram_per_atom
+        self.n_estimates = 0
+
+    def get_resources_used_by_atoms(self, vertex_slice):
+        self.n_estimates += 1
+        return super(_CountingVertex, self).get_resources_used_by_atoms(
+            vertex_slice)
+
+    def get_sdram_usage_for_atoms(self, vertex_slice, graph):
+        return self._sdram_per_atom * vertex_slice.n_atoms
+
+
 class TestBasicPartitioner(unittest.TestCase):
     """
     test for basic partitioning algorithm
@@ -510,6 +526,43 @@ class TestBasicPartitioner(unittest.TestCase):
             app_graph, machine, plan_n_timesteps=None)
         self.assert_(len(machine_graph.vertices) == 4)
 
+    def test_partition_in_parallel(self):
+        """
+        test that estimating resources in parallel gives the same slices
+        """
+        self.setup()
+        large_vertex = SimpleTestVertex(1000, "Large vertex")
+        self.graph.add_vertex(large_vertex)
+        slices = list()
+        for n_processes, use_threads in [(None, False), (2, True), (2, False)]:
+            graph, mapper, _ = PartitionAndPlacePartitioner()(
+                self.graph, self.machine, 1000, n_processes=n_processes,
+                use_threads=use_threads)
+            slices.append([mapper.get_slice(vertex)[:2]
+                           for vertex in graph.vertices])
+        self.assertEqual(slices[0], slices[1])
+        self.assertEqual(slices[0], slices[2])
+
+    def test_partition_searches_for_atoms_per_core(self):
+        """
+        test that the atoms per core are found with few resource estimates
+        """
+        vertex = _CountingVertex(
+            20000, max_atoms_per_core=5000, sdram_per_atom=100000)
+        app_graph = ApplicationGraph("Test")
+        app_graph.add_vertex(vertex)
+        machine = virtual_machine(width=8, height=8)
+        machine_graph, mapper, _ = PartitionAndPlacePartitioner()(
+            app_graph, machine, plan_n_timesteps=100)
+        slices = sorted(
+            mapper.get_slice(m_vertex) for m_vertex in machine_graph.vertices)
+        self.assertEqual(slices[0].lo_atom, 0)
+        self.assertEqual(slices[-1].hi_atom, 19999)
+        for before, after in zip(slices, slices[1:]):
+            self.assertEqual(before.hi_atom + 1, after.lo_atom)
+        self.assertLess(slices[0].n_atoms, 5000)
+        self.assertLessEqual(vertex.n_estimates, 20 * len(slices))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,59 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+from spinn_machine import virtual_machine
+from pacman.model.graphs.machine import MachineGraph, SimpleMachineVertex
+from pacman.model.resources import ResourceContainer
+from pacman.operations.rigged_algorithms import HilbertPlacer
+from pacman.operations.rigged_algorithms.hilbert_placer import (
+    hilbert_indices)
+
+
+class TestHilbertPlacer(unittest.TestCase):
+
+    def test_hilbert_indices(self):
+        for level in range(6):
+            curve = list(HilbertPlacer()._hilbert_curve(level))
+            self.assertEqual(
+                hilbert_indices(
+                    level, [x for x, _ in curve], [y for _, y in curve]
+                ).tolist(),
+                list(range(len(curve))))
+
+    def test_hilbert_chips(self):
+        machine = virtual_machine(
+            width=16, height=16, down_chips={(3, 4), (10, 2)})
+        curve = HilbertPlacer()._hilbert_curve(4)
+        self.assertEqual(
+            list(HilbertPlacer()._generate_hilbert_chips(machine)),
+            [(x, y) for x, y in curve if machine.is_chip_at(x, y)])
+
+    def test_place(self):
+        machine = virtual_machine(width=8, height=8)
+        graph = MachineGraph("Test")
+        for _ in range(100):
+            graph.add_vertex(SimpleMachineVertex(ResourceContainer()))
+        placements = HilbertPlacer()(graph, machine, 100)
+        self.assertEqual(len(list(placements.placements)), 100)
+
+        # The chips are filled in the order of the curve
+        used = {(p.x, p.y) for p in placements.placements}
+        chips = list(HilbertPlacer()._generate_hilbert_chips(machine))
+        self.assertEqual(used, set(chips[:len(used)]))
+
+
+if __name__ == '__main__':
+    unittest.main()
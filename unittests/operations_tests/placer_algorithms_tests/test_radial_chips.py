@@ -0,0 +1,73 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections import deque
+import unittest
+from spinn_machine import virtual_machine
+from pacman.model.resources import ResourceContainer
+from pacman.operations.placer_algorithms import RadialPlacer
+from pacman.utilities.utility_objs import ResourceTracker
+
+
+def _breadth_first(machine, x, y):
+    first_chip = machine.get_chip_at(x, y)
+    done_chips = {first_chip}
+    search = deque([first_chip])
+    while search:
+        chip = search.pop()
+        yield chip.x, chip.y
+        for link in chip.router.links:
+            next_chip = machine.get_chip_at(
+                link.destination_x, link.destination_y)
+            if next_chip not in done_chips:
+                search.appendleft(next_chip)
+                done_chips.add(next_chip)
+
+
+class TestRadialChips(unittest.TestCase):
+
+    def test_radial_order(self):
+        machine = virtual_machine(width=12, height=12)
+        placer = RadialPlacer()
+        self.assertEqual(
+            list(placer._generate_radial_chips(machine)),
+            list(_breadth_first(
+                machine, machine.boot_chip.x, machine.boot_chip.y)))
+        for x, y in [(3, 5), (11, 0), (3, 5)]:
+            self.assertEqual(
+                list(placer._generate_radial_chips(
+                    machine, start_chip_x=x, start_chip_y=y)),
+                list(_breadth_first(machine, x, y)))
+
+    def test_skips_used_chips(self):
+        machine = virtual_machine(width=8, height=8)
+        placer = RadialPlacer()
+        tracker = ResourceTracker(machine, 0)
+        order = list(_breadth_first(machine, 2, 2))
+        for _ in range(20 * machine.get_chip_at(2, 2).n_user_processors):
+            chips = placer._generate_radial_chips(machine, tracker, 2, 2)
+            x, y, _, _, _ = tracker.allocate_resources(
+                ResourceContainer(), chips)
+            self.assertEqual(
+                (x, y), next(chip for chip in order
+                             if tracker.is_chip_available(*chip) or
+                             chip == (x, y)))
+        self.assertEqual(
+            list(placer._generate_radial_chips(machine, tracker, 2, 2)),
+            [chip for chip in order if tracker.is_chip_available(*chip)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -81,6 +81,43 @@ class MyTestCase(unittest.TestCase):
                 if vertex != vertex_to:
                     self.assertIn(vertex_to, vertices_reached)
 
+    def test_routes_are_shortest(self):
+        graph = MachineGraph("Test")
+        machine = virtual_machine(12, 12)
+        placements = Placements()
+        sources = [(0, 0), (5, 2), (11, 11)]
+        targets = [(3, 3), (9, 1), (0, 11), (6, 7)]
+        vertices = dict()
+        for x, y in sources + targets:
+            vertex = SimpleMachineVertex(resources=ResourceContainer())
+            graph.add_vertex(vertex)
+            placements.add_placement(Placement(vertex, x, y, 1))
+            vertices[x, y] = vertex
+        for source in sources:
+            for target in targets:
+                graph.add_edge(
+                    MachineEdge(vertices[source], vertices[target]), "Test")
+
+        router = BasicDijkstraRouting()
+        routing_paths = router(placements, machine, graph)
+
+        # Each route must use as few links as possible, for every source
+        for source in sources:
+            partition = graph.get_outgoing_edge_partition_starting_at_vertex(
+                vertices[source], "Test")
+            for target in targets:
+                x, y = target
+                n_links = 0
+                while (x, y) != source:
+                    entry = routing_paths.get_entry_on_coords_for_edge(
+                        partition, x, y)
+                    link = machine.get_chip_at(x, y).router.get_link(
+                        entry.incoming_link)
+                    x, y = link.destination_x, link.destination_y
+                    n_links += 1
+                self.assertEqual(n_links, sum(
+                    abs(v) for v in machine.get_vector(source, target)))
+
 
 if __name__ == '__main__':
     unittest.main()
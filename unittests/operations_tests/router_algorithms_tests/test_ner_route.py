@@ -0,0 +1,83 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import random
+import unittest
+from spinn_machine import virtual_machine
+from pacman.model.graphs.machine import (
+    MachineGraph, MachineEdge, SimpleMachineVertex)
+from pacman.model.placements import Placements, Placement
+from pacman.model.resources import ResourceContainer
+from pacman.operations.router_algorithms import NerRoute
+from pacman.operations.router_algorithms.ner_route import (
+    _nearest_route_node)
+
+
+class TestNerRoute(unittest.TestCase):
+
+    def _check_nearest(self, machine, radius):
+        rng = random.Random(radius)
+        chips = sorted(machine.chip_coordinates)
+        nodes = rng.sample(chips, 3 * radius * (radius + 1) + 2)
+        route = {node: None for node in nodes}
+        route_order = {node: i for i, node in enumerate(nodes)}
+        for destination in chips:
+            nearest = None
+            nearest_distance = None
+            for node in nodes:
+                distance = machine.get_vector_length(node, destination)
+                if distance <= radius and (
+                        nearest is None or distance < nearest_distance):
+                    nearest = node
+                    nearest_distance = distance
+            self.assertEqual(nearest, _nearest_route_node(
+                destination, route, route_order, radius, machine))
+
+    def test_nearest_route_node_with_wrap_around(self):
+        self._check_nearest(virtual_machine(width=12, height=12), 2)
+
+    def test_nearest_route_node_without_wrap_around(self):
+        self._check_nearest(virtual_machine(width=8, height=8), 1)
+
+    @staticmethod
+    def _entries(routing_tables):
+        return [(x, y, partition, entry.link_ids, entry.processor_ids,
+                 entry.incoming_link, entry.incoming_processor)
+                for x, y in routing_tables.get_routers()
+                for partition, entry in routing_tables.get_entries_for_router(
+                    x, y).items()]
+
+    def test_route_in_parallel(self):
+        machine = virtual_machine(width=12, height=12)
+        graph = MachineGraph("Test")
+        placements = Placements()
+        vertices = list()
+        for chip in machine.chips:
+            vertex = SimpleMachineVertex(resources=ResourceContainer())
+            graph.add_vertex(vertex)
+            placements.add_placement(Placement(vertex, chip.x, chip.y, 1))
+            vertices.append(vertex)
+        rng = random.Random(0)
+        for vertex in vertices:
+            for post_vertex in rng.sample(vertices, 10):
+                graph.add_edge(MachineEdge(vertex, post_vertex), "Test")
+
+        serial = NerRoute()(graph, machine, placements)
+        parallel = NerRoute()(graph, machine, placements, n_processes=2)
+        self.assertEqual(self._entries(serial), self._entries(parallel))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,12 +13,17 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import random
 import unittest
+import numpy
 from spinn_machine import MulticastRoutingEntry
+from pacman.exceptions import PacmanRoutingException
 from pacman.model.routing_tables import (
     MulticastRoutingTable, MulticastRoutingTables)
 from pacman.operations.algorithm_reports.routing_compression_checker_report \
-    import compare_tables
+    import (
+        calc_remainders, codify, compare_tables, decode, iter_remainders)
+from pacman.operations.router_compressors import AbstractCompressor
 from pacman.operations.router_compressors.pair_compressor import (
     PairCompressor)
 from pacman.operations.router_compressors.unordered_compressor import (
@@ -72,6 +77,79 @@ class MyTestCase(unittest.TestCase):
         compressed_tables = compressor(self.original_tables)
         self.check_compression(compressed_tables)
 
+    def test_compress_in_parallel(self):
+        original = self.original_tables.get_routing_table_for_chip(0, 0)
+        for x in range(1, 5):
+            table = MulticastRoutingTable(x=x, y=0)
+            for entry in original.multicast_routing_entries:
+                table.add_multicast_routing_entry(entry)
+            self.original_tables.add_routing_table(table)
+        for compressor in [PairCompressor(), UnorderedCompressor(),
+                           MundyRouterCompressor()]:
+            serial = compressor(self.original_tables)
+            parallel = compressor(self.original_tables, n_processes=2)
+            self.assertEqual(
+                [(t.x, t.y) for t in serial.routing_tables],
+                [(t.x, t.y) for t in parallel.routing_tables])
+            for serial_table, parallel_table in zip(
+                    serial.routing_tables, parallel.routing_tables):
+                self.assertEqual(
+                    serial_table.multicast_routing_entries,
+                    parallel_table.multicast_routing_entries)
+            self.check_compression(parallel)
+
+    def test_intersect_all(self):
+        rng = random.Random(0)
+        keys_and_masks = list()
+        for _ in range(200):
+            mask = rng.getrandbits(32) | 0xFFFF0000
+            keys_and_masks.append((rng.getrandbits(32) & mask, mask))
+        keys = numpy.array([k for k, _ in keys_and_masks], dtype="uint32")
+        masks = numpy.array([m for _, m in keys_and_masks], dtype="uint32")
+        for key, mask in keys_and_masks[:20]:
+            key &= 0xFF00FFFF
+            mask &= 0xFF00FFFF
+            self.assertEqual(
+                AbstractCompressor.intersect_all(
+                    keys, masks, key, mask).tolist(),
+                [AbstractCompressor.intersect(k, m, key, mask)
+                 for k, m in keys_and_masks])
+
+    def test_remainders(self):
+        rng = random.Random(0)
+        for _ in range(200):
+            o_mask = rng.getrandbits(32)
+            c_mask = rng.getrandbits(32)
+            o = MulticastRoutingEntry(
+                rng.getrandbits(32) & o_mask, o_mask, [1], [], False)
+            c = MulticastRoutingEntry(
+                rng.getrandbits(32) & c_mask, c_mask, [1], [], False)
+            self.assertEqual(
+                list(iter_remainders(
+                    o.routing_entry_key, o.mask, c.routing_entry_key,
+                    c.mask)),
+                [decode(code) for code in calc_remainders(
+                    codify(o), codify(c))])
+
+    def test_compare_tables_detects_errors(self):
+        original = self.original_tables.get_routing_table_for_chip(0, 0)
+        compressed = PairCompressor()(self.original_tables).\
+            get_routing_table_for_chip(0, 0)
+        compare_tables(original, compressed)
+        entries = list(compressed.multicast_routing_entries)
+        missing = MulticastRoutingTable(x=0, y=0)
+        for entry in entries[1:]:
+            missing.add_multicast_routing_entry(entry)
+        with self.assertRaises(PacmanRoutingException):
+            compare_tables(original, missing)
+        wrong = MulticastRoutingTable(x=0, y=0)
+        for entry in entries:
+            wrong.add_multicast_routing_entry(MulticastRoutingEntry(
+                entry.routing_entry_key, entry.mask,
+                list(entry.processor_ids) + [17], entry.link_ids, False))
+        with self.assertRaises(PacmanRoutingException):
+            compare_tables(original, wrong)
+
 
 if __name__ == '__main__':
     unittest.main()
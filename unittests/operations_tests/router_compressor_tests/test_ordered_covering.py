@@ -0,0 +1,61 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import random
+import unittest
+from pacman.operations.router_compressors import Entry
+from pacman.operations.router_compressors.mundys_router_compressor.\
+    ordered_covering import (
+        _get_best_merge, _get_generality, ordered_covering)
+
+
+def _random_table(n_entries, n_routes, seed):
+    rng = random.Random(seed)
+    keys = rng.sample(range(1 << 12), n_entries)
+    masks = [0xFFFFFFFF, 0xFFFFFFFE, 0xFFFFFFFC]
+    table = list()
+    for key in keys:
+        mask = rng.choice(masks)
+        table.append(Entry(key & mask, mask, rng.random() < 0.5,
+                           1 << rng.randrange(n_routes)))
+    # Keep the table orthogonal
+    table = [entry for i, entry in enumerate(table)
+             if not any((entry.key & other.mask) == (other.key & entry.mask)
+                        for other in table[:i])]
+    return sorted(table, key=lambda e: _get_generality(e.key, e.mask))
+
+
+class TestOrderedCovering(unittest.TestCase):
+
+    def test_cached_merges_match_uncached(self):
+        for seed in range(5):
+            table = _random_table(300, 6, seed)
+            cached, cached_aliases = ordered_covering(table, None)
+
+            # Do the same merges without keeping anything between them
+            uncached, uncached_aliases = table, {}
+            while True:
+                merge = _get_best_merge(uncached, uncached_aliases)
+                if merge.goodness <= 0:
+                    break
+                uncached, uncached_aliases = merge.apply(uncached_aliases)
+
+            self.assertLess(len(cached), len(table))
+            self.assertEqual(cached, uncached)
+            self.assertEqual(cached_aliases, uncached_aliases)
+
+
+if __name__ == '__main__':
+    unittest.main()
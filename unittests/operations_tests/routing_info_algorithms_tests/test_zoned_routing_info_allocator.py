@@ -0,0 +1,160 @@
+# Copyright (c) 2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+from spinn_machine import virtual_machine
+from pacman.model.graphs.application import ApplicationGraph
+from pacman.model.graphs.common import GraphMapper, Slice
+from pacman.model.graphs.machine import (
+    MachineEdge, MachineGraph, SimpleMachineVertex)
+from pacman.model.routing_info import DictBasedMachinePartitionNKeysMap
+from pacman.model.routing_table_by_partition import (
+    MulticastRoutingTableByPartition, MulticastRoutingTableByPartitionEntry)
+from pacman.operations.routing_info_allocator_algorithms.\
+    zoned_routing_info_allocator import ZonedRoutingInfoAllocator
+from pacman.operations.routing_table_generators.\
+    zoned_routing_table_generator import ZonedRoutingTableGenerator
+from uinit_test_objects import SimpleTestVertex
+
+
+def _make_graphs(n_keys_by_identifier, n_app_vertices=3, n_machine_vertices=5):
+    app_graph = ApplicationGraph("Test")
+    machine_graph = MachineGraph("Test")
+    mapper = GraphMapper()
+    n_keys_map = DictBasedMachinePartitionNKeysMap()
+    for _ in range(n_app_vertices):
+        app_vertex = SimpleTestVertex(n_machine_vertices)
+        app_graph.add_vertex(app_vertex)
+        for index in range(n_machine_vertices):
+            vertex = SimpleMachineVertex(resources=None)
+            machine_graph.add_vertex(vertex)
+            mapper.add_vertex_mapping(vertex, Slice(index, index), app_vertex)
+            for identifier, n_keys in n_keys_by_identifier:
+                machine_graph.add_edge(MachineEdge(vertex, vertex), identifier)
+                partition = machine_graph.\
+                    get_outgoing_edge_partition_starting_at_vertex(
+                        vertex, identifier)
+                n_keys_map.set_n_keys_for_partition(partition, n_keys + index)
+    return app_graph, machine_graph, mapper, n_keys_map
+
+
+def _matches(key_and_mask, key):
+    return key & key_and_mask.mask == key_and_mask.key
+
+
+class TestZonedRoutingInfoAllocator(unittest.TestCase):
+
+    def test_single_zone(self):
+        app_graph, machine_graph, mapper, n_keys_map = _make_graphs(
+            [("Part", 10)])
+        routing_infos, by_app_vertex, by_app_partition = \
+            ZonedRoutingInfoAllocator()(
+                app_graph, mapper, machine_graph, None, n_keys_map)
+
+        # 5 machine vertices with at most 14 keys: 3 + 4 bits for each
+        # application vertex
+        for app_index, app_vertex in enumerate(app_graph.vertices):
+            self.assertEqual(by_app_vertex[app_vertex].key, app_index << 7)
+            self.assertEqual(by_app_vertex[app_vertex].mask, 0xFFFFFF80)
+            self.assertEqual(
+                by_app_partition[app_vertex, "Part"].key, app_index << 7)
+            for index, vertex in enumerate(
+                    mapper.get_machine_vertices(app_vertex)):
+                key_and_mask = routing_infos.get_routing_info_from_pre_vertex(
+                    vertex, "Part").first_key_and_mask
+                self.assertEqual(key_and_mask.key, app_index << 7 | index << 4)
+                self.assertEqual(key_and_mask.mask, 0xFFFFFFF0)
+
+    def test_multiple_zones(self):
+        app_graph, machine_graph, mapper, n_keys_map = _make_graphs(
+            [("A", 1), ("B", 100), ("C", 3)])
+        routing_infos, by_app_vertex, by_app_partition = \
+            ZonedRoutingInfoAllocator()(
+                app_graph, mapper, machine_graph, None, n_keys_map)
+
+        seen_keys = set()
+        for app_vertex in app_graph.vertices:
+            for vertex in mapper.get_machine_vertices(app_vertex):
+                for partition in machine_graph.\
+                        get_outgoing_edge_partitions_starting_at_vertex(
+                            vertex):
+                    r_info = routing_infos.get_routing_info_from_partition(
+                        partition)
+                    keys = list(r_info.get_keys())
+                    self.assertGreaterEqual(
+                        len(keys), n_keys_map.n_keys_for_partition(partition))
+                    for key in keys:
+                        self.assertNotIn(key, seen_keys)
+                        seen_keys.add(key)
+                        self.assertTrue(_matches(
+                            by_app_vertex[app_vertex], key))
+                        self.assertTrue(_matches(by_app_partition[
+                            app_vertex, partition.identifier], key))
+                        for other in app_graph.vertices:
+                            if other is not app_vertex:
+                                self.assertFalse(_matches(
+                                    by_app_vertex[other], key))
+                        for identifier in "ABC":
+                            if identifier != partition.identifier:
+                                self.assertFalse(_matches(by_app_partition[
+                                    app_vertex, identifier], key))
+
+    def test_shared_table_entries(self):
+        app_graph, machine_graph, mapper, n_keys_map = _make_graphs(
+            [("A", 1), ("B", 1)], n_app_vertices=2)
+        routing_infos, by_app_vertex, by_app_partition = \
+            ZonedRoutingInfoAllocator()(
+                app_graph, mapper, machine_graph, None, n_keys_map)
+
+        # On chip 0, 0 all the partitions of the first application vertex
+        # take the same route; on chip 1, 0 those of each identifier do; on
+        # chip 0, 1 every partition takes a different route
+        first = list(app_graph.vertices)[0]
+        routes = MulticastRoutingTableByPartition()
+        for index, vertex in enumerate(mapper.get_machine_vertices(first)):
+            for identifier in "AB":
+                partition = machine_graph.\
+                    get_outgoing_edge_partition_starting_at_vertex(
+                        vertex, identifier)
+                routes.add_path_entry(MulticastRoutingTableByPartitionEntry(
+                    0, [1], incoming_link=3), 0, 0, partition)
+                routes.add_path_entry(MulticastRoutingTableByPartitionEntry(
+                    "AB".index(identifier), [], incoming_link=3), 1, 0,
+                    partition)
+                routes.add_path_entry(MulticastRoutingTableByPartitionEntry(
+                    [], [index + 1], incoming_link=3), 0, 1, partition)
+        machine = virtual_machine(width=2, height=2)
+        tables = ZonedRoutingTableGenerator()(
+            routing_infos, routes, machine, mapper, by_app_vertex,
+            by_app_partition)
+
+        table = tables.get_routing_table_for_chip(0, 0)
+        self.assertEqual(
+            [(entry.routing_entry_key, entry.mask)
+             for entry in table.multicast_routing_entries],
+            [(by_app_vertex[first].key, by_app_vertex[first].mask)])
+        table = tables.get_routing_table_for_chip(1, 0)
+        self.assertEqual(
+            [(entry.routing_entry_key, entry.mask)
+             for entry in table.multicast_routing_entries],
+            [(by_app_partition[first, identifier].key,
+              by_app_partition[first, identifier].mask)
+             for identifier in "AB"])
+        table = tables.get_routing_table_for_chip(0, 1)
+        self.assertEqual(table.number_of_entries, 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
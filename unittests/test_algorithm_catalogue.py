@@ -0,0 +1,121 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import shutil
+import tempfile
+import unittest
+from pacman.executor import algorithm_catalogue
+from pacman.executor.algorithm_catalogue import get_algorithm_catalogue
+from pacman.operations import algorithm_reports
+import pacman.operations.router_algorithms
+
+
+def _fail(*args):
+    raise AssertionError("Algorithms read again")
+
+
+class TestAlgorithmCatalogue(unittest.TestCase):
+
+    def setUp(self):
+        self._folder = tempfile.mkdtemp()
+        self._xml_path = os.path.join(self._folder, "algos.xml")
+        shutil.copy(
+            os.path.join(os.path.dirname(__file__), "test_algos.xml"),
+            self._xml_path)
+        self._cache_file = os.path.join(self._folder, "catalogue")
+        self._reader = algorithm_catalogue.AlgorithmMetadataXmlReader
+        self._scan = algorithm_catalogue.scan_packages
+
+    def tearDown(self):
+        algorithm_catalogue.AlgorithmMetadataXmlReader = self._reader
+        algorithm_catalogue.scan_packages = self._scan
+        algorithm_catalogue._catalogues.clear()
+        shutil.rmtree(self._folder)
+
+    def _no_reading(self):
+        algorithm_catalogue.AlgorithmMetadataXmlReader = _fail
+        algorithm_catalogue.scan_packages = _fail
+
+    def test_catalogue(self):
+        packages = [algorithm_reports]
+        algorithms = get_algorithm_catalogue(
+            [self._xml_path], packages, self._cache_file)
+        self.assertIn("SimpleExternal", algorithms)
+        self.assertTrue(os.path.exists(self._cache_file))
+
+        # The catalogue is kept in memory and in the cache file
+        self._no_reading()
+        del algorithms["SimpleExternal"]
+        self.assertIn("SimpleExternal", get_algorithm_catalogue(
+            [self._xml_path], packages))
+        algorithm_catalogue._catalogues.clear()
+        self.assertEqual(
+            repr(get_algorithm_catalogue(
+                [self._xml_path], packages, self._cache_file)),
+            repr(self._reader(
+                [self._xml_path]).decode_algorithm_data_objects()))
+
+        # Changing the XML means it is read again
+        stat = os.stat(self._xml_path)
+        os.utime(self._xml_path, (stat.st_atime, stat.st_mtime + 10))
+        with self.assertRaises(AssertionError):
+            get_algorithm_catalogue(
+                [self._xml_path], packages, self._cache_file)
+
+    def test_package_key(self):
+        name = "pacman.operations.router_algorithms"
+        key = algorithm_catalogue._package_key(name)
+        self.assertEqual(key[0], name)
+        self.assertIn(
+            os.path.abspath(pacman.operations.router_algorithms.__file__),
+            [path for path, _, _ in key[2]])
+        self.assertEqual(key, algorithm_catalogue._package_key(
+            pacman.operations.router_algorithms))
+        self.assertEqual(
+            algorithm_catalogue._package_key("pacman.not_a_package")[2], None)
+
+        # Find the package without importlib.util, as on Python 2.7
+        find_spec = algorithm_catalogue.find_spec
+        try:
+            algorithm_catalogue.find_spec = None
+            self.assertEqual(key, algorithm_catalogue._package_key(name))
+        finally:
+            algorithm_catalogue.find_spec = find_spec
+
+    def test_write_cache_file(self):
+        algorithm_catalogue._write_cache_file(self._cache_file, "a", {})
+        algorithm_catalogue._write_cache_file(
+            self._cache_file, "b", {"x": None})
+        catalogues = algorithm_catalogue._read_cache_file(self._cache_file)
+        self.assertEqual(list(catalogues.items()), [("a", {}), (
+            "b", {"x": None})])
+        self.assertEqual(
+            sorted(os.listdir(self._folder)), ["algos.xml", "catalogue"])
+
+    def test_bad_cache_file(self):
+        with open(self._cache_file, "wb") as f:
+            f.write(b"Not a catalogue")
+        algorithms = get_algorithm_catalogue(
+            [self._xml_path], [], self._cache_file)
+        self.assertIn("SimpleExternal", algorithms)
+        algorithm_catalogue._catalogues.clear()
+        self._no_reading()
+        self.assertIn("SimpleExternal", get_algorithm_catalogue(
+            [self._xml_path], [], self._cache_file))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import gc
+import unittest
+from pacman.executor import injection_decorator
+from pacman.executor.injection_decorator import (
+    do_injection, inject, requires_injection, supports_injection,
+    InjectionException)
+
+
+@supports_injection
+class _Injectee(object):
+
+    def __init__(self):
+        self.injected = list()
+
+    @inject("Foo")
+    def set_foo(self, foo):
+        self.injected.append(("Foo", foo))
+
+    @requires_injection(["Foo"])
+    def use_foo(self):
+        return self.injected
+
+
+@supports_injection
+class _SubInjectee(_Injectee):
+
+    def __init__(self):
+        super(_SubInjectee, self).__init__()
+
+    @inject("Bar")
+    def set_bar(self, bar):
+        self.injected.append(("Bar", bar))
+
+
+@supports_injection
+class _SlotsInjectee(object):
+    __slots__ = ["injected"]
+
+    def __init__(self):
+        self.injected = None
+
+    @inject("Foo")
+    def set_foo(self, foo):
+        self.injected = foo
+
+
+class TestInjectionDecorator(unittest.TestCase):
+
+    def test_inject(self):
+        first = _Injectee()
+        sub = _SubInjectee()
+        slots = _SlotsInjectee()
+        with self.assertRaises(InjectionException):
+            _SubInjectee().use_foo()
+        do_injection({"Bar": 2, "Foo": 1})
+
+        # Each object is injected once with each type it accepts
+        self.assertEqual(first.injected, [("Foo", 1)])
+        self.assertEqual(sub.injected, [("Bar", 2), ("Foo", 1)])
+        self.assertEqual(slots.injected, 1)
+        self.assertEqual(first.use_foo(), [("Foo", 1)])
+
+        # Only the given objects are injected if they are given
+        do_injection({"Foo": 3}, [first])
+        self.assertEqual(first.injected, [("Foo", 1), ("Foo", 3)])
+        self.assertEqual(sub.injected, [("Bar", 2), ("Foo", 1)])
+
+        # Only objects that accept the type are visited
+        do_injection({"Bar": 4})
+        self.assertEqual(first.injected, [("Foo", 1), ("Foo", 3)])
+        self.assertEqual(sub.injected, [("Bar", 2), ("Foo", 1), ("Bar", 4)])
+
+    def test_injectees_are_forgotten(self):
+        gc.collect()
+        n_injectees = len(injection_decorator._injectees["Foo"])
+        injectees = [_SubInjectee() for _ in range(10)]
+        self.assertEqual(
+            len(injection_decorator._injectees["Foo"]), n_injectees + 10)
+        del injectees
+        gc.collect()
+        self.assertEqual(
+            len(injection_decorator._injectees["Foo"]), n_injectees)
+
+
+if __name__ == '__main__':
+    unittest.main()
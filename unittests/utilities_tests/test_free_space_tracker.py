@@ -0,0 +1,70 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import random
+import unittest
+from pacman.model.resources import ElementFreeSpace
+from pacman.utilities.utility_objs import FreeSpaceTracker
+
+
+def _fits_block(space, n_elements):
+    aligned = (space.start_address + n_elements - 1) & ~(n_elements - 1)
+    return aligned + n_elements <= space.start_address + space.size
+
+
+class TestFreeSpaceTracker(unittest.TestCase):
+
+    def test_find_space(self):
+        tracker = FreeSpaceTracker(0, 2 ** 32)
+        tracker.replace(0, [ElementFreeSpace(0, 16),
+                            ElementFreeSpace(32, 2 ** 32 - 32)])
+        self.assertEqual(len(tracker), 2)
+        self.assertEqual(tracker.find_space(0), 0)
+        self.assertEqual(tracker.find_space(20), 0)
+        self.assertEqual(tracker.find_space(32), 1)
+        tracker.replace(0, [ElementFreeSpace(0, 0),
+                            ElementFreeSpace(4, 12)])
+        self.assertIsNone(tracker.find_space(3))
+        self.assertEqual(tracker[0].start_address, 4)
+        self.assertEqual(tracker[0].size, 12)
+
+    def test_find_block_space(self):
+        rng = random.Random(0)
+        tracker = FreeSpaceTracker(0, 2 ** 20)
+        for _ in range(500):
+            index = rng.randrange(len(tracker))
+            space = tracker[index]
+            start = space.start_address + rng.randrange(space.size)
+            size = rng.randint(0, space.start_address + space.size - start)
+            tracker.replace(index, [
+                ElementFreeSpace(
+                    space.start_address, start - space.start_address),
+                ElementFreeSpace(
+                    start + size, space.start_address + space.size -
+                    (start + size))])
+            spaces = list(tracker)
+            self.assertEqual(spaces, sorted(
+                spaces, key=lambda s: s.start_address))
+            for n_elements in [1, 2, 16, 256]:
+                first = rng.randrange(len(spaces))
+                expected = next(
+                    (i for i in range(first, len(spaces))
+                     if _fits_block(spaces[i], n_elements)), None)
+                self.assertEqual(
+                    tracker.find_block_space(n_elements, first), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
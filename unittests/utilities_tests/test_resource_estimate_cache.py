@@ -0,0 +1,83 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+from pacman.model.graphs.common import Slice
+from pacman.utilities.utility_objs import ResourceEstimateCache
+from uinit_test_objects import SimpleTestVertex
+
+
+class CountingVertex(SimpleTestVertex):
+    def __init__(self, n_atoms):
+        super(CountingVertex, self).__init__(n_atoms)
+        self.n_estimates = 0
+
+    def get_resources_used_by_atoms(self, vertex_slice):
+        self.n_estimates += 1
+        return super(CountingVertex, self).get_resources_used_by_atoms(
+            vertex_slice)
+
+
+class TestResourceEstimateCache(unittest.TestCase):
+
+    def test_estimates_once(self):
+        vertex = CountingVertex(100)
+        cache = ResourceEstimateCache()
+        first = cache.get_resources_used_by_atoms(vertex, Slice(0, 9))
+        again = cache.get_resources_used_by_atoms(vertex, Slice(0, 9))
+        self.assertIs(first, again)
+        self.assertEqual(first.dtcm.get_value(), 10)
+        self.assertEqual(vertex.n_estimates, 1)
+        cache.get_resources_used_by_atoms(vertex, Slice(0, 10))
+        self.assertEqual(vertex.n_estimates, 2)
+
+    def test_evicts_least_recently_used(self):
+        vertex = CountingVertex(100)
+        cache = ResourceEstimateCache(max_size=2)
+        cache.get_resources_used_by_atoms(vertex, Slice(0, 0))
+        cache.get_resources_used_by_atoms(vertex, Slice(1, 1))
+        cache.get_resources_used_by_atoms(vertex, Slice(0, 0))
+        cache.get_resources_used_by_atoms(vertex, Slice(2, 2))
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(vertex.n_estimates, 3)
+        cache.get_resources_used_by_atoms(vertex, Slice(0, 0))
+        self.assertEqual(vertex.n_estimates, 3)
+        cache.get_resources_used_by_atoms(vertex, Slice(1, 1))
+        self.assertEqual(vertex.n_estimates, 4)
+
+    def test_precompute(self):
+        vertices = [CountingVertex(100) for _ in range(3)]
+        slices = [Slice(i, i + 9) for i in range(0, 100, 10)]
+        cache = ResourceEstimateCache(n_workers=2)
+        cache.precompute((vertex, slices) for vertex in vertices)
+        self.assertEqual(len(cache), 30)
+        for vertex in vertices:
+            self.assertEqual(vertex.n_estimates, 10)
+            for vertex_slice in slices:
+                resources = cache.get_resources_used_by_atoms(
+                    vertex, vertex_slice)
+                self.assertEqual(resources.dtcm.get_value(), 10)
+            self.assertEqual(vertex.n_estimates, 10)
+
+    def test_precompute_serial(self):
+        vertex = CountingVertex(100)
+        cache = ResourceEstimateCache()
+        cache.precompute([(vertex, [Slice(0, 9)])])
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(vertex.n_estimates, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
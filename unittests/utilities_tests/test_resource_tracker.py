@@ -123,6 +123,44 @@ class TestResourceTracker(unittest.TestCase):
             resource_tracker.allocate_resources(
                 ResourceContainer(sdram=ConstantSDRAM(1024)))
 
+    def test_allocate_skips_chips_without_sdram(self):
+        machine = virtual_machine(width=2, height=2)
+        chip_sdram = machine.get_chip_at(0, 0).sdram.size
+        tracker = ResourceTracker(machine, plan_n_timesteps=None)
+        big = ResourceContainer(sdram=ConstantSDRAM(chip_sdram // 2 + 1))
+        small = ResourceContainer(sdram=ConstantSDRAM(1024))
+        first = tracker.allocate_resources(big)
+        second = tracker.allocate_resources(big)
+        self.assertNotEqual(first[:2], second[:2])
+
+        # The small one still fits on the first chip
+        self.assertEqual(tracker.allocate_resources(small)[:2], first[:2])
+
+        # Once the big one is gone, another big one fits there again
+        tracker.unallocate_resources(
+            first[0], first[1], first[2], big, None, None)
+        self.assertEqual(tracker.allocate_resources(big)[:2], first[:2])
+
+    def test_allocate_chip_made_available_again(self):
+        machine = virtual_machine(width=2, height=2)
+        tracker = ResourceTracker(machine, plan_n_timesteps=None)
+        resources = ResourceContainer(sdram=ConstantSDRAM(1024))
+        n_cores = machine.get_chip_at(0, 0).n_user_processors
+        allocations = [tracker.allocate_resources(resources)
+                       for _ in range(n_cores)]
+        self.assertEqual({a[:2] for a in allocations}, {(0, 0)})
+        self.assertFalse(tracker.is_chip_available(0, 0))
+        self.assertNotEqual(
+            tracker.allocate_resources(resources)[:2], (0, 0))
+
+        # A freed chip goes to the end of the order of chips
+        x, y, p, _, _ = allocations[0]
+        tracker.unallocate_resources(x, y, p, resources, None, None)
+        self.assertTrue(tracker.is_chip_available(0, 0))
+        board_address = machine.get_chip_at(0, 0).ip_address
+        self.assertEqual(tracker.allocate_resources(
+            resources, board_address=board_address)[:2], (0, 0))
+
 
 if __name__ == '__main__':
     unittest.main()